@@ -0,0 +1,53 @@
+from time import perf_counter
+
+import pandas as pd
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew
+from ..calculations import accessors  # registers .cal
+
+days = pd.Series(pd.date_range("1900-01-01", periods=1_000_000, freq="D"))
+sample = days[::20]  # `.apply` is timed on fewer rows
+
+
+def rows_per_second(function, rows: int) -> float:
+    start = perf_counter()
+    function()
+    return rows / (perf_counter() - start)
+
+
+def apply_year_month_day(calendar):
+    def convert(timestamp):
+        date = calendar.from_datetime(timestamp.date())
+        return date.year, date.month, date.day
+
+    return sample.apply(convert)
+
+
+def apply_month_name(calendar):
+    return sample.apply(lambda timestamp: calendar.from_datetime(timestamp.date()).month_name)
+
+
+# === Series.apply against Series.cal ===
+
+print(
+    f"{'calendar':>10} {'apply':>12} {'cal.to':>12} {'apply name':>12} {'month_name':>12}  (rows/s)"
+)
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    name = calendar.__name__.lower()
+    applied = rows_per_second(lambda: apply_year_month_day(calendar), len(sample))
+    vectorized = rows_per_second(lambda: days.cal.to(name).to_frame(), len(days))
+    applied_name = rows_per_second(lambda: apply_month_name(calendar), len(sample))
+    categorical = rows_per_second(lambda: days.cal.to(name).month_name, len(days))
+    print(
+        f"{calendar.__name__:>10} {applied:>12,.0f} {vectorized:>12,.0f}"
+        f" {applied_name:>12,.0f} {categorical:>12,.0f}"
+    )
+
+
+# === Memory of the month names ===
+
+names = days.cal.to("hebrew").month_name
+as_strings = names.astype(object)
+print(f"\nmonth names of {len(days):,} rows")
+print(f"{'categorical':>12} {names.memory_usage(deep=True):>14,} bytes")
+print(f"{'strings':>12} {as_strings.memory_usage(deep=True):>14,} bytes")
@@ -0,0 +1,127 @@
+import tracemalloc
+from contextlib import contextmanager
+from math import floor
+from timeit import timeit
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic
+from ..calculations.base import _implementation, _set_implementation
+from ..calculations.constants import JANUARY, MARCH
+from ..calculations.gregorian import gregorian_leap_year, gregorian_year_from_fixed
+from ..calculations.julian import julian_leap_year
+
+
+def solar_date_from_fixed(year_from_fixed, leap_year):
+    """Previous Gregorian & Julian decomposition: month starts taken from temporary dates"""
+
+    def _date_from_fixed(self) -> None:
+        calendar, fixed_date = type(self), self.rata_die
+        year = year_from_fixed(fixed_date)
+        prior_days = fixed_date - calendar().from_date(year, JANUARY, 1).fixed
+
+        if fixed_date < calendar().from_date(year, MARCH, 1).fixed:
+            correction = 0
+        elif leap_year(year):
+            correction = 1
+        else:
+            correction = 2
+
+        month = floor((12 * (prior_days + correction) + 373) / 367)
+        day = fixed_date - calendar().from_date(year, month, 1).fixed + 1
+        self._set_date(year, month, day)
+
+    return _date_from_fixed
+
+
+def thirty_day_date_from_fixed(self) -> None:
+    """Previous Coptic & Ethiopic decomposition: month starts taken from temporary dates"""
+    calendar, fixed_date = type(self), self.rata_die
+    year = floor((4 * (fixed_date - calendar.epoch) + 1463) / 1461)
+    month = floor((fixed_date - calendar().from_date(year, 1, 1).fixed) / 30) + 1
+    day = fixed_date + 1 - calendar().from_date(year, month, 1).fixed
+    self._set_date(year, month, day)
+
+
+def julian_year_from_fixed(fixed_date: int) -> int:
+    approx = floor((4 * (fixed_date - Julian.epoch) + 1464) / 1461)
+    return approx if approx > 0 else approx - 1  # no year 0
+
+
+PREVIOUS = {
+    Gregorian: solar_date_from_fixed(gregorian_year_from_fixed, gregorian_leap_year),
+    Julian: solar_date_from_fixed(julian_year_from_fixed, julian_leap_year),
+    Coptic: thirty_day_date_from_fixed,
+    Ethiopic: thirty_day_date_from_fixed,
+}
+
+
+@contextmanager
+def previous_decomposition(calendar):
+    """Decompose dates the previous way within the block"""
+    current = _implementation(calendar, "_date_from_fixed")
+    _set_implementation(calendar, "_date_from_fixed", PREVIOUS[calendar])
+    try:
+        yield
+    finally:
+        _set_implementation(calendar, "_date_from_fixed", current)
+
+
+def count_constructions(calendar, fixed_dates) -> float:
+    """Average number of calendar objects created per from_fixed call"""
+
+    original = calendar.__init__
+    count = 0
+
+    def counting_init(self, *args, **kwargs):
+        nonlocal count
+        count += 1
+        original(self, *args, **kwargs)
+
+    calendar.__init__ = counting_init
+    try:
+        for fixed_date in fixed_dates:
+            calendar().from_fixed(fixed_date).year
+    finally:
+        calendar.__init__ = original
+
+    return count / len(fixed_dates)
+
+
+def allocated_bytes(calendar, fixed_date) -> int:
+    """Peak memory traced while converting a single fixed-date"""
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    calendar().from_fixed(fixed_date).year
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def measure(calendar):
+    """Objects per call, peak bytes & µs per call of the calendar's current decomposition"""
+    runs = 20000
+    per_call = timeit(lambda: calendar().from_fixed(738040).year, number=runs) / runs * 1e6
+    return count_constructions(calendar, fixed_dates), allocated_bytes(calendar, 738040), per_call
+
+
+fixed_dates = list(range(-1000000, 2000000, 9973))
+
+print(
+    f"{'calendar':>10} {'objects/call':>14} {'peak bytes':>16} {'µs/call':>16} {'speedup':>8}"
+    f"\n{'':>10} {'before  after':>14} {'before  after':>16} {'before  after':>16}"
+)
+for calendar in (Gregorian, Julian, Coptic, Ethiopic):
+    with previous_decomposition(calendar):
+        expected = [tuple(calendar().from_fixed(fixed_date)) for fixed_date in fixed_dates]
+        before = measure(calendar)
+    converted = [tuple(calendar().from_fixed(fixed_date)) for fixed_date in fixed_dates]
+    assert converted == expected, f"❌ {calendar.__name__} differs from the previous decomposition"
+    after = measure(calendar)
+
+    (objects_before, peak_before, time_before), (objects, peak, time) = before, after
+    print(
+        f"{calendar.__name__:>10} {objects_before:>7.2f}{objects:>7.2f}"
+        f" {peak_before:>9}{peak:>7} {time_before:>9.2f}{time:>7.2f} {time_before / time:>7.1f}x"
+    )
+
+    assert objects == 1, f"❌ {calendar.__name__} builds {objects} objects per conversion"
@@ -0,0 +1,75 @@
+from time import perf_counter
+
+import numpy as np
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew, DateFormatException
+from ..calculations.batch import (
+    batch_from_datetime64,
+    batch_from_fixed,
+    batch_fixed_from_date,
+    datetime64_from_fixed_array,
+    validate_dates_array,
+)
+
+fixed_dates = np.arange(500000, 1500000, dtype=np.int64)  # ~2,700 years, one million days
+sample = fixed_dates[::100]
+
+print(f"{'calendar':>10} {'loop (dates/s)':>16} {'batch (dates/s)':>16} {'to fixed (dates/s)':>19}")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    start = perf_counter()
+    for fixed_date in sample.tolist():
+        calendar().from_fixed(fixed_date).year
+    loop = len(sample) / (perf_counter() - start)
+
+    start = perf_counter()
+    years, months, days = batch_from_fixed(calendar, fixed_dates)
+    batch = len(fixed_dates) / (perf_counter() - start)
+
+    start = perf_counter()
+    batch_fixed_from_date(calendar, years, months, days)
+    reverse = len(fixed_dates) / (perf_counter() - start)
+
+    print(f"{calendar.__name__:>10} {loop:>16,.0f} {batch:>16,.0f} {reverse:>19,.0f}")
+
+
+# === Validation of dirty data, one row in ten invalid ===
+
+print(f"\n{'calendar':>10} {'from_date (rows/s)':>19} {'validate (rows/s)':>18}")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    years, months, days = batch_from_fixed(calendar, fixed_dates)
+    days[::10] += 31  # past the end of every month
+    rows = list(zip(years[::100].tolist(), months[::100].tolist(), days[::100].tolist()))
+
+    start = perf_counter()
+    for y, m, d in rows:
+        try:
+            calendar().from_date(y, m, d)
+        except DateFormatException:
+            pass
+    loop = len(rows) / (perf_counter() - start)
+
+    start = perf_counter()
+    valid, reasons = validate_dates_array(calendar, years, months, days)
+    batch_fixed_from_date(calendar, years[valid], months[valid], days[valid])
+    batch = len(years) / (perf_counter() - start)
+
+    print(f"{calendar.__name__:>10} {loop:>19,.0f} {batch:>18,.0f}")
+
+
+# === datetime64 ===
+
+moments = datetime64_from_fixed_array(fixed_dates)
+python_dates = moments[::100].astype(object).tolist()
+
+print(f"\n{'calendar':>10} {'from_datetime (dates/s)':>24} {'datetime64 (dates/s)':>21}")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    start = perf_counter()
+    for value in python_dates:
+        calendar.from_datetime(value).year
+    loop = len(python_dates) / (perf_counter() - start)
+
+    start = perf_counter()
+    batch_from_datetime64(calendar, moments)
+    batch = len(moments) / (perf_counter() - start)
+
+    print(f"{calendar.__name__:>10} {loop:>24,.0f} {batch:>21,.0f}")
@@ -0,0 +1,52 @@
+from time import perf_counter
+
+from ..calculations import *
+from ..calculations.conversion import _SHORTCUTS
+
+pairs = [
+    (Julian, Gregorian),
+    (Gregorian, Julian),
+    (Coptic, Ethiopic),
+    (Ethiopic, Coptic),
+    (Gregorian, Hebrew),
+]
+fixed_dates = range(730000, 750000)
+
+
+def sources(calendar, decomposed: bool) -> list:
+    """Fresh dates for every run, decomposing is cached by the date"""
+    dates = [calendar().from_fixed(fixed_date) for fixed_date in fixed_dates]
+    if decomposed:
+        for date in dates:
+            date.year
+    return dates
+
+
+def microseconds(function, dates: list) -> float:
+    """Per date, until the converted year, month & day are known"""
+    start = perf_counter()
+    for date in dates:
+        function(date).day
+    return (perf_counter() - start) / len(dates) * 1e6
+
+
+# Every path is timed on the same dates, built lazily by from_fixed or already decomposed
+print(
+    f"{'conversion':>22} {'source':>11} {'path':>18}"
+    f" {'from_fixed (µs)':>16} {'shortcut (µs)':>14} {'convert (µs)':>13}"
+)
+for source, target in pairs:
+    name = f"{source.__name__} -> {target.__name__}"
+    shortcut = _SHORTCUTS.get((source, target), (None, None))[1]
+    for decomposed in (False, True):
+        via_fixed = microseconds(
+            lambda d: target().from_fixed(d.fixed), sources(source, decomposed)
+        )
+        direct = microseconds(shortcut, sources(source, decomposed)) if shortcut else float("nan")
+        chosen = microseconds(lambda d: convert(d, target), sources(source, decomposed))
+        path = conversion_path(sources(source, decomposed)[0], target)
+        state = "decomposed" if decomposed else "lazy"
+        print(
+            f"{name:>22} {state:>11} {path:>18}"
+            f" {via_fixed:>16.2f} {direct:>14.2f} {chosen:>13.2f}"
+        )
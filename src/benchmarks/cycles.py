@@ -0,0 +1,39 @@
+from time import perf_counter
+
+import numpy as np
+
+from ..calculations import *
+from ..calculations.batch import batch_from_fixed
+from ..calculations.cycles import *
+
+fixed_dates = list(range(-1000000, 3000000, 97))
+array = np.arange(-1000000, 3000000, dtype=np.int64)
+
+
+def dates_per_second(convert, count: int) -> float:
+    start = perf_counter()
+    convert()
+    return count / (perf_counter() - start)
+
+
+print(f"{'calendar':>10} {'arithmetic':>14} {'cycle':>14} {'speedup':>8}   (dates/s)")
+for calendar in CALENDAR_CYCLES:
+    date_cycle(calendar)
+
+    convert = lambda: [calendar().from_fixed(fixed_date).year for fixed_date in fixed_dates]
+    arithmetic = dates_per_second(convert, len(fixed_dates))
+    use_cycle_engine(calendar)
+    try:
+        cycle = dates_per_second(convert, len(fixed_dates))
+    finally:
+        use_arithmetic_engine(calendar)
+    print(
+        f"{calendar.__name__:>10} {arithmetic:>14,.0f} {cycle:>14,.0f} {cycle / arithmetic:>7.1f}x"
+    )
+
+print(f"\n{'calendar':>10} {'batch':>14} {'cycle batch':>14} {'speedup':>8}   (dates/s)")
+for calendar in CALENDAR_CYCLES:
+    batch = dates_per_second(lambda: batch_from_fixed(calendar, array), len(array))
+    cycle = date_cycle(calendar)
+    looked_up = dates_per_second(lambda: cycle.year_month_day_array(array), len(array))
+    print(f"{calendar.__name__:>10} {batch:>14,.0f} {looked_up:>14,.0f} {looked_up / batch:>7.1f}x")
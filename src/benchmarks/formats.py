@@ -0,0 +1,68 @@
+from time import perf_counter
+from timeit import timeit
+
+import numpy as np
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew
+from ..calculations.cli import format_date, parse_date
+from ..calculations.formats import date_format
+
+fixed_dates = np.arange(500000, 800000, dtype=np.int64)
+sample = fixed_dates[::10]
+
+
+def rows_per_second(previous, compiled, rows: int, runs: int = 15) -> tuple:
+    """
+    Rows per second of the path replaced and of the compiled spec, best of alternated runs
+
+    Alternating keeps a busy machine from favouring either, the slower runs measure the machine
+    rather than the code.
+    """
+    best = [float("inf"), float("inf")]
+    for _ in range(runs):
+        for i, function in enumerate((previous, compiled)):
+            start = perf_counter()
+            function()
+            best[i] = min(best[i], perf_counter() - start)
+    return rows / best[0], rows / best[1]
+
+
+# === Formatting ===
+
+print(f"{'calendar':>10} {'pretty_display':>15} {'compiled':>12} {'fixed array':>12}  (rows/s)")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    dates = [calendar().from_fixed(fixed_date) for fixed_date in sample.tolist()]
+    for date in dates:
+        date.year  # decomposed up front, only the formatting is timed
+    spec = date_format(calendar, "%A %B %-d, %-Y")
+
+    properties, compiled = rows_per_second(
+        lambda: [d.pretty_display for d in dates], lambda: spec.format_many(dates), len(dates)
+    )
+    array = len(fixed_dates) / timeit(lambda: spec.format_fixed_array(fixed_dates), number=1)
+    print(f"{calendar.__name__:>10} {properties:>15,.0f} {compiled:>12,.0f} {array:>12,.0f}")
+    assert compiled > properties, f"❌ {calendar.__name__} slower than pretty_display"
+
+
+# === YYYY-MM-DD ===
+
+print(f"\n{'calendar':>10} {'cli format':>12} {'compiled':>12} {'cli parse':>12} {'compiled':>12}")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    dates = [calendar().from_fixed(fixed_date) for fixed_date in sample.tolist()]
+    spec = date_format(calendar, "%Y-%m-%d")
+    texts = spec.format_many(dates)
+
+    old_format, new_format = rows_per_second(
+        lambda: [format_date(d) for d in dates], lambda: spec.format_many(dates), len(dates)
+    )
+    old_parse, new_parse = rows_per_second(
+        lambda: [parse_date(t, calendar) for t in texts],
+        lambda: spec.parse_array(texts),
+        len(texts),
+    )
+    print(
+        f"{calendar.__name__:>10} {old_format:>12,.0f} {new_format:>12,.0f}"
+        f" {old_parse:>12,.0f} {new_parse:>12,.0f}"
+    )
+    assert new_format > old_format, f"❌ {calendar.__name__} slower than the cli's format_date"
+    assert new_parse > old_parse, f"❌ {calendar.__name__} slower than the cli's parse_date"
@@ -0,0 +1,109 @@
+from math import floor
+from timeit import timeit
+
+from ..calculations.hebrew import *
+from ..calculations.holidays import HEBREW_HOLIDAYS, iter_hebrew_holidays
+
+# === Previous Implementation ===
+# Verbatim from before the direct year resolution: floating point and without the cache
+
+
+def previous_hebrew_cal_elapsed_days(year: int) -> int:
+    months_elapsed = floor((235 * year - 234) / 19)
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + floor(parts_elapsed / 25920)
+    if ((3 * (days + 1)) % 7) < 3:
+        days += 1
+    return days
+
+
+def previous_hebrew_year_length_correction(year: int) -> int:
+    ny0 = previous_hebrew_cal_elapsed_days(year - 1)
+    ny1 = previous_hebrew_cal_elapsed_days(year)
+    ny2 = previous_hebrew_cal_elapsed_days(year + 1)
+
+    result = 0
+    if ny2 - ny1 == 356:
+        result = 2
+    elif ny1 - ny0 == 382:
+        result = 1
+
+    return result
+
+
+def previous_hebrew_new_year(year: int) -> int:
+    return (
+        rd(Epoch.Hebrew)
+        + previous_hebrew_cal_elapsed_days(year)
+        + previous_hebrew_year_length_correction(year)
+    )
+
+
+def linear_year_search(fixed_date: int) -> int:
+    """Previous year resolution: step forward one year at a time from `1 - approx`"""
+    approx = floor((98496 / 35975351) * (fixed_date - rd(Epoch.Hebrew))) + 1
+
+    y = 1 - approx
+    while True:
+        if previous_hebrew_new_year(y) <= fixed_date:
+            y += 1
+        else:
+            break
+    return y - 1
+
+
+# === Year Resolution ===
+
+fixed_dates = [  # Creation to the far future, RD 1 and the Unix epoch along the way
+    -1373427,
+    -1000000,
+    -500000,
+    1,
+    500000,
+    719163,
+    738040,
+    1000000,
+    2000000,
+]
+
+print(f"{'fixed-date':>12} {'year':>6} {'linear (µs)':>14} {'direct (µs)':>14} {'speedup':>10}")
+for fixed_date in fixed_dates:
+    year = hebrew_year_from_fixed(fixed_date)
+    assert year == linear_year_search(fixed_date), f"❌ {fixed_date}"
+
+    runs = 5
+    before = timeit(lambda: linear_year_search(fixed_date), number=runs) / runs * 1e6
+    runs = 2000
+    after = timeit(lambda: hebrew_year_from_fixed(fixed_date), number=runs) / runs * 1e6
+    print(f"{fixed_date:>12} {year:>6} {before:>14.2f} {after:>14.2f} {before / after:>9.0f}x")
+
+
+# === Full Conversion ===
+
+runs = 2000
+per_call = timeit(lambda: Hebrew().from_fixed(738040).year, number=runs) / runs * 1e6
+print(f"\nHebrew().from_fixed(738040): {per_call:.2f} µs per call")
+
+runs = 2000
+per_call = timeit(lambda: Hebrew().from_date(5782, NISAN, 15), number=runs) / runs * 1e6
+print(f"Hebrew().from_date(5782, NISAN, 15): {per_call:.2f} µs per call")
+
+
+# === Holidays ===
+
+
+def holidays_from_dates(first_year: int, last_year: int) -> list:
+    """One `from_date` per holiday, without the postponements"""
+    return [
+        (year, name, Hebrew().from_date(year, holiday.month, holiday.day).fixed)
+        for year in range(first_year, last_year + 1)
+        for name, holiday in HEBREW_HOLIDAYS.items()
+    ]
+
+
+HEBREW_CACHE.clear()
+runs = 3
+before = timeit(lambda: holidays_from_dates(5000, 6999), number=runs) / runs * 1e3
+HEBREW_CACHE.clear()
+after = timeit(lambda: list(iter_hebrew_holidays(5000, 6999)), number=runs) / runs * 1e3
+print(f"\nHolidays of 2000 years: from_date {before:.1f} ms, iter_hebrew_holidays {after:.1f} ms")
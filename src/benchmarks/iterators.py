@@ -0,0 +1,20 @@
+from time import perf_counter
+
+from ..calculations import *
+
+start = Gregorian().from_date(2000, 1, 1).fixed
+end = Gregorian().from_date(2030, 1, 1).fixed
+
+print(f"{'calendar':>10} {'from_fixed (days/s)':>20} {'iter_days (days/s)':>19} {'speedup':>8}")
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    begin = perf_counter()
+    for fixed_date in range(start, end):
+        calendar().from_fixed(fixed_date).year
+    naive = (end - start) / (perf_counter() - begin)
+
+    begin = perf_counter()
+    for _ in calendar.iter_days(start, end):
+        pass
+    stepped = (end - start) / (perf_counter() - begin)
+
+    print(f"{calendar.__name__:>10} {naive:>20,.0f} {stepped:>19,.0f} {stepped / naive:>7.1f}x")
@@ -0,0 +1,51 @@
+import tracemalloc
+from copy import copy
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew
+from ..calculations.constants import JULIAN_MONTH_LENGTHS
+
+
+class LegacyLayout:
+    """Previous per-instance layout: a __dict__ plus a private copy of the month lengths"""
+
+    def __init__(self, year: int, month: int, day: int, rata_die: int):
+        self.month_lengths = copy(list(JULIAN_MONTH_LENGTHS))
+        self._year = year
+        self._month = month - 1
+        self._day = day
+        self.rata_die = rata_die
+
+
+def traced_bytes_per_date(build, count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    dates = [build(fixed_date) for fixed_date in range(700000, 700000 + count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del dates
+    return (after - before) / count
+
+
+count = 100000
+
+
+def legacy_from_fixed(fixed_date: int) -> LegacyLayout:
+    date = Gregorian().from_fixed(fixed_date)
+    return LegacyLayout(date.year, date.month, date.day, fixed_date)
+
+
+legacy = traced_bytes_per_date(legacy_from_fixed, count)
+print(f"{'layout':>10} {'bytes/date':>12}")
+print(f"{'legacy':>10} {legacy:>12.1f}")
+
+
+def decomposed(calendar, fixed_date: int):
+    date = calendar().from_fixed(fixed_date)
+    date.year  # year/month/day are only filled in when first used
+    return date
+
+
+for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew):
+    slotted = traced_bytes_per_date(lambda fixed_date: decomposed(calendar, fixed_date), count)
+    print(f"{calendar.__name__:>10} {slotted:>12.1f}")
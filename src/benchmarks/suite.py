@@ -0,0 +1,506 @@
+"""
+Benchmark every calendar conversion path and track the results against a JSON baseline
+
+    ../calendrical-calculations $ python3 -m src.benchmarks.suite            # compare to baseline
+    ../calendrical-calculations $ python3 -m src.benchmarks.suite --save     # record a new one
+    ../calendrical-calculations $ python3 -m src.benchmarks.suite --filter hebrew
+
+Each benchmark reports nanoseconds per operation, the best of several repeats. The run fails
+(exit status 1) when a benchmark is slower than its baseline by more than the threshold, and the
+median of `CONFIRMATIONS` further runs still is. Import times are compared with their own, wider,
+threshold. Timings only compare on the same machine, record a baseline before changing the code.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import date
+from functools import lru_cache
+from math import ceil
+from statistics import median
+from timeit import Timer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..calculations import *
+from ..calculations.cycles import *
+from ..calculations.tables import DateTable, write_date_table
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+THRESHOLD = 0.25  # fraction slower than the baseline counted as a regression
+IMPORT_THRESHOLD = 0.5  # the same for import times, which vary with the file system's caches
+CONFIRMATIONS = 5  # runs whose median has to confirm a regression
+MINIMUM_RUN = 0.02  # seconds
+
+CALENDARS = (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+
+# Rata Die ranges, `datetime.date` only covers 0001-01-01 (RD 1) to 9999-12-31 (RD 3652059)
+RANGES: Dict[str, Tuple[int, int]] = {
+    "ancient": (-1100000, -1000000),  # around 3000 BCE
+    "classical": (-100000, 0),
+    "modern": (693596, 793596),  # 1900 to 2173
+    "far_future": (3552059, 3652059),  # up to 9999
+}
+
+Benchmark = Callable[[], Tuple[Callable[[], object], int]]  # returns the timed call & its ops
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+MEASUREMENTS: Dict[str, Callable[[], float]] = {}  # benchmarks timing themselves, in ns
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark, the function prepares the inputs and returns the timed call"""
+
+    def register(prepare: Benchmark) -> Benchmark:
+        if name in BENCHMARKS or name in MEASUREMENTS:
+            raise ValueError(f"Benchmark {name} is already registered")
+        BENCHMARKS[name] = prepare
+        return prepare
+
+    return register
+
+
+def measurement(name: str) -> Callable[[Callable[[], float]], Callable[[], float]]:
+    """Register a benchmark which cannot run in-process, the function returns nanoseconds"""
+
+    def register(measure: Callable[[], float]) -> Callable[[], float]:
+        if name in BENCHMARKS or name in MEASUREMENTS:
+            raise ValueError(f"Benchmark {name} is already registered")
+        MEASUREMENTS[name] = measure
+        return measure
+
+    return register
+
+
+def sample(name: str, count: int = 500) -> List[int]:
+    start, end = RANGES[name]
+    step = max((end - start) // count, 1)
+    return list(range(start, end, step))[:count]
+
+
+def _clear_caches() -> None:
+    HEBREW_CACHE.clear()
+
+
+# === Calendars ===
+
+
+def _register_calendar(calendar, range_name: str) -> None:
+    prefix = f"{calendar.__name__.lower()}.{{}}.{range_name}"
+    fixed_dates = sample(range_name)
+
+    @benchmark(prefix.format("from_fixed"))
+    def from_fixed():
+        return lambda: [calendar().from_fixed(fixed).year for fixed in fixed_dates], len(
+            fixed_dates
+        )
+
+    # Fields are calculated on first use, the day of the week does not need them
+    @benchmark(prefix.format("from_fixed_dow"))
+    def from_fixed_dow():
+        return lambda: [calendar().from_fixed(fixed).dow for fixed in fixed_dates], len(fixed_dates)
+
+    @benchmark(prefix.format("from_date"))
+    def from_date():
+        triples = [tuple(calendar().from_fixed(fixed)) for fixed in fixed_dates]
+        return lambda: [calendar().from_date(*triple) for triple in triples], len(triples)
+
+    @benchmark(prefix.format("pretty_display"))
+    def pretty_display():
+        dates = [calendar().from_fixed(fixed) for fixed in fixed_dates]
+        [d.year for d in dates]  # decomposed ahead of the timing
+        return lambda: [d.pretty_display for d in dates], len(dates)
+
+    # Through every other calendar and back again
+    @benchmark(prefix.format("round_trip"))
+    def round_trip():
+        dates = [calendar().from_fixed(fixed) for fixed in fixed_dates]
+        others = [other for other in CALENDARS if other is not calendar]
+
+        def run():
+            for d in dates:
+                for other in others:
+                    convert(convert(d, other), calendar).year
+
+        return run, len(dates) * len(others)
+
+
+for _calendar in CALENDARS:
+    for _range_name in RANGES:
+        _register_calendar(_calendar, _range_name)
+
+
+# === Standard Library Reference ===
+
+
+def _register_datetime(range_name: str) -> None:
+    fixed_dates = sample(range_name)
+    if fixed_dates[0] < 1 or fixed_dates[-1] > date.max.toordinal():
+        return  # outside of what datetime.date represents
+
+    @benchmark(f"datetime.toordinal.{range_name}")
+    def toordinal():
+        dates = [date.fromordinal(fixed) for fixed in fixed_dates]
+        return lambda: [d.toordinal() for d in dates], len(dates)
+
+    @benchmark(f"datetime.fromordinal.{range_name}")
+    def fromordinal():
+        return lambda: [date.fromordinal(fixed) for fixed in fixed_dates], len(fixed_dates)
+
+    # The Gregorian equivalents of the above, `fixed` is what toordinal computes
+    @benchmark(f"gregorian.fixed_from_date.{range_name}")
+    def fixed_from_date():
+        triples = [date.fromordinal(fixed).timetuple()[:3] for fixed in fixed_dates]
+        return lambda: [fixed_from_gregorian(*triple) for triple in triples], len(triples)
+
+
+for _range_name in RANGES:
+    _register_datetime(_range_name)
+
+
+# === Cycle Tables ===
+
+
+def _register_cycle(calendar, range_name: str) -> None:
+    fixed_dates = sample(range_name)
+
+    @benchmark(f"{calendar.__name__.lower()}.cycle_from_fixed.{range_name}")
+    def cycle_from_fixed():
+        date_cycle(calendar)  # built outside of the timing
+
+        def run():
+            use_cycle_engine(calendar)
+            try:
+                [calendar().from_fixed(fixed).year for fixed in fixed_dates]
+            finally:
+                use_arithmetic_engine(calendar)
+
+        return run, len(fixed_dates)
+
+
+for _calendar in CALENDAR_CYCLES:
+    for _range_name in RANGES:
+        _register_cycle(_calendar, _range_name)
+
+
+# === Precomputed Tables ===
+
+
+@lru_cache(maxsize=None)
+def _date_table() -> DateTable:
+    """Table of every range, written once to a temporary file removed at exit"""
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "dates.tbl")
+    atexit.register(shutil.rmtree, folder, ignore_errors=True)
+
+    start = min(start for start, _ in RANGES.values())
+    end = max(end for _, end in RANGES.values())
+    write_date_table(path, start, end)
+    return DateTable(path)
+
+
+def _register_table(calendar, range_name: str) -> None:
+    fixed_dates = sample(range_name)
+
+    @benchmark(f"{calendar.__name__.lower()}.table_from_fixed.{range_name}")
+    def table_from_fixed():
+        table = _date_table()
+        return lambda: [table.from_fixed(calendar, fixed) for fixed in fixed_dates], len(
+            fixed_dates
+        )
+
+
+for _calendar in CALENDARS:
+    for _range_name in RANGES:
+        _register_table(_calendar, _range_name)
+
+
+# === Import Time ===
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_PREFIX = "import."
+
+IMPORTS = {
+    "package": "import src.calculations",
+    "gregorian": "from src.calculations import Gregorian",
+    "hebrew": "from src.calculations import Hebrew",
+    "everything": "from src.calculations import *",
+}
+
+
+def _top_level_imports(code: str) -> Dict[str, int]:
+    """Cumulative microseconds of the outermost imports `python -X importtime` reports"""
+
+    command = [sys.executable, "-X", "importtime", "-c", code]
+    report = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True).stderr
+
+    imports = {}
+    for line in report.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header or output of the code
+        name = fields[2]
+        if not name.startswith("  "):  # nested imports are indented
+            imports[name.strip()] = int(fields[1])
+    return imports
+
+
+@lru_cache(maxsize=None)
+def _startup_imports() -> frozenset:
+    return frozenset(_top_level_imports("pass"))
+
+
+def _register_import(name: str, statement: str) -> None:
+    @measurement(f"{IMPORT_PREFIX}{name}")
+    def import_time() -> float:
+        imports = _top_level_imports(statement)
+        return 1000 * sum(us for module, us in imports.items() if module not in _startup_imports())
+
+
+for _name, _statement in IMPORTS.items():
+    _register_import(_name, _statement)
+
+
+# === Calibration ===
+
+CALIBRATION = "calibration.objects"
+
+
+class _Probe:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    @property
+    def weekday(self) -> int:
+        return self.value % 7
+
+
+@benchmark(CALIBRATION)
+def calibration():
+    """
+    How fast this machine runs code like the calendars right now
+
+    Slotted objects are built and read next to the integer arithmetic: a busy machine slows
+    allocations and calls more than arithmetic, so arithmetic alone under-corrects.
+    """
+    fixed_dates = sample("modern")
+
+    def run():
+        for fixed in fixed_dates:
+            n400, d1 = divmod(fixed, 146097)
+            n100, d2 = divmod(d1, 36524)
+            _Probe(fixed).weekday
+            400 * n400 + 100 * n100 + d2 // 365
+
+    return run, len(fixed_dates)
+
+
+# === Running ===
+
+
+def _repeat(name: str) -> Callable[[], float]:
+    """
+    One timed run of the benchmark, in nanoseconds per operation
+
+    Every pass over the inputs starts from empty caches and a run repeats the pass until it
+    takes at least `MINIMUM_RUN` seconds, shorter runs are dominated by timer noise.
+    """
+
+    if name in MEASUREMENTS:
+        return MEASUREMENTS[name]
+
+    call, operations = BENCHMARKS[name]()
+
+    def timed():
+        _clear_caches()
+        call()
+
+    timer = Timer(timed)
+    number = max(1, ceil(MINIMUM_RUN / timer.timeit(1)))
+    return lambda: timer.timeit(number) / number / operations * 1e9
+
+
+def run_benchmark(name: str, repeats: int = 7) -> float:
+    """Nanoseconds per operation, the best of `repeats` runs"""
+    run = _repeat(name)
+    return min(run() for _ in range(repeats))
+
+
+def run_calibrated(name: str, repeats: int = 7) -> Tuple[float, float]:
+    """
+    Nanoseconds per operation of the benchmark and of the calibration, the best of each
+
+    The machine's speed drifts over seconds (frequency scaling, the neighbours of a virtual
+    machine), so their repeats alternate to measure both under the same load.
+    """
+    run, calibrate = _repeat(name), _repeat(CALIBRATION)
+    times, calibrations = [], []
+    for _ in range(repeats):
+        calibrations.append(calibrate())
+        times.append(run())
+    return min(times), min(calibrations)
+
+
+def load_baseline(path: str = BASELINE) -> Dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(results: Dict[str, float], path: str = BASELINE) -> None:
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "unit": "ns/op",
+        "results": {name: round(value, 1) for name, value in sorted(results.items())},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def machine_speed(results: Dict[str, float], baseline: Dict[str, float]) -> float:
+    """How much slower this run's machine is than the baseline's, from the calibration"""
+    if CALIBRATION in results and CALIBRATION in baseline:
+        return results[CALIBRATION] / baseline[CALIBRATION]
+    return 1.0
+
+
+def change(name: str, value: float, baseline: Dict[str, float], speed: float) -> float:
+    """
+    Fraction slower than the baseline, negative when faster
+
+    Timings are scaled by the calibration so a busy or throttled machine does not register as a
+    regression of every benchmark. Import times are not: they are spent in the file system and
+    the interpreter's start-up rather than in the arithmetic the calibration follows.
+    """
+    if not name.startswith(IMPORT_PREFIX):
+        value /= speed
+    return value / baseline[name] - 1
+
+
+def regressions(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = THRESHOLD,
+    import_threshold: float = IMPORT_THRESHOLD,
+) -> List[str]:
+    """Benchmarks slower than their baseline by more than `threshold`, or `import_threshold`"""
+    speed = machine_speed(results, baseline)
+    return [
+        name
+        for name, value in results.items()
+        if name in baseline
+        and name != CALIBRATION
+        and change(name, value, baseline, speed)
+        > (import_threshold if name.startswith(IMPORT_PREFIX) else threshold)
+    ]
+
+
+def confirm(
+    results: Dict[str, float], names: List[str], runs: int, repeats: int
+) -> Dict[str, float]:
+    """
+    Median of each benchmark's result and `runs` more, a single run is easily disturbed
+
+    The benchmarks take turns so the runs of each are spread over a longer stretch of the
+    machine's load. Every run is rescaled from the speed of its own calibration to the one of
+    `results`, like the results of `main`, so the runs compare with the rest of the results.
+    """
+    values = {name: [results[name]] for name in names}
+    for _ in range(runs):
+        for name in names:
+            if name in MEASUREMENTS:
+                values[name].append(run_benchmark(name, repeats))
+            else:
+                value, calibration = run_calibrated(name, repeats)
+                values[name].append(value * results[CALIBRATION] / calibration)
+    return {name: median(runs) for name, runs in values.items()}
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python3 -m src.benchmarks.suite")
+    parser.add_argument("--baseline", default=BASELINE, help="JSON file of previous results")
+    parser.add_argument("--save", action="store_true", help="record the results as baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--import-threshold", type=float, default=IMPORT_THRESHOLD)
+    parser.add_argument("--confirmations", type=int, default=CONFIRMATIONS)
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this")
+    parser.add_argument("--repeats", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_arguments(argv)
+    names = [name for name in BENCHMARKS if args.filter in name and name != CALIBRATION]
+    names += [name for name in MEASUREMENTS if args.filter in name]
+    baseline = load_baseline(args.baseline)
+
+    results, calibrations = {}, {}
+    for name in names:
+        if name in MEASUREMENTS:
+            results[name] = run_benchmark(name, args.repeats)
+        else:
+            results[name], calibrations[name] = run_calibrated(name, args.repeats)
+    if calibrations:
+        results[CALIBRATION] = median(calibrations.values())
+    else:
+        results[CALIBRATION] = run_benchmark(CALIBRATION, args.repeats)
+
+    # Every benchmark is reported at the speed of the median calibration, from its own
+    for name, calibration in calibrations.items():
+        results[name] *= results[CALIBRATION] / calibration
+
+    speed = machine_speed(results, baseline)
+    print(f"Machine speed relative to the baseline: {1 / speed:.2f}")
+    print(f"{'benchmark':<40} {'baseline':>10} {'ns/op':>10} {'change':>8}")
+    for name in names:
+        value = results[name]
+        if name in baseline:
+            relative = f"{change(name, value, baseline, speed):+.0%}"
+            print(f"{name:<40} {baseline[name]:>10.1f} {value:>10.1f} {relative:>8}")
+        else:
+            print(f"{name:<40} {'-':>10} {value:>10.1f} {'new':>8}")
+
+    pairs = (("fixed_from_date", "toordinal"), ("from_fixed", "fromordinal"))
+    for range_name in RANGES:
+        for ours, theirs in pairs:
+            gregorian = results.get(f"gregorian.{ours}.{range_name}")
+            reference = results.get(f"datetime.{theirs}.{range_name}")
+            if gregorian and reference:
+                ratio = gregorian / reference
+                print(f"Gregorian {ours} vs date.{theirs} ({range_name}): {ratio:.1f}x slower")
+
+    if args.save:
+        # Recorded like regressions are confirmed, a lucky run would flag every later one
+        results.update(confirm(results, names, args.confirmations, args.repeats))
+        save_baseline({**baseline, **results}, args.baseline)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    thresholds = (args.threshold, args.import_threshold)
+    suspects = regressions(results, baseline, *thresholds)
+    results.update(confirm(results, suspects, args.confirmations, args.repeats))
+
+    slower = regressions(results, baseline, *thresholds)
+    for name in slower:
+        relative = change(name, results[name], baseline, speed)
+        print(
+            f"❌ {name} regressed by {relative:.0%}, median of {args.confirmations + 1} runs",
+            file=sys.stderr,
+        )
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
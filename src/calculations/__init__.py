@@ -1,7 +1,132 @@
-from .base import *
-from .constants import *
-from .coptic import *
-from .ethiopian import *
-from .gregorian import *
-from .hebrew import *
-from .julian import *
+"""
+Submodules are imported when one of their names is first used, so a process which only needs
+the Gregorian calendar does not load the others. `from .calculations import *` still provides
+every name.
+"""
+
+from importlib import import_module
+
+# Names defined by each submodule, everything else is looked up in `constants`
+_EXPORTS = {
+    "base": (
+        "Date",
+        "DateFormatException",
+        "count_kdays",
+        "day_of_week_from_fixed",
+        "hr",
+        "kday_after",
+        "kday_before",
+        "kday_nearest",
+        "kday_on_or_after",
+        "kday_on_or_before",
+        "nth_kday",
+        "rd",
+    ),
+    "cache": ("BoundedCache", "CacheInfo"),
+    "conversion": (
+        "COPTIC_ETHIOPIC",
+        "COPTIC_TO_ETHIOPIC_YEARS",
+        "FIXED",
+        "IDENTITY",
+        "JULIAN_GREGORIAN",
+        "conversion_path",
+        "convert",
+        "convert_many",
+        "convert_unique",
+        "julian_gregorian_offset",
+    ),
+    "coptic": ("Coptic", "coptic_leap_year", "coptic_leap_years_before", "fixed_from_coptic"),
+    "ethiopian": (
+        "Ethiopic",
+        "ethiopic_leap_year",
+        "ethiopic_leap_years_before",
+        "fixed_from_ethiopic",
+    ),
+    "formats": ("DateFormat", "ORDINAL_DAYS", "date_format", "strftime", "strptime"),
+    "gregorian": (
+        "Gregorian",
+        "fixed_from_gregorian",
+        "gregorian_leap_year",
+        "gregorian_leap_years_before",
+        "gregorian_year_from_fixed",
+    ),
+    "hebrew": (
+        "HEBREW_CACHE",
+        "HEBREW_YEAR_TYPES",
+        "Hebrew",
+        "HebrewYearType",
+        "days_in_hebrew_year",
+        "hebrew_cal_elapsed_days",
+        "hebrew_leap_year",
+        "hebrew_leap_years_before",
+        "hebrew_months_elapsed",
+        "hebrew_new_year",
+        "hebrew_sabbatical_year",
+        "hebrew_year_from_fixed",
+        "hebrew_year_length_correction",
+        "hebrew_year_type",
+        "last_day_of_hebrew_month",
+        "last_month_in_hebrew_year",
+        "molad",
+        "molad_in_halakim",
+    ),
+    "holidays": (
+        "HEBREW_HOLIDAYS",
+        "HEBREW_HOLIDAY_OFFSETS",
+        "HebrewHoliday",
+        "hebrew_holiday",
+        "hebrew_holidays",
+        "hebrew_sabbatical_years",
+        "iter_hebrew_holidays",
+    ),
+    "instrumentation": (
+        "INSTRUMENTED_FUNCTIONS",
+        "INSTRUMENTED_METHODS",
+        "CallStats",
+        "disable_instrumentation",
+        "enable_instrumentation",
+        "instrumentation_enabled",
+        "instrumentation_snapshot",
+        "instrumented",
+        "reset_instrumentation",
+    ),
+    "julian": ("Julian", "fixed_from_julian", "julian_leap_year", "julian_leap_years_before"),
+    "third_party": ("get_ordinal_indicator",),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+_SUBMODULES = (
+    *_EXPORTS,
+    "accessors",
+    "batch",
+    "cli",
+    "constants",
+    "cycles",
+    "tables",
+    "third_party",
+)
+
+
+def _constant_names() -> list:
+    constants = import_module(".constants", __name__)
+    return [name for name in vars(constants) if name.isupper() or name == "Epoch"]
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        value = sorted({*_MODULE_OF, *_constant_names()})
+    elif name in _MODULE_OF:
+        value = getattr(import_module(f".{_MODULE_OF[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    elif name in _constant_names():
+        value = getattr(import_module(".constants", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # found directly from now on
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *__getattr__("__all__"), *_SUBMODULES})
@@ -0,0 +1,278 @@
+"""
+pandas accessors which convert whole columns of dates through the array engine of `batch`
+
+Importing the module registers `.cal` on Series and DataFrames:
+
+    import src.calculations.accessors
+
+    s = pd.Series(pd.date_range("2024-01-01", periods=1_000_000))  # or fixed-dates, datetime.date
+    s.cal.year                      # Gregorian years, like s.dt.year
+    s.cal.to("hebrew").month_name   # categorical, with Adar I & Adar II in leap years
+    s.cal.to("julian").to_frame()   # year, month & day columns
+    s.cal.to(Coptic).format("%-d %B %Y")
+
+    frame.cal.fixed("hebrew")       # fixed-dates of the year, month & day columns
+
+A Series is read as datetime64 (times of the day are dropped, time zones keep their local day),
+as Rata Die fixed-dates when it holds numbers, or as `datetime.date` objects. Missing values stay
+missing: integer results become nullable Int64 and names NaN.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from .base import Date, DateFormatException
+from .batch import (
+    _MONTH_LENGTHS,
+    DateArrays,
+    INVALID_REASONS,
+    _as_fixed,
+    _as_int,
+    batch_fixed_from_date,
+    batch_from_fixed,
+    datetime64_from_fixed_array,
+    day_of_week_from_fixed_array,
+    fixed_from_datetime64_array,
+    fixed_from_dates_array,
+    hebrew_leap_year_array,
+    validate_dates_array,
+)
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .formats import date_format
+from .gregorian import Gregorian
+from .hebrew import Hebrew
+from .julian import Julian
+
+CALENDARS: Dict[str, Type[Date]] = {
+    calendar.__name__.lower(): calendar
+    for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+}
+
+_LEAP_YEAR = {calendar: leap_year for calendar, (leap_year, _) in _MONTH_LENGTHS.items()}
+_LEAP_YEAR[Hebrew] = hebrew_leap_year_array
+
+Calendar = Union[str, Type[Date]]
+
+
+def calendar_class(calendar: Calendar) -> Type[Date]:
+    """The calendar class of a name of `CALENDARS`, classes are returned as they are"""
+    if isinstance(calendar, str):
+        if calendar.lower() not in CALENDARS:
+            raise KeyError(f"Unknown calendar {calendar!r}, one of {', '.join(CALENDARS)}")
+        return CALENDARS[calendar.lower()]
+    if calendar not in _LEAP_YEAR:
+        raise TypeError(f"No batch conversion for {calendar.__name__}")
+    return calendar
+
+
+@lru_cache(maxsize=None)
+def _month_categories(calendar: Type[Date]) -> Tuple[List[str], np.ndarray]:
+    """
+    Month names of the calendar and the category of each month, indexed by [leap, month - 1]
+
+    Only differs between common & leap years where `_month_name` does, Adar I in Hebrew.
+    """
+
+    years = np.arange(1, 20)
+    leap = _LEAP_YEAR[calendar](years)
+    sample_years = (int(years[~leap][0]), int(years[leap][0]))
+
+    names: Dict[str, int] = {}
+    codes = np.zeros((2, len(calendar.month_names)), dtype=np.int64)
+    for month in range(1, len(calendar.month_names) + 1):
+        for is_leap, year in enumerate(sample_years):
+            name = calendar._month_name(year, month)
+            codes[is_leap, month - 1] = names.setdefault(name, len(names))
+    return list(names), codes
+
+
+def _fixed_from_series(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Fixed-dates of the values and the mask of the missing ones, whose fixed-date is 0"""
+
+    missing = series.isna().to_numpy()
+    present = series[~missing] if missing.any() else series
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        present = present.dt.tz_localize(None)  # the day on the local clock
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values = fixed_from_datetime64_array(present.to_numpy())
+    elif pd.api.types.is_bool_dtype(dtype):
+        raise TypeError(f"{dtype} values are not dates")
+    elif pd.api.types.is_float_dtype(dtype):
+        values = _as_fixed(present.to_numpy(dtype=np.float64))
+    elif pd.api.types.is_integer_dtype(dtype):
+        values = present.to_numpy(dtype=np.int64)
+    elif dtype == object:
+        values = fixed_from_dates_array(present.to_numpy())
+    else:
+        raise TypeError(f"{dtype} values are not dates")
+
+    fixed = np.zeros(len(series), dtype=np.int64)
+    fixed[~missing] = values
+    return fixed, missing
+
+
+class CalendarView:
+    """
+    The dates of a Series in one calendar, returned by `Series.cal.to`
+
+    The dates are decomposed in bulk the first time a year, month or day is asked for.
+    """
+
+    def __init__(
+        self, series: pd.Series, calendar: Type[Date], fixed: np.ndarray, missing: np.ndarray
+    ):
+        self.calendar = calendar
+        self._series = series
+        self._fixed = fixed
+        self._missing = missing
+        self._parts: Optional[DateArrays] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.calendar.__name__} view of {len(self._fixed)} dates>"
+
+    def to(self, calendar: Calendar) -> "CalendarView":
+        """The same dates in another calendar, by name (`"hebrew"`) or class"""
+        return CalendarView(self._series, calendar_class(calendar), self._fixed, self._missing)
+
+    # === Results ===
+
+    def _result(self, values) -> pd.Series:
+        return pd.Series(values, index=self._series.index, name=self._series.name)
+
+    def _integers(self, values: np.ndarray) -> pd.Series:
+        if self._missing.any():
+            values = pd.arrays.IntegerArray(values, self._missing.copy())
+        return self._result(values)
+
+    def _categories(self, codes: np.ndarray, names: List[str]) -> pd.Series:
+        codes = np.where(self._missing, -1, codes)
+        return self._result(pd.Categorical.from_codes(codes, categories=names))
+
+    # === Fields ===
+
+    @property
+    def parts(self) -> DateArrays:
+        """Year, month & day arrays, missing dates are RD 0"""
+        if self._parts is None:
+            self._parts = batch_from_fixed(self.calendar, self._fixed)
+        return self._parts
+
+    @property
+    def fixed(self) -> pd.Series:
+        return self._integers(self._fixed)
+
+    @property
+    def year(self) -> pd.Series:
+        return self._integers(self.parts[0])
+
+    @property
+    def month(self) -> pd.Series:
+        return self._integers(self.parts[1])
+
+    @property
+    def day(self) -> pd.Series:
+        return self._integers(self.parts[2])
+
+    @property
+    def day_of_week(self) -> pd.Series:
+        """Weekday numbers with Sunday as 0"""
+        return self._integers(day_of_week_from_fixed_array(self._fixed))
+
+    @property
+    def month_name(self) -> pd.Series:
+        """Categorical of the calendar's month names, in the order of the month numbers"""
+        years, months, _ = self.parts
+        names, codes = _month_categories(self.calendar)
+        leap = _LEAP_YEAR[self.calendar](years).astype(np.int64)
+        return self._categories(codes[leap, months - 1], names)
+
+    @property
+    def day_name(self) -> pd.Series:
+        """Categorical of the calendar's weekday names, Sunday first"""
+        weekdays = day_of_week_from_fixed_array(self._fixed)
+        return self._categories(weekdays, list(self.calendar.day_names))
+
+    @property
+    def datetime64(self) -> pd.Series:
+        values = datetime64_from_fixed_array(self._fixed).astype("datetime64[s]")
+        values[self._missing] = np.datetime64("NaT")
+        return self._result(values)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Year, month & day columns"""
+        return pd.DataFrame(
+            {"year": self.year, "month": self.month, "day": self.day}, index=self._series.index
+        )
+
+    def format(self, spec: str) -> pd.Series:
+        """The dates formatted with a `formats` spec, missing dates stay missing"""
+        texts = date_format(self.calendar, spec).format_fixed_array(self._fixed)
+        if self._missing.any():
+            texts = [None if missing else text for text, missing in zip(texts, self._missing)]
+        return self._result(np.array(texts, dtype=object))
+
+
+@pd.api.extensions.register_series_accessor("cal")
+class CalendarAccessor(CalendarView):
+    """`Series.cal`, the dates in the Gregorian calendar until converted with `to`"""
+
+    def __init__(self, series: pd.Series):
+        super().__init__(series, Gregorian, *_fixed_from_series(series))
+
+
+@pd.api.extensions.register_dataframe_accessor("cal")
+class CalendarFrameAccessor:
+    """`DataFrame.cal`, for frames holding dates as year, month & day columns"""
+
+    def __init__(self, frame: pd.DataFrame):
+        self._frame = frame
+
+    def fixed(
+        self,
+        calendar: Calendar,
+        year: str = "year",
+        month: str = "month",
+        day: str = "day",
+        errors: str = "raise",
+    ) -> pd.Series:
+        """
+        Fixed-dates of the year, month & day columns, which are dates in `calendar`
+
+        Rows missing any part are missing. Rows which are not dates raise a DateFormatException,
+        or are missing too when `errors` is "coerce".
+        """
+
+        if errors not in ("raise", "coerce"):
+            raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+        calendar = calendar_class(calendar)
+
+        columns = [self._frame[name] for name in (year, month, day)]
+        missing = np.logical_or.reduce([column.isna().to_numpy() for column in columns])
+        years, months, days = (_as_int(column.to_numpy(na_value=1)) for column in columns)
+
+        valid, reasons = validate_dates_array(calendar, years, months, days)
+        invalid = ~valid & ~missing
+        if invalid.any():
+            if errors == "raise":
+                row = np.flatnonzero(invalid)[0]
+                raise DateFormatException(
+                    f"{years[row]}-{months[row]:02}-{days[row]:02} at {self._frame.index[row]!r}"
+                    f" is not a {calendar.__name__} date, {INVALID_REASONS[reasons[row]]}"
+                )
+            missing = missing | invalid
+
+        years, months, days = (np.where(missing, 1, values) for values in (years, months, days))
+        fixed = batch_fixed_from_date(calendar, years, months, days)
+        if missing.any():
+            fixed = pd.arrays.IntegerArray(fixed, missing)
+        return pd.Series(fixed, index=self._frame.index, name="fixed")
+
+    def to(self, target: Calendar, source: Calendar, **columns) -> pd.DataFrame:
+        """Year, month & day columns of `source` dates converted to `target`, see `fixed`"""
+        return self.fixed(source, **columns).cal.to(target).to_frame()
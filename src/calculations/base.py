@@ -1,8 +1,9 @@
+import datetime
 from abc import ABC
 from math import floor
-from typing import Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from .constants import SUNDAY
+from .constants import SUNDAY, Epoch
 
 
 class DateFormatException(Exception):
@@ -10,13 +11,66 @@ class DateFormatException(Exception):
 
 
 class Date(ABC):
+    """
+    Immutable date, the year/month/day and fixed-date are set once by the from_* constructors
+
+    Month lengths are derived from shared read-only tables rather than copied per instance.
+    """
+
+    __slots__ = ("_year", "_month", "_day", "rata_die")
+
+    first_month: int = 1  # Month in which the year number changes
+    eras: Tuple[str, str] = ("", "")  # Suffixes of the years from 1 and of the years before 1
+    month_names: List[str]
+    day_names: List[str]
+
     _year: int
     _month: int
     _day: int
     rata_die: int
 
-    def __init__(self, year: int, month: int, day: int):
-        raise NotImplementedError()
+    def __init__(self):
+        _set = object.__setattr__
+        _set(self, "_year", None)
+        _set(self, "_month", None)
+        _set(self, "_day", None)
+        _set(self, "rata_die", None)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} dates are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} dates are immutable")
+
+    def __reduce__(self):
+        return (_restore_date, (type(self), self._year, self._month, self._day, self.rata_die))
+
+    @classmethod
+    def _from_parts(cls, year: int, month: int, day: int, fixed_date: Union[int, float]) -> "Date":
+        """Build a date from already known, valid, parts without any conversion"""
+        date = object.__new__(cls)
+        _set = object.__setattr__
+        _set(date, "_year", year)
+        _set(date, "_month", month - 1)
+        _set(date, "_day", day)
+        _set(date, "rata_die", fixed_date)
+        return date
+
+    def _assert_blank(self) -> None:
+        """The from_* constructors may only fill in a freshly created date"""
+        if self.rata_die is not None:
+            raise AttributeError(
+                f"{type(self).__name__} dates are immutable, create a new one instead"
+            )
+
+    def _set_date(self, year: int, month: int, day: int) -> None:
+        _set = object.__setattr__
+        _set(self, "_year", year)
+        _set(self, "_month", month - 1)
+        _set(self, "_day", day)
+
+    def _set_fixed(self, fixed_date: Union[int, float]) -> None:
+        object.__setattr__(self, "rata_die", fixed_date)
 
     def __getitem__(self, key: int) -> int:
         if key not in range(-3, 3):
@@ -30,10 +84,18 @@ class Date(ABC):
         return self.fixed <= other.fixed
 
     def __eq__(self, other: "Date") -> bool:
-        return self.fixed == self.fixed
+        """Same calendar and same fixed-date, use `.fixed` to compare across calendars"""
+        if not isinstance(other, Date):
+            return NotImplemented
+        return type(self) is type(other) and self.fixed == other.fixed
 
     def __ne__(self, other: "Date") -> bool:
-        return self.fixed != other.fixed
+        if not isinstance(other, Date):
+            return NotImplemented
+        return type(self) is not type(other) or self.fixed != other.fixed
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.fixed))
 
     def __gt__(self, other: "Date") -> bool:
         return self.fixed > other.fixed
@@ -44,37 +106,360 @@ class Date(ABC):
     def __int__(self):
         return self.rata_die
 
+    def __floor__(self) -> int:
+        return floor(self.rata_die)
+
     def is_leapyear(self) -> bool:
         raise NotImplementedError()
 
+    def _decompose(self) -> None:
+        """
+        Calculate YYYY-MM-DD of a date created from a fixed-date
+
+        Deferred until the fields are first used, ordering, arithmetic and the day of the week
+        only need the fixed-date.
+        """
+        if self.rata_die is not None:
+            self._date_from_fixed()
+
     @property
     def year(self) -> int:
+        if self._year is None:
+            self._decompose()
         return self._year
 
-    @year.setter
-    def year(self, y: int):
-        self._year = y
-
     @property
     def month(self) -> int:
+        if self._month is None:
+            self._decompose()
         return self._month + 1
 
-    @month.setter
-    def month(self, m: int):
-        self._month = m - 1
-
     @property
     def day(self) -> int:
+        if self._day is None:
+            self._decompose()
         return self._day
 
-    @day.setter
-    def day(self, d: int):
-        self._day = d
-
     @property
     def fixed(self):
         raise NotImplementedError()
 
+    # === Calendar Structure ===
+
+    @classmethod
+    def days_in_month(cls, year: int, month: int) -> int:
+        raise NotImplementedError()
+
+    @classmethod
+    def days_in_year(cls, year: int) -> int:
+        raise NotImplementedError()
+
+    @classmethod
+    def months_in_year(cls, year: int) -> int:
+        raise NotImplementedError()
+
+    @classmethod
+    def leap_years_before(cls, year: int) -> int:
+        """Leap years from year 1 up to `year`, negative below year 1, so differences count ranges"""
+        raise NotImplementedError()
+
+    @classmethod
+    def _month_name(cls, year: int, month: int) -> str:
+        return cls.month_names[month - 1]
+
+    @classmethod
+    def _next_year(cls, year: int) -> int:
+        return year + 1
+
+    @classmethod
+    def _next_month(cls, year: int, month: int) -> Tuple[int, int]:
+        if month < cls.months_in_year(year):
+            return year, month + 1
+        return cls._next_year(year), 1
+
+    # === Days of the Week ===
+
+    def kday_on_or_before(self, k: int) -> "Date":
+        """The k-day (SUNDAY...SATURDAY) on or before this date, in the same calendar"""
+        return type(self)().from_fixed(kday_on_or_before(k, self.fixed))
+
+    def kday_on_or_after(self, k: int) -> "Date":
+        return type(self)().from_fixed(kday_on_or_after(k, self.fixed))
+
+    def kday_nearest(self, k: int) -> "Date":
+        return type(self)().from_fixed(kday_nearest(k, self.fixed))
+
+    def kday_before(self, k: int) -> "Date":
+        return type(self)().from_fixed(kday_before(k, self.fixed))
+
+    def kday_after(self, k: int) -> "Date":
+        return type(self)().from_fixed(kday_after(k, self.fixed))
+
+    def nth_kday(self, n: int, k: int) -> "Date":
+        return type(self)().from_fixed(nth_kday(n, k, self.fixed))
+
+    @classmethod
+    def nth_kday_of_month(cls, n: int, k: int, year: int, month: int) -> "Date":
+        """
+        The n-th k-day of the month, counted from the end of the month when n is negative
+
+            Gregorian.nth_kday_of_month(4, THURSDAY, 2024, NOVEMBER)  # Thanksgiving
+            Gregorian.nth_kday_of_month(-1, MONDAY, 2024, MAY)  # Memorial Day
+        """
+        first = cls().from_date(year, month, 1).fixed
+        if n < 0:
+            first += cls.days_in_month(year, month) - 1
+        return cls().from_fixed(nth_kday(n, k, first))
+
+    # === Calendar Units ===
+
+    @classmethod
+    def _year_number(cls, year: int) -> int:
+        """Years counted without gaps, for calendars skipping a year 0"""
+        return year
+
+    @classmethod
+    def _year_from_number(cls, number: int) -> int:
+        return number
+
+    @classmethod
+    def _month_number(cls, year: int, month: int) -> int:
+        """Months since the first month of year 0, counting on across years"""
+        return cls._year_number(year) * cls.months_in_year(year) + month - 1
+
+    @classmethod
+    def _month_from_number(cls, number: int) -> Tuple[int, int]:
+        months_in_year = cls.months_in_year(1)
+        year_number, month = divmod(number, months_in_year)
+        return cls._year_from_number(year_number), month + 1
+
+    @classmethod
+    def _same_month(cls, year: int, month: int, other_year: int) -> int:
+        """The month of `other_year` corresponding to the month of `year`"""
+        return month
+
+    def _with_clamped_day(self, year: int, month: int) -> "Date":
+        """This day of the month in another month, the month's last day when it is shorter"""
+        return type(self)().from_date(year, month, min(self.day, self.days_in_month(year, month)))
+
+    def add_months(self, n: int) -> "Date":
+        """
+        The same day `n` months later (earlier when negative)
+
+        Days past the end of the new month are clamped to its last day, January 31 plus one
+        month is February 28 or 29.
+        """
+        year, month = self._month_from_number(self._month_number(self.year, self.month) + n)
+        return self._with_clamped_day(year, month)
+
+    def add_years(self, n: int) -> "Date":
+        """The same month and day `n` years later (earlier when negative), clamped like `add_months`"""
+        year = self._year_from_number(self._year_number(self.year) + n)
+        return self._with_clamped_day(year, self._same_month(self.year, self.month, year))
+
+    @classmethod
+    def difference(cls, start: "Date", end: "Date", unit: str = "days") -> int:
+        """
+        Whole days, weeks, months or years from `start` to `end` in this calendar
+
+        Negative when `end` is before `start`. A month or year is complete once `add_months` or
+        `add_years` of `start` reaches `end`, so someone born on February 29 turns one on
+        February 28 of the next year.
+        """
+        start, end = floor(start.fixed), floor(end.fixed)
+        if unit == "days":
+            return end - start
+        if unit == "weeks":
+            return int((end - start) / 7)  # towards 0, like months and years
+
+        start_date, end_date = cls().from_fixed(start), cls().from_fixed(end)
+        if unit == "months":
+            n = cls._month_number(end_date.year, end_date.month)
+            n -= cls._month_number(start_date.year, start_date.month)
+            add = start_date.add_months
+        elif unit == "years":
+            n = cls._year_number(end_date.year) - cls._year_number(start_date.year)
+            add = start_date.add_years
+        else:
+            raise ValueError(f"{unit!r} is not one of days, weeks, months or years")
+
+        if n > 0 and add(n).fixed > end:
+            n -= 1
+        elif n < 0 and add(n).fixed < end:
+            n += 1
+        return n
+
+    # === Range Statistics ===
+    # Closed forms over the same spans as the iterators: `start` up to, but excluding, `end`
+
+    @classmethod
+    def _month_before(cls, fixed_date: int) -> Tuple[int, int]:
+        """Year and month of the day before `fixed_date`, the spans are counted from it"""
+        date = cls().from_fixed(fixed_date - 1)
+        return date.year, date.month
+
+    @classmethod
+    def _years_spanned(cls, start: Union["Date", int], end: Union["Date", int]) -> Tuple[int, int]:
+        """First and one past the last year whose new year's day is in the span"""
+        last = cls._month_before(floor(end))[0]
+        before = cls._month_before(floor(start))[0]
+        return cls._next_year(before), cls._next_year(last)
+
+    @classmethod
+    def count_years(cls, start: Union["Date", int], end: Union["Date", int]) -> int:
+        """Number of years starting in the span, `len(list(iter_years(start, end)))`"""
+        if floor(start) >= floor(end):
+            return 0
+        first, stop = cls._years_spanned(start, end)
+        return cls._year_number(stop) - cls._year_number(first)
+
+    @classmethod
+    def count_leap_years(cls, start: Union["Date", int], end: Union["Date", int]) -> int:
+        """Number of leap years starting in the span"""
+        if floor(start) >= floor(end):
+            return 0
+        first, stop = cls._years_spanned(start, end)
+        return cls.leap_years_before(stop) - cls.leap_years_before(first)
+
+    @classmethod
+    def count_months(cls, start: Union["Date", int], end: Union["Date", int]) -> int:
+        """Number of months starting in the span, `len(list(iter_months(start, end)))`"""
+        if floor(start) >= floor(end):
+            return 0
+        before = cls._month_before(floor(start))
+        last = cls._month_before(floor(end))
+        return cls._month_number(*last) - cls._month_number(*before)
+
+    # === Interoperability ===
+    # RD 1 is January 1, 1 of the proleptic Gregorian calendar, `datetime.date`'s ordinal 1
+
+    @classmethod
+    def from_datetime(cls, value: datetime.date) -> "Date":
+        """The date of a `datetime.date` or `datetime.datetime`, its ordinal is the fixed-date"""
+        return cls().from_fixed(value.toordinal())
+
+    @classmethod
+    def from_unix_day(cls, days: int) -> "Date":
+        """The date `days` after January 1, 1970"""
+        return cls().from_fixed(days + rd(Epoch.Unix))
+
+    def to_datetime(self) -> datetime.date:
+        """The `datetime.date`, for dates from January 1, 1 to December 31, 9999 (Gregorian)"""
+        return datetime.date.fromordinal(floor(self.fixed))
+
+    def to_unix_day(self) -> int:
+        return floor(self.fixed) - rd(Epoch.Unix)
+
+    # === Iteration ===
+
+    @classmethod
+    def iter_days(cls, start: Union["Date", int], end: Union["Date", int]) -> Iterator["Date"]:
+        """
+        Every day from `start` up to, but excluding, `end`
+
+        Only `start` is converted, the following days are stepped from its year/month/day.
+        """
+        fixed_date, stop = floor(start), floor(end)
+        if fixed_date >= stop:
+            return
+
+        first = cls().from_fixed(fixed_date)
+        year, month, day = first.year, first.month, first.day
+        month_length = cls.days_in_month(year, month)
+
+        while fixed_date < stop:
+            yield cls._from_parts(year, month, day, fixed_date)
+            fixed_date += 1
+            day += 1
+            if day > month_length:
+                day = 1
+                year, month = cls._next_month(year, month)
+                month_length = cls.days_in_month(year, month)
+
+    @classmethod
+    def iter_months(cls, start: Union["Date", int], end: Union["Date", int]) -> Iterator["Date"]:
+        """First day of every month starting on or after `start` and before `end`"""
+        fixed_date, stop = floor(start), floor(end)
+        if fixed_date >= stop:
+            return
+
+        first = cls().from_fixed(fixed_date)
+        year, month = first.year, first.month
+        fixed_date -= first.day - 1
+        if first.day != 1:
+            fixed_date += cls.days_in_month(year, month)
+            year, month = cls._next_month(year, month)
+
+        while fixed_date < stop:
+            yield cls._from_parts(year, month, 1, fixed_date)
+            fixed_date += cls.days_in_month(year, month)
+            year, month = cls._next_month(year, month)
+
+    @classmethod
+    def iter_years(cls, start: Union["Date", int], end: Union["Date", int]) -> Iterator["Date"]:
+        """New year's day of every year starting on or after `start` and before `end`"""
+        fixed_date, stop = floor(start), floor(end)
+        if fixed_date >= stop:
+            return
+
+        year = cls().from_fixed(fixed_date).year
+        new_year = cls().from_date(year, cls.first_month, 1).fixed
+        if new_year < fixed_date:
+            new_year += cls.days_in_year(year)
+            year = cls._next_year(year)
+
+        while new_year < stop:
+            yield cls._from_parts(year, cls.first_month, 1, new_year)
+            new_year += cls.days_in_year(year)
+            year = cls._next_year(year)
+
+
+def _restore_date(calendar, year, month, day, rata_die) -> Date:
+    """Unpickle a date without going through the immutable __setattr__"""
+    if year is None:
+        return calendar().from_fixed(rata_die)  # not yet decomposed
+    return calendar._from_parts(year, month + 1, day, rata_die)
+
+
+# === Swappable Implementations ===
+# Engines (`cycles`) choose how a function or method is implemented and instrumentation wraps
+# it, both through here so neither puts back a function the other has since replaced
+
+_IMPLEMENTATIONS: Dict[Tuple[object, str], object] = {}  # (owner, attribute) -> chosen
+_WRAPPERS: Dict[Tuple[object, str], Callable[[object], object]] = {}
+
+
+def _implementation(owner: object, attribute: str) -> object:
+    """The chosen implementation of a class or module attribute, without any wrapper"""
+    key = (owner, attribute)
+    if key not in _IMPLEMENTATIONS:
+        _IMPLEMENTATIONS[key] = vars(owner)[attribute]
+    return _IMPLEMENTATIONS[key]
+
+
+def _install(owner: object, attribute: str) -> None:
+    implementation = _implementation(owner, attribute)
+    wrapper = _WRAPPERS.get((owner, attribute))
+    setattr(owner, attribute, implementation if wrapper is None else wrapper(implementation))
+
+
+def _set_implementation(owner: object, attribute: str, implementation: object) -> None:
+    """Replace the implementation, under the wrapper if there is one"""
+    _IMPLEMENTATIONS[(owner, attribute)] = implementation
+    _install(owner, attribute)
+
+
+def _set_wrapper(
+    owner: object, attribute: str, wrapper: Optional[Callable[[object], object]]
+) -> None:
+    """Lay `wrapper(implementation)` over whichever implementation is chosen, None removes it"""
+    _implementation(owner, attribute)  # the unwrapped one is recorded before replacing it
+    if wrapper is None:
+        _WRAPPERS.pop((owner, attribute), None)
+    else:
+        _WRAPPERS[(owner, attribute)] = wrapper
+    _install(owner, attribute)
+
 
 def rd(tee: int) -> int:
     """Modify the RD date, epoch, if timekeeping offset is necessary"""
@@ -86,6 +471,53 @@ def day_of_week_from_fixed(fixed_date: Union[int, float]) -> int:
     return floor(fixed_date - rd(0) - SUNDAY) % 7
 
 
+# === Days of the Week ===
+
+
+def kday_on_or_before(k: int, fixed_date: Union[int, float]) -> int:
+    """Fixed-date of the k-day (SUNDAY...SATURDAY) on or before the fixed-date"""
+    fixed_date = floor(fixed_date)
+    return fixed_date - day_of_week_from_fixed(fixed_date - k)
+
+
+def kday_on_or_after(k: int, fixed_date: Union[int, float]) -> int:
+    return kday_on_or_before(k, floor(fixed_date) + 6)
+
+
+def kday_nearest(k: int, fixed_date: Union[int, float]) -> int:
+    return kday_on_or_before(k, floor(fixed_date) + 3)
+
+
+def kday_before(k: int, fixed_date: Union[int, float]) -> int:
+    return kday_on_or_before(k, floor(fixed_date) - 1)
+
+
+def kday_after(k: int, fixed_date: Union[int, float]) -> int:
+    return kday_on_or_before(k, floor(fixed_date) + 7)
+
+
+def count_kdays(k: int, start: Union[Date, int], end: Union[Date, int]) -> int:
+    """Number of k-days from `start` up to, but excluding, `end`"""
+    start, end = floor(start), floor(end)
+    if start >= end:
+        return 0
+    return (end - 1 - k - SUNDAY) // 7 - (start - 1 - k - SUNDAY) // 7  # days of week are d % 7
+
+
+def nth_kday(n: int, k: int, fixed_date: Union[int, float]) -> int:
+    """
+    The n-th k-day after the fixed-date, or the |n|-th before it when n is negative
+
+    The fixed-date itself counts when it is a k-day, `nth_kday(1, MONDAY, d)` is the first Monday
+    on or after `d`.
+    """
+    if n > 0:
+        return 7 * n + kday_before(k, fixed_date)
+    if n < 0:
+        return 7 * n + kday_after(k, fixed_date)
+    raise ValueError("n must not be 0, there is no 0th k-day")
+
+
 # === Time and Astronomy ===
 
 
@@ -0,0 +1,665 @@
+"""
+Array versions of the calendar conversions
+
+Every function takes NumPy arrays (or anything `numpy.asarray` accepts) and evaluates the same
+arithmetic as the scalar classes with whole-array operations, so millions of dates are
+converted without a Python-level loop.
+"""
+
+from typing import Callable, Dict, Tuple, Type
+
+import numpy as np
+
+from .base import Date, DateFormatException
+from .constants import *
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .gregorian import Gregorian
+from .hebrew import Hebrew, HEBREW_YEAR_TYPES
+from .holidays import HEBREW_HOLIDAYS, HEBREW_HOLIDAY_OFFSETS
+from .julian import Julian
+
+DateArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _as_fixed(fixed_dates) -> np.ndarray:
+    fixed = np.asarray(fixed_dates)
+    if fixed.dtype.kind == "f":
+        fixed = np.floor(fixed)
+    return fixed.astype(np.int64, copy=False)
+
+
+def _as_int(values) -> np.ndarray:
+    return np.asarray(values).astype(np.int64, copy=False)
+
+
+# === Gregorian ===
+
+
+def gregorian_leap_year_array(years) -> np.ndarray:
+    years = _as_int(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def fixed_from_gregorian_array(years, months, days) -> np.ndarray:
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    prior_y = years - 1
+
+    february_correction = np.where(
+        months <= 2, 0, np.where(gregorian_leap_year_array(years), -1, -2)
+    )
+    return (
+        (Gregorian.epoch - 1)
+        + 365 * prior_y
+        + prior_y // 4
+        - prior_y // 100
+        + prior_y // 400
+        + (367 * months - 362) // 12
+        + february_correction
+        + days
+    )
+
+
+def gregorian_year_from_fixed_array(fixed_dates) -> np.ndarray:
+    d0 = _as_fixed(fixed_dates) - Gregorian.epoch
+    n400, d1 = np.divmod(d0, 146097)
+    n100, d2 = np.divmod(d1, 36524)
+    n4, d3 = np.divmod(d2, 1461)
+    n1 = d3 // 365
+
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+    return year + ((n100 != 4) & (n1 != 4))
+
+
+def gregorian_from_fixed_array(fixed_dates) -> DateArrays:
+    fixed = _as_fixed(fixed_dates)
+    ones = np.ones_like(fixed)
+
+    year = gregorian_year_from_fixed_array(fixed)
+    prior_days = fixed - fixed_from_gregorian_array(year, ones, ones)
+    correction = np.where(
+        fixed < fixed_from_gregorian_array(year, ones * MARCH, ones),
+        0,
+        np.where(gregorian_leap_year_array(year), 1, 2),
+    )
+    month = (12 * (prior_days + correction) + 373) // 367
+    day = fixed - fixed_from_gregorian_array(year, month, ones) + 1
+    return year, month, day
+
+
+# === Julian ===
+
+
+def julian_leap_year_array(years) -> np.ndarray:
+    years = _as_int(years)
+    return years % 4 == np.where(years > 0, 0, 3)
+
+
+def fixed_from_julian_array(years, months, days) -> np.ndarray:
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    y = np.where(years < 0, years + 1, years)
+
+    february_correction = np.where(months <= 2, 0, np.where(julian_leap_year_array(years), -1, -2))
+    return (
+        (Julian.epoch - 1)
+        + 365 * (y - 1)
+        + (y - 1) // 4
+        + (367 * months - 362) // 12
+        + february_correction
+        + days
+    )
+
+
+def julian_from_fixed_array(fixed_dates) -> DateArrays:
+    fixed = _as_fixed(fixed_dates)
+    ones = np.ones_like(fixed)
+
+    approx = (4 * (fixed - Julian.epoch) + 1464) // 1461
+    year = np.where(approx <= 0, approx - 1, approx)
+
+    correction = np.where(
+        fixed < fixed_from_julian_array(year, ones * MARCH, ones),
+        0,
+        np.where(julian_leap_year_array(year), 1, 2),
+    )
+    prior_days = fixed - fixed_from_julian_array(year, ones, ones)
+    month = (12 * (prior_days + correction) + 373) // 367
+    day = fixed - fixed_from_julian_array(year, month, ones) + 1
+    return year, month, day
+
+
+# === Coptic & Ethiopic ===
+
+
+def _fixed_from_coptic_like(epoch: int, years, months, days) -> np.ndarray:
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    return epoch - 1 + 365 * (years - 1) + years // 4 + 30 * (months - 1) + days
+
+
+def _coptic_like_from_fixed(epoch: int, fixed_dates) -> DateArrays:
+    fixed = _as_fixed(fixed_dates)
+    year = (4 * (fixed - epoch) + 1463) // 1461
+    day_of_year = fixed - (epoch - 1 + 365 * (year - 1) + year // 4)  # 1-based
+    month = (day_of_year - 1) // 30 + 1
+    day = day_of_year - 30 * (month - 1)
+    return year, month, day
+
+
+def coptic_leap_year_array(years) -> np.ndarray:
+    return _as_int(years) % 4 == 3
+
+
+def ethiopic_leap_year_array(years) -> np.ndarray:
+    return _as_int(years) % 4 == 3
+
+
+def fixed_from_coptic_array(years, months, days) -> np.ndarray:
+    return _fixed_from_coptic_like(Coptic.epoch, years, months, days)
+
+
+def coptic_from_fixed_array(fixed_dates) -> DateArrays:
+    return _coptic_like_from_fixed(Coptic.epoch, fixed_dates)
+
+
+def fixed_from_ethiopic_array(years, months, days) -> np.ndarray:
+    return _fixed_from_coptic_like(Ethiopic.epoch, years, months, days)
+
+
+def ethiopic_from_fixed_array(fixed_dates) -> DateArrays:
+    return _coptic_like_from_fixed(Ethiopic.epoch, fixed_dates)
+
+
+# === Hebrew ===
+
+# Month offsets only depend on the year's length, index the year types by length - 353
+_HEBREW_LENGTHS = 385 - 353 + 1
+_HEBREW_MONTH_STARTS = np.zeros((_HEBREW_LENGTHS, 13), dtype=np.int64)
+_HEBREW_ORDERED_STARTS = np.full((_HEBREW_LENGTHS, 13), np.iinfo(np.int64).max, dtype=np.int64)
+_HEBREW_ORDERED_MONTHS = np.zeros((_HEBREW_LENGTHS, 13), dtype=np.int64)
+_HEBREW_MONTH_LENGTHS = np.zeros((_HEBREW_LENGTHS, 13), dtype=np.int64)
+_HEBREW_LENGTH_INDEXES = sorted({t.length - 353 for t in HEBREW_YEAR_TYPES.values()})  # six
+for _year_type in HEBREW_YEAR_TYPES.values():
+    _i = _year_type.length - 353
+    _n = len(_year_type.ordered_months)
+    _HEBREW_MONTH_STARTS[_i] = _year_type.month_starts
+    _HEBREW_MONTH_LENGTHS[_i] = _year_type.month_lengths
+    _HEBREW_ORDERED_STARTS[_i, :_n] = _year_type.ordered_starts
+    _HEBREW_ORDERED_MONTHS[_i, :_n] = _year_type.ordered_months
+
+
+def hebrew_leap_year_array(years) -> np.ndarray:
+    return (7 * _as_int(years) + 1) % 19 < 7
+
+
+def hebrew_months_elapsed_array(years, months) -> np.ndarray:
+    years, months = _as_int(years), _as_int(months)
+    y = np.where(months < TISHRI, years + 1, years)
+    return months - TISHRI + (235 * y - 234) // 19
+
+
+def molad_in_halakim_array(years, months) -> np.ndarray:
+    """Exact moments of the mean new moons in parts since RD 0, see `molad_in_halakim`"""
+    months_elapsed = hebrew_months_elapsed_array(years, months)
+    return Hebrew.epoch * HALAKIM_PER_DAY - 876 + months_elapsed * MEAN_SYNODIC_MONTH_HALAKIM
+
+
+def hebrew_cal_elapsed_days_array(years) -> np.ndarray:
+    years = _as_int(years)
+    months_elapsed = (235 * years - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // HALAKIM_PER_DAY
+    return days + ((3 * (days + 1)) % 7 < 3)
+
+
+def _hebrew_new_years(years: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """New year and length of each year, sharing the elapsed-days evaluations"""
+
+    elapsed = [hebrew_cal_elapsed_days_array(years + i) for i in (-1, 0, 1, 2)]
+
+    def new_year(ny0, ny1, ny2):
+        correction = np.where(ny2 - ny1 == 356, 2, np.where(ny1 - ny0 == 382, 1, 0))
+        return Hebrew.epoch + ny1 + correction
+
+    this_year = new_year(*elapsed[0:3])
+    next_year = new_year(*elapsed[1:4])
+    return this_year, next_year - this_year
+
+
+def hebrew_new_year_array(years) -> np.ndarray:
+    return _hebrew_new_years(_as_int(years))[0]
+
+
+def days_in_hebrew_year_array(years) -> np.ndarray:
+    return _hebrew_new_years(_as_int(years))[1]
+
+
+def hebrew_year_from_fixed_array(fixed_dates) -> np.ndarray:
+    fixed = _as_fixed(fixed_dates)
+    if fixed.size and fixed.min() < Hebrew.epoch:
+        raise DateFormatException(f"{fixed.min()} is before the Hebrew epoch, RD {Hebrew.epoch}")
+    approx = (98496 * (fixed - Hebrew.epoch)) // 35975351 + 1
+
+    year = approx - 1
+    while True:
+        ahead = hebrew_new_year_array(year + 1) <= fixed
+        if not ahead.any():
+            return year
+        year = year + ahead
+
+
+def fixed_from_hebrew_array(years, months, days) -> np.ndarray:
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    new_year, length = _hebrew_new_years(years)
+    return new_year + _HEBREW_MONTH_STARTS[length - 353, months - 1] + days - 1
+
+
+def hebrew_from_fixed_array(fixed_dates) -> DateArrays:
+    fixed = _as_fixed(fixed_dates)
+    year = hebrew_year_from_fixed_array(fixed)
+    new_year, length = _hebrew_new_years(year)
+
+    day_of_year = fixed - new_year
+    year_type = length - 353
+
+    # One search per year length rather than comparing every date to a row of 13 starts
+    i = np.empty_like(day_of_year)
+    for t in _HEBREW_LENGTH_INDEXES:
+        rows = year_type == t
+        if rows.any():
+            starts = _HEBREW_ORDERED_STARTS[t]
+            i[rows] = np.searchsorted(starts, day_of_year[rows], side="right") - 1
+
+    month = _HEBREW_ORDERED_MONTHS[year_type, i]
+    day = day_of_year - _HEBREW_ORDERED_STARTS[year_type, i] + 1
+    return year, month, day
+
+
+# === Hebrew Holidays ===
+
+# Holiday offsets from the new year by [holiday, new year weekday, length - 353]
+_HOLIDAY_INDEX = {name: i for i, name in enumerate(HEBREW_HOLIDAYS)}
+_HOLIDAY_OFFSETS = np.zeros((len(HEBREW_HOLIDAYS), 7, _HEBREW_LENGTHS), dtype=np.int64)
+for (_dow, _length), _offsets in HEBREW_HOLIDAY_OFFSETS.items():
+    _HOLIDAY_OFFSETS[:, _dow, _length - 353] = list(_offsets.values())
+
+
+def hebrew_sabbatical_year_array(years) -> np.ndarray:
+    return _as_int(years) % 7 == 0
+
+
+def hebrew_holidays_array(years, names=None) -> Dict[str, np.ndarray]:
+    """
+    Fixed-dates of each holiday, every holiday by default, in each of the Hebrew years
+
+    The new years and year types are evaluated once and shared by all of the holidays.
+    """
+    years = np.ravel(_as_int(years))
+    new_year, length = _hebrew_new_years(years)
+    dow = (new_year - SUNDAY) % 7  # day_of_week_from_fixed
+    offsets = _HOLIDAY_OFFSETS[:, dow, length - 353]
+    return {
+        name: new_year + offsets[_HOLIDAY_INDEX[name]]
+        for name in (HEBREW_HOLIDAYS if names is None else names)
+    }
+
+
+def hebrew_holiday_array(years, name: str) -> np.ndarray:
+    if name not in HEBREW_HOLIDAYS:
+        raise KeyError(f"Unknown Hebrew holiday {name!r}")
+    return hebrew_holidays_array(years, [name])[name]
+
+
+# === Days of the Week ===
+
+
+def day_of_week_from_fixed_array(fixed_dates) -> np.ndarray:
+    return (_as_fixed(fixed_dates) - SUNDAY) % 7
+
+
+def kday_on_or_before_array(k, fixed_dates) -> np.ndarray:
+    """The k-days on or before each fixed-date, `k` is one weekday or an array of them"""
+    fixed = _as_fixed(fixed_dates)
+    return fixed - day_of_week_from_fixed_array(fixed - _as_int(k))
+
+
+def kday_on_or_after_array(k, fixed_dates) -> np.ndarray:
+    return kday_on_or_before_array(k, _as_fixed(fixed_dates) + 6)
+
+
+def kday_nearest_array(k, fixed_dates) -> np.ndarray:
+    return kday_on_or_before_array(k, _as_fixed(fixed_dates) + 3)
+
+
+def kday_before_array(k, fixed_dates) -> np.ndarray:
+    return kday_on_or_before_array(k, _as_fixed(fixed_dates) - 1)
+
+
+def kday_after_array(k, fixed_dates) -> np.ndarray:
+    return kday_on_or_before_array(k, _as_fixed(fixed_dates) + 7)
+
+
+def nth_kday_array(n, k, fixed_dates) -> np.ndarray:
+    """See `nth_kday`, `n` may be an array too but none of it 0"""
+    n = _as_int(n)
+    if (n == 0).any():
+        raise ValueError("n must not be 0, there is no 0th k-day")
+    fixed = _as_fixed(fixed_dates)
+    return 7 * n + np.where(n > 0, kday_before_array(k, fixed), kday_after_array(k, fixed))
+
+
+def nth_kday_of_month_array(calendar: Type[Date], n, k, years, months) -> np.ndarray:
+    """The n-th k-day of each month, counted from the end of the month when n is negative"""
+    years, months, n = _as_int(years), _as_int(months), _as_int(n)
+    first = batch_fixed_from_date(calendar, years, months, np.ones_like(years))
+    last = first + days_in_month_array(calendar, years, months) - 1
+    return nth_kday_array(n, k, np.where(n < 0, last, first))
+
+
+# === Calendar Units ===
+
+_MONTHS_IN_YEAR = {Gregorian: 12, Julian: 12, Coptic: 13, Ethiopic: 13}
+
+# Leap year test and month lengths of the common & leap years, indexed by [leap, month - 1]
+_MONTH_LENGTHS: Dict[Type[Date], Tuple[Callable[..., np.ndarray], np.ndarray]] = {
+    calendar: (leap_year, np.array(lengths, dtype=np.int64))
+    for calendar, leap_year, lengths in (
+        (Gregorian, gregorian_leap_year_array, [JULIAN_MONTH_LENGTHS, JULIAN_LEAP_MONTH_LENGTHS]),
+        (Julian, julian_leap_year_array, [JULIAN_MONTH_LENGTHS, JULIAN_LEAP_MONTH_LENGTHS]),
+        (Coptic, coptic_leap_year_array, [COPTIC_MONTH_LENGTHS, COPTIC_LEAP_MONTH_LENGTHS]),
+        (Ethiopic, ethiopic_leap_year_array, [ETHIOPIC_MONTH_LENGTHS, ETHIOPIC_LEAP_MONTH_LENGTHS]),
+    )
+}
+
+
+def months_in_year_array(calendar: Type[Date], years) -> np.ndarray:
+    years = _as_int(years)
+    if calendar is Hebrew:
+        return np.where(hebrew_leap_year_array(years), ADAR_II, ADAR)
+    return np.full_like(years, _MONTHS_IN_YEAR[calendar])
+
+
+def days_in_month_array(calendar: Type[Date], years, months) -> np.ndarray:
+    """Lengths of valid months, read from the month length tables"""
+    years, months = _as_int(years), _as_int(months)
+    if calendar is Hebrew:
+        return _HEBREW_MONTH_LENGTHS[_hebrew_new_years(years)[1] - 353, months - 1]
+    leap_year, lengths = _MONTH_LENGTHS[calendar]
+    return lengths[leap_year(years).astype(np.int64), months - 1]
+
+
+# === Validation ===
+# Reason codes of `validate_dates_array`, in the order the checks are made
+
+VALID_DATE = 0
+INVALID_YEAR = 1  # year 0 of the Julian calendar, years below 1 of the Hebrew one
+INVALID_MONTH = 2
+INVALID_DAY = 3
+
+INVALID_REASONS = {
+    INVALID_YEAR: "no such year",
+    INVALID_MONTH: "month outside of the year",
+    INVALID_DAY: "day outside of the month",
+}
+
+
+def validate_dates_array(calendar: Type[Date], years, months, days) -> Tuple[np.ndarray, ...]:
+    """
+    Check YYYY-MM-DD triples as `from_date` would, without raising nor converting them
+
+    Returns a mask of the valid rows and a reason code for every row, VALID_DATE or one of
+    INVALID_YEAR, INVALID_MONTH and INVALID_DAY. Only the valid rows should then be given to
+    `batch_fixed_from_date`, which does not check them.
+    """
+    if calendar not in FIXED_FROM_DATE:
+        raise TypeError(f"No batch conversion for {calendar.__name__}")
+
+    years, months, days = np.broadcast_arrays(_as_int(years), _as_int(months), _as_int(days))
+    years, months, days = np.ravel(years), np.ravel(months), np.ravel(days)
+
+    if calendar is Hebrew:
+        bad_year = years < 1
+    elif calendar is Julian:
+        bad_year = years == 0
+    else:
+        bad_year = np.zeros(len(years), dtype=bool)
+    bad_month = (months < 1) | (months > months_in_year_array(calendar, years))
+    month_lengths = days_in_month_array(calendar, years, np.where(bad_month, 1, months))
+    bad_day = (days < 1) | (days > month_lengths)
+
+    reasons = np.select(
+        [bad_year, bad_month, bad_day], [INVALID_YEAR, INVALID_MONTH, INVALID_DAY], VALID_DATE
+    )
+    return reasons == VALID_DATE, reasons
+
+
+def _year_numbers(calendar: Type[Date], years: np.ndarray) -> np.ndarray:
+    """See `Date._year_number`"""
+    return np.where(years < 0, years + 1, years) if calendar is Julian else years
+
+
+def _years_from_numbers(calendar: Type[Date], numbers: np.ndarray) -> np.ndarray:
+    return np.where(numbers <= 0, numbers - 1, numbers) if calendar is Julian else numbers
+
+
+def _month_numbers(calendar: Type[Date], years: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """See `Date._month_number`"""
+    if calendar is Hebrew:
+        return hebrew_months_elapsed_array(years, months)
+    return _year_numbers(calendar, years) * _MONTHS_IN_YEAR[calendar] + months - 1
+
+
+def _months_from_numbers(calendar: Type[Date], numbers: np.ndarray) -> Tuple[np.ndarray, ...]:
+    if calendar is Hebrew:
+        year = (19 * numbers + 252) // 235
+        month_of_year = numbers - hebrew_months_elapsed_array(year, TISHRI)
+        months_to_nisan = np.where(hebrew_leap_year_array(year), ADAR_II, ADAR) - TISHRI + 1
+        after_adar = month_of_year >= months_to_nisan
+        month = np.where(
+            after_adar, NISAN + month_of_year - months_to_nisan, TISHRI + month_of_year
+        )
+        return year, month
+
+    year_number, month = np.divmod(numbers, _MONTHS_IN_YEAR[calendar])
+    return _years_from_numbers(calendar, year_number), month + 1
+
+
+def _clamped(calendar: Type[Date], years, months, days) -> DateArrays:
+    return years, months, np.minimum(days, days_in_month_array(calendar, years, months))
+
+
+def add_months_array(calendar: Type[Date], years, months, days, n) -> DateArrays:
+    """See `Date.add_months`, `n` is one number of months or an array of them"""
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    new_years, new_months = _months_from_numbers(
+        calendar, _month_numbers(calendar, years, months) + _as_int(n)
+    )
+    return _clamped(calendar, new_years, new_months, days)
+
+
+def add_years_array(calendar: Type[Date], years, months, days, n) -> DateArrays:
+    """See `Date.add_years`, `n` is one number of years or an array of them"""
+    years, months, days = _as_int(years), _as_int(months), _as_int(days)
+    new_years = _years_from_numbers(calendar, _year_numbers(calendar, years) + _as_int(n))
+    if calendar is Hebrew:  # the last month of the year stays the last month
+        last_month = np.where(hebrew_leap_year_array(years), ADAR_II, ADAR)
+        new_last_month = np.where(hebrew_leap_year_array(new_years), ADAR_II, ADAR)
+        months = np.where(months == last_month, new_last_month, months)
+    return _clamped(calendar, new_years, months, days)
+
+
+def difference_array(calendar: Type[Date], start_fixed, end_fixed, unit: str = "days"):
+    """
+    See `Date.difference`, whole units from each start to each end fixed-date
+
+        difference_array(Coptic, birth_dates, today, "years")  # ages in Coptic years
+    """
+    start, end = _as_fixed(start_fixed), _as_fixed(end_fixed)
+    if unit == "days":
+        return end - start
+    if unit == "weeks":
+        return np.sign(end - start) * (np.abs(end - start) // 7)
+    if unit not in ("months", "years"):
+        raise ValueError(f"{unit!r} is not one of days, weeks, months or years")
+
+    start, end = np.broadcast_arrays(start, end)
+    start_years, start_months, start_days = batch_from_fixed(calendar, start)
+    end_years, end_months, _ = batch_from_fixed(calendar, end)
+    if unit == "months":
+        n = _month_numbers(calendar, end_years, end_months)
+        n = n - _month_numbers(calendar, start_years, start_months)
+        add = add_months_array
+    else:
+        n = _year_numbers(calendar, end_years) - _year_numbers(calendar, start_years)
+        add = add_years_array
+
+    reached = batch_fixed_from_date(
+        calendar, *add(calendar, start_years, start_months, start_days, n)
+    )
+    end = np.ravel(end)
+    return n - ((n > 0) & (reached > end)) + ((n < 0) & (reached < end))
+
+
+# === Range Statistics ===
+# Each calendar's `leap_years_before` is plain arithmetic and evaluates arrays as they are
+
+
+def _spans(starts, ends) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Start & end fixed-dates broadcast together, and which spans are not empty"""
+    starts, ends = np.broadcast_arrays(_as_fixed(starts), _as_fixed(ends))
+    starts, ends = np.ravel(starts), np.ravel(ends)
+    return starts, ends, starts < ends
+
+
+def count_kdays_array(k, starts, ends) -> np.ndarray:
+    """See `count_kdays`, for arrays of spans"""
+    starts, ends, spanned = _spans(starts, ends)
+    k = _as_int(k) + SUNDAY
+    return np.where(spanned, (ends - 1 - k) // 7 - (starts - 1 - k) // 7, 0)
+
+
+def _months_before(calendar: Type[Date], fixed_dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Years and months of the days before the fixed-dates, see `Date._month_before`"""
+    if calendar is not Hebrew:
+        return batch_from_fixed(calendar, fixed_dates - 1)[:2]
+
+    at_epoch = fixed_dates <= Hebrew.epoch  # Elul of the year 0 before the epoch
+    years, months, _ = batch_from_fixed(
+        calendar, np.where(at_epoch, Hebrew.epoch + 1, fixed_dates) - 1
+    )
+    return np.where(at_epoch, 0, years), np.where(at_epoch, ELUL, months)
+
+
+def _year_numbers_spanned(calendar: Type[Date], starts, ends):
+    starts, ends, spanned = _spans(starts, ends)
+    before = _year_numbers(calendar, _months_before(calendar, starts)[0])
+    last = _year_numbers(calendar, _months_before(calendar, ends)[0])
+    return before + 1, last + 1, spanned
+
+
+def count_years_array(calendar: Type[Date], starts, ends) -> np.ndarray:
+    """See `Date.count_years`, for arrays of spans"""
+    first, stop, spanned = _year_numbers_spanned(calendar, starts, ends)
+    return np.where(spanned, stop - first, 0)
+
+
+def count_leap_years_array(calendar: Type[Date], starts, ends) -> np.ndarray:
+    """See `Date.count_leap_years`, for arrays of spans"""
+    first, stop, spanned = _year_numbers_spanned(calendar, starts, ends)
+    first, stop = _years_from_numbers(calendar, first), _years_from_numbers(calendar, stop)
+    leap_years = calendar.leap_years_before(stop) - calendar.leap_years_before(first)
+    return np.where(spanned, leap_years, 0)
+
+
+def count_months_array(calendar: Type[Date], starts, ends) -> np.ndarray:
+    """See `Date.count_months`, for arrays of spans"""
+    starts, ends, spanned = _spans(starts, ends)
+    before = _month_numbers(calendar, *_months_before(calendar, starts))
+    last = _month_numbers(calendar, *_months_before(calendar, ends))
+    return np.where(spanned, last - before, 0)
+
+
+# === Interoperability ===
+# Fixed-dates are `datetime.date` ordinals and datetime64[D] counts days from the Unix epoch, so
+# every conversion is one offset over the whole array
+
+
+def _as_days(values) -> np.ndarray:
+    """datetime64 of any unit as datetime64[D], NaT is rejected as it has no fixed-date"""
+    days = np.asarray(values, dtype="datetime64[D]")
+    if np.isnat(days).any():
+        raise ValueError("NaT has no fixed-date")
+    return days
+
+
+def fixed_from_unix_days_array(days) -> np.ndarray:
+    return _as_int(days) + Epoch.Unix
+
+
+def unix_days_from_fixed_array(fixed_dates) -> np.ndarray:
+    return _as_fixed(fixed_dates) - Epoch.Unix
+
+
+def fixed_from_datetime64_array(values) -> np.ndarray:
+    """Fixed-dates of datetime64 values, times of the day are dropped"""
+    return _as_days(values).view(np.int64) + Epoch.Unix
+
+
+def datetime64_from_fixed_array(fixed_dates) -> np.ndarray:
+    return unix_days_from_fixed_array(fixed_dates).view("datetime64[D]")
+
+
+def fixed_from_dates_array(dates) -> np.ndarray:
+    """Fixed-dates of a sequence of `datetime.date`, read by NumPy without a Python loop"""
+    return fixed_from_datetime64_array(np.asarray(dates, dtype="datetime64[D]"))
+
+
+def dates_from_fixed_array(fixed_dates) -> np.ndarray:
+    """Object array of `datetime.date`, for fixed-dates from 1 up to 3652059 (9999-12-31)"""
+    return datetime64_from_fixed_array(fixed_dates).astype(object)
+
+
+def batch_from_datetime64(calendar: Type[Date], values) -> DateArrays:
+    """Year, month & day arrays in `calendar` of datetime64 values"""
+    return batch_from_fixed(calendar, fixed_from_datetime64_array(values))
+
+
+def datetime64_from_date_array(calendar: Type[Date], years, months, days) -> np.ndarray:
+    """datetime64[D] of YYYY-MM-DD arrays in `calendar`"""
+    return datetime64_from_fixed_array(batch_fixed_from_date(calendar, years, months, days))
+
+
+# === Dispatch ===
+
+FROM_FIXED: Dict[Type[Date], Callable[..., DateArrays]] = {
+    Gregorian: gregorian_from_fixed_array,
+    Julian: julian_from_fixed_array,
+    Coptic: coptic_from_fixed_array,
+    Ethiopic: ethiopic_from_fixed_array,
+    Hebrew: hebrew_from_fixed_array,
+}
+
+FIXED_FROM_DATE: Dict[Type[Date], Callable[..., np.ndarray]] = {
+    Gregorian: fixed_from_gregorian_array,
+    Julian: fixed_from_julian_array,
+    Coptic: fixed_from_coptic_array,
+    Ethiopic: fixed_from_ethiopic_array,
+    Hebrew: fixed_from_hebrew_array,
+}
+
+
+def batch_from_fixed(calendar: Type[Date], fixed_dates) -> DateArrays:
+    """Year, month & day arrays in `calendar` for an array of Rata Die fixed-dates"""
+    if calendar not in FROM_FIXED:
+        raise TypeError(f"No batch conversion for {calendar.__name__}")
+    return FROM_FIXED[calendar](np.ravel(fixed_dates))
+
+
+def batch_fixed_from_date(calendar: Type[Date], years, months, days) -> np.ndarray:
+    """
+    Rata Die fixed-dates for arrays of YYYY-MM-DD in `calendar`
+
+    Like `_fixed_from_date`, the triples are not verified.
+    """
+    if calendar not in FIXED_FROM_DATE:
+        raise TypeError(f"No batch conversion for {calendar.__name__}")
+    return FIXED_FROM_DATE[calendar](np.ravel(years), np.ravel(months), np.ravel(days))
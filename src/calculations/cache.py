@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+
+
+class BoundedCache:
+    """
+    Least-recently-used cache which can be shared by several functions
+
+    Entries are keyed by the memoized function and its positional arguments so one capacity
+    bounds the memory used by every function placed under the cache.
+    A capacity of 0 disables caching while still counting misses.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._capacity = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.resize(capacity)
+
+    def memoize(self, func: Callable) -> Callable:
+        """Decorator placing a function with hashable positional arguments under the cache"""
+
+        entries = self._entries
+        lock = self._lock
+
+        @wraps(func)
+        def wrapper(*args):
+            key = (func, *args)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    self._hits += 1
+                    return entries[key]
+                self._misses += 1
+
+            value = func(*args)  # computed outside the lock: memoized functions call each other
+
+            with lock:
+                if self._capacity:
+                    entries[key] = value
+                    while len(entries) > self._capacity:
+                        entries.popitem(last=False)
+                        self._evictions += 1
+            return value
+
+        wrapper.cache = self
+        return wrapper
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def resize(self, capacity: int) -> None:
+        """Change the maximum number of entries, evicting the least recently used as needed"""
+
+        if capacity < 0:
+            raise ValueError(f"Cache capacity must be 0 or greater, not {capacity}")
+
+        with self._lock:
+            self._capacity = int(capacity)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry, the statistics keep counting, see `reset_stats`"""
+
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Zero the hits, misses & evictions, the entries are kept"""
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                capacity=self._capacity,
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Flat statistics suitable for a metrics exporter"""
+        info = self.info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "evictions": info.evictions,
+            "size": info.size,
+            "capacity": info.capacity,
+        }
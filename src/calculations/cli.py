@@ -0,0 +1,264 @@
+"""
+Convert date columns of CSV or NDJSON files between calendars
+
+    ../calendrical-calculations $ python3 -m src.calculations --from gregorian --to hebrew \
+        --columns birthday,anniversary --input people.csv --output people_hebrew.csv
+
+Dates are written as YYYY-MM-DD (astronomical years may be negative) and Rata Die fixed-dates
+as integers. Rows are streamed in chunks so memory stays bounded regardless of file size.
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+from collections import deque
+from itertools import islice
+from math import floor, isfinite
+from multiprocessing import Pool
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from .base import Date, DateFormatException
+from .conversion import convert
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .gregorian import Gregorian
+from .hebrew import Hebrew
+from .julian import Julian
+
+CALENDARS: Dict[str, Optional[Type[Date]]] = {
+    "gregorian": Gregorian,
+    "julian": Julian,
+    "coptic": Coptic,
+    "ethiopic": Ethiopic,
+    "hebrew": Hebrew,
+    "rd": None,  # Rata Die fixed-date
+}
+
+DATE_PATTERN = re.compile(r"^\s*(-?\d+)-(\d{1,2})-(\d{1,2})\s*$")
+
+Row = Dict[str, object]
+
+
+def parse_date(value: str, calendar: Type[Date]) -> Date:
+    """YYYY-MM-DD to a date, raising DateFormatException when it is not one"""
+    match = DATE_PATTERN.match(str(value))
+    if match is None:
+        raise DateFormatException(f"{value!r} is not formatted as YYYY-MM-DD")
+    return calendar().from_date(*(int(part) for part in match.groups()))
+
+
+def format_date(date: Date) -> str:
+    sign = "-" if date.year < 0 else ""
+    return f"{sign}{abs(date.year):04}-{date.month:02}-{date.day:02}"
+
+
+def parse_fixed(value) -> int:
+    """A Rata Die fixed-date field, fractions of a day are floored like `batch._as_fixed` does"""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise DateFormatException(f"{value!r} is not a fixed-date")
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            value = float(value)
+    if not isfinite(value):
+        raise DateFormatException(f"{value!r} is not a fixed-date")
+    return floor(value)
+
+
+def convert_value(value, source: Optional[Type[Date]], target: Optional[Type[Date]]):
+    """Convert one field, a calendar of None means a Rata Die fixed-date"""
+
+    if source is None:
+        fixed_date = parse_fixed(value)
+        if target is None:
+            return fixed_date
+        return format_date(target().from_fixed(fixed_date))
+
+    date = parse_date(value, source)
+    if target is None:
+        return date.fixed
+    return format_date(convert(date, target))
+
+
+def convert_rows(
+    rows: List[Row], columns: List[str], source: str, target: str, on_error: str
+) -> Tuple[List[Row], int]:
+    """Convert the named columns of a chunk of rows, returns the rows and the number of errors"""
+
+    source_calendar, target_calendar = CALENDARS[source], CALENDARS[target]
+    converted, errors = [], 0
+    for row in rows:
+        try:
+            values = {
+                column: convert_value(row[column], source_calendar, target_calendar)
+                for column in columns
+                if row.get(column) not in (None, "")
+            }
+        except (DateFormatException, ValueError) as exc:
+            errors += 1
+            if on_error == "fail":
+                raise DateFormatException(f"Row {row}: {exc}") from exc
+            if on_error == "skip":
+                continue
+            values = {column: "" for column in columns if column in row}
+
+        row.update(values)
+        converted.append(row)
+    return converted, errors
+
+
+def _convert_chunk(args: tuple) -> Tuple[List[Row], int]:
+    return convert_rows(*args)
+
+
+def ndjson_rows(lines: Iterable[str], on_error: str, bad_lines: List[int]) -> Iterator[Row]:
+    """
+    Rows of NDJSON lines, a line which is not a JSON object is a bad row
+
+    Like a row with a bad date it stops the conversion when `on_error` is "fail", otherwise it
+    is dropped, having no columns to blank, and its line number added to `bad_lines`.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"{type(row).__name__} instead of an object")
+        except ValueError as exc:
+            if on_error == "fail":
+                raise DateFormatException(f"Line {number}: {exc}") from exc
+            bad_lines.append(number)
+            continue
+        yield row
+
+
+def chunked(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_stream(
+    rows: Iterable[Row],
+    columns: List[str],
+    source: str,
+    target: str,
+    on_error: str = "blank",
+    chunk_size: int = 10000,
+    workers: int = 1,
+) -> Iterator[Tuple[List[Row], int]]:
+    """
+    Converted chunks in input order
+
+    With several workers at most two chunks per worker are in flight, so a slow writer does not
+    let the reader pull the whole input into memory.
+    """
+
+    tasks = ((chunk, columns, source, target, on_error) for chunk in chunked(rows, chunk_size))
+
+    if workers <= 1:
+        yield from map(_convert_chunk, tasks)
+        return
+
+    with Pool(workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(_convert_chunk, (task,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+# === Command Line ===
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m src.calculations",
+        description="Convert date columns of CSV or NDJSON between calendars",
+    )
+    parser.add_argument("--from", dest="source", choices=CALENDARS, required=True)
+    parser.add_argument("--to", dest="target", choices=CALENDARS, required=True)
+    parser.add_argument("--columns", required=True, help="comma separated column names")
+    parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+    parser.add_argument("--input", help="file to read, stdin when omitted")
+    parser.add_argument("--output", help="file to write, stdout when omitted")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1, help="processes converting chunks")
+    parser.add_argument(
+        "--on-error",
+        choices=("blank", "skip", "fail"),
+        default="blank",
+        help="blank the converted columns, drop the row, or stop on a bad date",
+    )
+    parser.add_argument("--quiet", action="store_true", help="do not report throughput")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_arguments(argv)
+    columns = [column.strip() for column in args.columns.split(",") if column.strip()]
+
+    source = open(args.input, newline="", encoding="utf-8") if args.input else sys.stdin
+    sink = None
+
+    start = perf_counter()
+    total = errors = 0
+    bad_lines: List[int] = []
+    try:
+        # The input is checked before the output is opened, a bad column must not truncate it
+        if args.format == "csv":
+            rows = csv.DictReader(source)
+            missing = [column for column in columns if column not in (rows.fieldnames or [])]
+            if missing:
+                print(f"error: no column named {', '.join(missing)}", file=sys.stderr)
+                return 2
+        else:
+            rows = ndjson_rows(source, args.on_error, bad_lines)
+
+        sink = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+        if args.format == "csv":
+            writer = csv.DictWriter(sink, fieldnames=rows.fieldnames)
+            writer.writeheader()
+
+        chunks = convert_stream(
+            rows, columns, args.source, args.target, args.on_error, args.chunk_size, args.workers
+        )
+        for converted, chunk_errors in chunks:
+            errors += chunk_errors
+            total += len(converted)
+            if args.format == "csv":
+                writer.writerows(converted)
+            else:
+                sink.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in converted)
+    except DateFormatException as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if args.input:
+            source.close()
+        if args.output and sink is not None:
+            sink.close()
+
+    elapsed = perf_counter() - start
+    if not args.quiet:
+        rate = total / elapsed if elapsed else 0
+        print(
+            f"{total} rows ({errors} with bad dates) in {elapsed:.2f}s, {rate:,.0f} rows/s",
+            file=sys.stderr,
+        )
+        if bad_lines:
+            print(
+                f"{len(bad_lines)} lines dropped, not JSON objects: {bad_lines[:10]}",
+                file=sys.stderr,
+            )
+    return 0
@@ -1,6 +1,3 @@
-from dataclasses import dataclass
-
-
 # Julian and descendant constants
 (
     JANUARY,
@@ -16,7 +13,8 @@ from dataclasses import dataclass
     NOVEMBER,
     DECEMBER,
 ) = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12)
-JULIAN_MONTH_LENGTHS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+JULIAN_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+JULIAN_LEAP_MONTH_LENGTHS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 SUNDAY, MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY = (
     0,
     1,
@@ -43,7 +41,8 @@ SUNDAY, MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY = (
     MESORE,
     EPAGOMENE,
 ) = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
-COPTIC_MONTH_LENGTHS = [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5]
+COPTIC_MONTH_LENGTHS = (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5)
+COPTIC_LEAP_MONTH_LENGTHS = (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 6)
 TKYRIAKE, PESNAU, PSHOMENT, PEFTOOU, PTIOU, PSOOU, PSABBATON = (
     0,
     1,
@@ -70,7 +69,8 @@ TKYRIAKE, PESNAU, PSHOMENT, PEFTOOU, PTIOU, PSOOU, PSABBATON = (
     NAHASE,
     PAGUEMEN,
 ) = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
-ETHIOPIC_MONTH_LENGTHS = [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5]
+ETHIOPIC_MONTH_LENGTHS = (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 5)
+ETHIOPIC_LEAP_MONTH_LENGTHS = (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 6)
 IHUD, SANYO, MAKSANYO, ROB, HAMUS, ARB, KIDAMME = 0, 1, 2, 3, 4, 5, 6  # days
 
 # Hebrew
@@ -89,12 +89,15 @@ IHUD, SANYO, MAKSANYO, ROB, HAMUS, ARB, KIDAMME = 0, 1, 2, 3, 4, 5, 6  # days
     ADAR,
     ADAR_II,
 ) = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
-HEBREW_MONTH_LENGTHS = [30, 29, 30, 29, 30, 29, 30, 29, 29, 29, 30, 30, 29]
+HEBREW_MONTH_LENGTHS = (30, 29, 30, 29, 30, 29, 30, 29, 29, 29, 30, 30, 29)
 RISHON, SHENI, SHELISHI, REVII, HAMISHI, SHISHI, SHABBAT = 0, 1, 2, 3, 4, 5, 6  # days
+HALAKIM_PER_HOUR = 1080  # parts
+HALAKIM_PER_DAY = 24 * HALAKIM_PER_HOUR
+MEAN_SYNODIC_MONTH_HALAKIM = 29 * HALAKIM_PER_DAY + 12 * HALAKIM_PER_HOUR + 793
 
 
-@dataclass
-class Epoch:  # Gregorian Equivalent
+# Not a dataclass, so that importing one calendar does not import dataclasses and inspect
+class Epoch:  # Gregorian Equivalent, only read as class attributes
     Babylonian: int = -113502  # March 29, -310
     Coptic: int = 103605  # August 29, 284
     Egyption: int = -272787  # February 18, -746
@@ -0,0 +1,169 @@
+from bisect import bisect_right
+from math import floor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from .base import Date
+from .constants import *
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .gregorian import Gregorian, gregorian_leap_year
+from .julian import Julian
+
+# Conversion paths
+IDENTITY = "identity"  # Same calendar, the date is returned as is
+JULIAN_GREGORIAN = "julian-gregorian"  # Shift the day by the century offset
+COPTIC_ETHIOPIC = "coptic-ethiopic"  # Identical months, only the era differs
+FIXED = "fixed"  # Through the Rata Die fixed-date
+
+COPTIC_TO_ETHIOPIC_YEARS = 276  # (Coptic epoch - Ethiopic epoch) / 365.25
+
+
+def julian_gregorian_offset(year: int, month: int) -> int:
+    """
+    Days the Gregorian calendar runs ahead of the Julian calendar
+
+    `year` is the astronomical Julian year (1 B.C. is 0). The offset grows by one every century
+    year which is not a multiple of 400, from the Julian leap day of that century onward.
+    """
+    if month < MARCH:
+        year -= 1
+    return year // 100 - year // 400 - 2
+
+
+def _shift_days(year: int, month: int, day: int, leap_year: Callable[[int], bool]) -> Tuple:
+    """Carry an out-of-range day of the month into the neighbouring months"""
+
+    while True:
+        lengths = JULIAN_LEAP_MONTH_LENGTHS if leap_year(year) else JULIAN_MONTH_LENGTHS
+        if day > lengths[month - 1]:
+            day -= lengths[month - 1]
+            month += 1
+            if month > DECEMBER:
+                month = JANUARY
+                year += 1
+        elif day < 1:
+            month -= 1
+            if month < JANUARY:
+                month = DECEMBER
+                year -= 1
+            lengths = JULIAN_LEAP_MONTH_LENGTHS if leap_year(year) else JULIAN_MONTH_LENGTHS
+            day += lengths[month - 1]
+        else:
+            return year, month, day
+
+
+def _astronomical_julian_leap_year(year: int) -> bool:
+    return year % 4 == 0
+
+
+def _julian_to_gregorian(date: Julian) -> Gregorian:
+    year = date.year + 1 if date.year < 0 else date.year
+    offset = julian_gregorian_offset(year, date.month)
+    year, month, day = _shift_days(year, date.month, date.day + offset, gregorian_leap_year)
+    return Gregorian._from_parts(year, month, day, floor(date.fixed))
+
+
+# Days from March 1 to the first of each month, counting in years which start in March. Both
+# calendars share these, they only disagree on the length of February, the last month.
+_DAYS_BEFORE_MONTH_FROM_MARCH = (306, 337, 0, 31, 61, 92, 122, 153, 184, 214, 245, 275)
+_MARCH_MONTH_STARTS = sorted(_DAYS_BEFORE_MONTH_FROM_MARCH)
+
+
+def _julian_days_in_march_year(year: int) -> int:
+    """Days from March 1 of the astronomical year to the next, with its following February"""
+    return 366 if _astronomical_julian_leap_year(year + 1) else 365
+
+
+def _gregorian_to_julian(date: Gregorian) -> Julian:
+    # Julian March 1 of a year falls `julian_gregorian_offset` days after the Gregorian one,
+    # so the day of the Gregorian year counted from March is moved back by the offset
+    year = date.year - 1 if date.month < MARCH else date.year
+    day = _DAYS_BEFORE_MONTH_FROM_MARCH[date.month - 1] + date.day - 1
+    day -= julian_gregorian_offset(year, MARCH)
+
+    while day < 0:  # the offset is only beyond a year far from the present
+        year -= 1
+        day += _julian_days_in_march_year(year)
+    while day >= _julian_days_in_march_year(year):
+        day -= _julian_days_in_march_year(year)
+        year += 1
+
+    i = bisect_right(_MARCH_MONTH_STARTS, day) - 1
+    month = (i + 2) % 12 + 1
+    if month < MARCH:
+        year += 1
+    label = year if year > 0 else year - 1  # No year 0 in the Julian calendar
+    return Julian._from_parts(label, month, day - _MARCH_MONTH_STARTS[i] + 1, date.fixed)
+
+
+def _coptic_to_ethiopic(date: Coptic) -> Ethiopic:
+    return Ethiopic._from_parts(
+        date.year + COPTIC_TO_ETHIOPIC_YEARS, date.month, date.day, date.fixed
+    )
+
+
+def _ethiopic_to_coptic(date: Ethiopic) -> Coptic:
+    return Coptic._from_parts(
+        date.year - COPTIC_TO_ETHIOPIC_YEARS, date.month, date.day, date.fixed
+    )
+
+
+_SHORTCUTS: Dict[Tuple[Type[Date], Type[Date]], Tuple[str, Callable[[Date], Date]]] = {
+    (Julian, Gregorian): (JULIAN_GREGORIAN, _julian_to_gregorian),
+    (Gregorian, Julian): (JULIAN_GREGORIAN, _gregorian_to_julian),
+    (Coptic, Ethiopic): (COPTIC_ETHIOPIC, _coptic_to_ethiopic),
+    (Ethiopic, Coptic): (COPTIC_ETHIOPIC, _ethiopic_to_coptic),
+}
+
+
+def _route(date: Date, to: Type[Date]) -> Tuple[str, Optional[Callable[[Date], Date]]]:
+    """
+    Path a date takes to another calendar, with the shortcut's function when it takes one
+
+    The shortcuts start from the year, month & day, so they are only taken when those are
+    already known. A date still waiting to be decomposed is cheaper to convert through its
+    fixed-date, which leaves the converted date undecomposed as well.
+    """
+    source = type(date)
+    if source is to:
+        return IDENTITY, None
+
+    shortcut = _SHORTCUTS.get((source, to))
+    if shortcut is not None and date._year is not None:
+        return shortcut
+    return FIXED, None
+
+
+def conversion_path(date: Date, to: Type[Date]) -> str:
+    """Which path `convert` takes for this date, the shortcuts depend on it being decomposed"""
+    return _route(date, to)[0]
+
+
+def convert(date: Date, to: Type[Date]) -> Date:
+    """The same day in another calendar"""
+    path, shortcut = _route(date, to)
+    if shortcut is not None:
+        return shortcut(date)
+    if path == IDENTITY:
+        return date
+    return to().from_fixed(date.fixed)
+
+
+def convert_many(dates: Iterable[Date], to: Type[Date]) -> List[Date]:
+    return [convert(date, to) for date in dates]
+
+
+def convert_unique(dates: Iterable[Date], to: Type[Date]) -> List[Date]:
+    """
+    Convert dates to another calendar, converting each distinct date only once
+
+    Dates are immutable so repeated inputs share the same converted object.
+    """
+    converted: Dict[Date, Date] = {}
+    results = []
+    for date in dates:
+        target = converted.get(date)
+        if target is None:
+            target = converted[date] = convert(date, to)
+        results.append(target)
+    return results
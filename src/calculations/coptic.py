@@ -1,13 +1,15 @@
-from copy import copy
 from math import floor
-from typing import Union
+from typing import Tuple, Union
 
 from .constants import *
 from .base import Date, rd, day_of_week_from_fixed, DateFormatException
 
 
 class Coptic(Date):
+    __slots__ = ()
+
     epoch: int = rd(Epoch.Coptic)
+    eras = ("A.M.", "")
     month_names = [
         "Thoot",
         "Paope",
@@ -25,30 +27,18 @@ class Coptic(Date):
     ]
     day_names = ["Tkyriakē", "Pesnau", "Pshoment", "Peftoou", "Ptiou", "Psoou", "Psabbaton"]
 
-    def __init__(self):
-        self.month_lengths = copy(COPTIC_MONTH_LENGTHS)
-        self._year = None
-        self._month = None
-        self._day = None
-        self.rata_die = None
-
     def from_date(self, y: int, m: int, d: int) -> "Coptic":
         """Poor-man's Constructor when providing YYYY-MM-DD"""
-        self._year = int(y)
-        self._month = int(m) - 1
-        self._day = int(d)
-        self.rata_die = self._fixed_from_date()
-
-        if self.is_leapyear:
-            self.month_lengths[EPAGOMENE - 1] += 1  # 5 -> 6
-
+        self._assert_blank()
+        self._set_date(int(y), int(m), int(d))
         self._verify()
+        self._set_fixed(self._fixed_from_date())
         return self
 
     def from_fixed(self, fixed_date: Union[int, float]) -> "Coptic":
         """Poor-man's Constructor when providing Rata Die Fixed Date"""
-        self.rata_die = fixed_date
-        self._date_from_fixed()
+        self._assert_blank()
+        self._set_fixed(fixed_date)  # YYYY-MM-DD is calculated when first used
         return self
 
     def __repr__(self) -> str:
@@ -69,21 +59,18 @@ class Coptic(Date):
         if self._month < 0 or self._month > 12:
             raise DateFormatException(f"{self.month} falls outside of the 1-13 valid months")
 
-        if self.day < 0 or self.day > self.month_duration:
+        if self.day < 1 or self.day > self.month_duration:
             raise DateFormatException(
                 f"{self.day} falls outside of {self.month_name}'s {self.month_duration} days"
             )
 
     @property
     def year_name(self) -> str:
-        postfix = ""
-        if self.year >= 1:
-            postfix = "A.M."
-        return f"{self.year} {postfix}"
+        return f"{self.year} {self.eras[self.year < 1]}"
 
     @property
     def month_name(self) -> str:
-        return self.month_names[self._month]
+        return self.month_names[self.month - 1]
 
     @property
     def day_name(self) -> str:
@@ -99,15 +86,20 @@ class Coptic(Date):
         """Day of Week"""
         return self.day_names[self.dow]
 
+    @property
+    def month_lengths(self) -> Tuple[int, ...]:
+        """Shared, read-only month lengths for the current year"""
+        return COPTIC_LEAP_MONTH_LENGTHS if self.is_leapyear else COPTIC_MONTH_LENGTHS
+
     @property
     def month_duration(self) -> int:
         """Obtain the number of days in the month"""
-        return self.month_lengths[self._month]
+        return self.month_lengths[self.month - 1]
 
     @property
     def is_leapyear(self) -> bool:
         """True if the current year is a leap year"""
-        return coptic_leap_year(self._year)
+        return coptic_leap_year(self.year)
 
     @property
     def pretty_display(self) -> str:
@@ -117,25 +109,44 @@ class Coptic(Date):
     def fixed(self) -> Union[int, float]:
         return self.rata_die
 
+    @classmethod
+    def days_in_month(cls, year: int, month: int) -> int:
+        lengths = COPTIC_LEAP_MONTH_LENGTHS if coptic_leap_year(year) else COPTIC_MONTH_LENGTHS
+        return lengths[month - 1]
+
+    @classmethod
+    def days_in_year(cls, year: int) -> int:
+        return 366 if coptic_leap_year(year) else 365
+
+    @classmethod
+    def leap_years_before(cls, year: int) -> int:
+        return coptic_leap_years_before(year)
+
+    @classmethod
+    def months_in_year(cls, year: int) -> int:
+        return 13
+
     def _fixed_from_date(self) -> Union[int, float]:
         """Relatively simple calculate to obtain fixed-date from YYYY-MM-DD"""
-
-        return (
-            self.epoch
-            - 1
-            + 365 * (self.year - 1)
-            + floor(self.year / 4)
-            + 30 * (self._month)
-            + self.day
-        )
+        return fixed_from_coptic(self._year, self.month, self._day)
 
     def _date_from_fixed(self) -> None:
         """Calculate the Coptic YYYY-MM-DD from a fixed-date"""
 
-        self._year = floor((4 * (self.rata_die - self.epoch) + 1463) / 1461)
-        self.month = floor((self.rata_die - Coptic().from_date(self.year, 1, 1).fixed) / 30) + 2
-        self._day = self.rata_die + 1 - Coptic().from_date(self.year, self.month, 1).fixed
+        fixed_date = floor(self.rata_die)
+        year = (4 * (fixed_date - self.epoch) + 1463) // 1461
+        month = (fixed_date - fixed_from_coptic(year, 1, 1)) // 30 + 1
+        self._set_date(year, month, fixed_date + 1 - fixed_from_coptic(year, month, 1))
 
 
 def coptic_leap_year(year: int) -> bool:
     return year % 4 == 3
+
+
+def coptic_leap_years_before(year: int) -> int:
+    """Leap years from year 1 up to `year`, negative below year 1, so differences count ranges"""
+    return year // 4
+
+
+def fixed_from_coptic(year: int, month: int, day: int) -> int:
+    return rd(Epoch.Coptic) - 1 + 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
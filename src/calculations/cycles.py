@@ -0,0 +1,128 @@
+"""
+Cycle-table engine for the periodic calendars
+
+Julian, Coptic and Ethiopic dates repeat every 1461 days (4 years) and Gregorian dates every
+146097 days (400 years). One cycle is stored as a table of packed (year in cycle, month, day)
+so any fixed-date is resolved with one divmod and one lookup.
+
+    use_cycle_engine(Gregorian)       # Gregorian().from_fixed now reads the table
+    use_arithmetic_engine(Gregorian)  # back to the division chain
+
+Switching replaces the calendar's `_date_from_fixed`, the engine not in use costs nothing. The
+replacement goes through `base._set_implementation`, so an instrumented `_date_from_fixed` stays
+instrumented and disabling instrumentation keeps the engine.
+"""
+
+from array import array
+from functools import lru_cache
+from math import floor
+from typing import Dict, Tuple, Type
+
+from .base import Date, _implementation, _set_implementation
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .gregorian import Gregorian
+from .julian import Julian
+
+ARITHMETIC_ENGINE = "arithmetic"
+CYCLE_ENGINE = "cycle"
+
+# Days & years in the cycle of each periodic calendar
+CALENDAR_CYCLES: Dict[Type[Date], Tuple[int, int]] = {
+    Gregorian: (146097, 400),
+    Julian: (1461, 4),
+    Coptic: (1461, 4),
+    Ethiopic: (1461, 4),
+}
+
+_ARITHMETIC: Dict[Type[Date], object] = {
+    calendar: _implementation(calendar, "_date_from_fixed") for calendar in CALENDAR_CYCLES
+}
+_ENGINES: Dict[Type[Date], str] = {}
+
+
+def _pack(year_in_cycle: int, month: int, day: int) -> int:
+    return year_in_cycle << 9 | month << 5 | day
+
+
+class DateCycle:
+    """
+    One cycle of a periodic calendar starting at its epoch
+
+    `table[i]` is the packed date `i` days into a cycle: the 0-based year within the cycle in
+    the high bits, then 4 bits of month and 5 bits of day.
+    """
+
+    def __init__(self, calendar: Type[Date]):
+        if calendar not in CALENDAR_CYCLES:
+            raise TypeError(f"{calendar.__name__} has no cycle table")
+
+        self.calendar = calendar
+        self.epoch = calendar.epoch
+        self.days, self.years = CALENDAR_CYCLES[calendar]
+
+        # The arithmetic conversions of the first cycle, which starts in year 1
+        self.table = array("I", bytes(4 * self.days))
+        for i, date in enumerate(calendar.iter_days(self.epoch, self.epoch + self.days)):
+            self.table[i] = _pack(date.year - 1, date.month, date.day)
+
+    def year_month_day(self, fixed_date: int) -> Tuple[int, int, int]:
+        cycles, day_in_cycle = divmod(fixed_date - self.epoch, self.days)
+        packed = self.table[day_in_cycle]
+        year = self.years * cycles + (packed >> 9) + 1
+        if self.calendar is Julian and year <= 0:
+            year -= 1  # No year 0 in the Julian Calendar
+        return year, packed >> 5 & 15, packed & 31
+
+    def year_month_day_array(self, fixed_dates):
+        """Year, month & day arrays of an array of fixed-dates, the table viewed by NumPy"""
+        import numpy as np
+
+        from .batch import _as_fixed
+
+        cycles, day_in_cycle = np.divmod(_as_fixed(fixed_dates) - self.epoch, self.days)
+        packed = np.frombuffer(self.table, dtype=np.uint32)[day_in_cycle].astype(np.int64)
+        year = self.years * cycles + (packed >> 9) + 1
+        if self.calendar is Julian:
+            year = np.where(year <= 0, year - 1, year)
+        return year, packed >> 5 & 15, packed & 31
+
+
+@lru_cache(maxsize=None)
+def date_cycle(calendar: Type[Date]) -> DateCycle:
+    """The calendar's cycle table, built on first use"""
+    return DateCycle(calendar)
+
+
+def _cycle_date_from_fixed(cycle: DateCycle):
+    epoch, days, years, table = cycle.epoch, cycle.days, cycle.years, cycle.table
+    skips_year_zero = cycle.calendar is Julian
+
+    def _date_from_fixed(self) -> None:
+        """Look up the YYYY-MM-DD of a fixed-date in the calendar's cycle table"""
+
+        cycles, day_in_cycle = divmod(floor(self.rata_die) - epoch, days)
+        packed = table[day_in_cycle]
+        year = years * cycles + (packed >> 9) + 1
+        if skips_year_zero and year <= 0:
+            year -= 1
+        self._set_date(year, packed >> 5 & 15, packed & 31)
+
+    return _date_from_fixed
+
+
+def use_cycle_engine(calendar: Type[Date]) -> None:
+    _set_implementation(calendar, "_date_from_fixed", _cycle_date_from_fixed(date_cycle(calendar)))
+    _ENGINES[calendar] = CYCLE_ENGINE
+
+
+def use_arithmetic_engine(calendar: Type[Date]) -> None:
+    if calendar not in _ARITHMETIC:
+        raise TypeError(f"{calendar.__name__} has no cycle table")
+    _set_implementation(calendar, "_date_from_fixed", _ARITHMETIC[calendar])
+    _ENGINES.pop(calendar, None)
+
+
+def calendar_engine(calendar: Type[Date]) -> str:
+    """Name of the engine converting the calendar's fixed-dates"""
+    return _ENGINES.get(calendar, ARITHMETIC_ENGINE)
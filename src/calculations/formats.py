@@ -0,0 +1,290 @@
+"""
+strftime-like formatting and parsing of dates, with specs compiled once per calendar
+
+    strftime(Julian().from_date(-44, 3, 15), "%A %B %o, %N %E")  # "Wednesday March 15th, 44 B.C."
+    strptime("15 Nisan 5782", Hebrew, "%-d %B %-Y")              # Hebrew(5782, 01, 15)
+
+    spec = date_format(Gregorian, "%Y-%m-%d")  # compiled & cached, reuse it for bulk work
+    spec.format_fixed_array(fixed_dates)       # list of strings
+    spec.parse_array(strings)                  # years, months, days & a mask of the valid rows
+
+Directives, the `-` flag drops the zero padding of %-Y, %-m & %-d:
+    %Y  year, signed & zero padded to 4 digits like the command line's YYYY-MM-DD
+    %N  year within its era (44 for 44 B.C.), %E the era (A.D./B.C., A.M., E.E.)
+    %m  month number, %B month name (Adar I & Adar II in Hebrew leap years)
+    %d  day of the month, %o with its ordinal indicator (15th)
+    %A  weekday name, %w weekday number with Sunday as 0
+    %%  a literal %
+
+A format compiles to a single `str.format` template over the year, month, day & weekday and
+their names, and a parse to a single regular expression. Weekday names are matched when
+parsing, not checked.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set, Tuple, Type
+
+from .base import Date, DateFormatException, day_of_week_from_fixed
+from .third_party import get_ordinal_indicator
+
+ORDINAL_DAYS = tuple(f"{day}{get_ordinal_indicator(day)}" for day in range(32))
+
+_DIRECTIVE = re.compile(r"%(-?)(.)")
+
+YearMonthDay = Tuple[int, int, int]
+
+# Each directive is a field of one `str.format` template, over the same arguments for all of
+# them: the signed year, year, month, day & weekday number, then, only when a field of the
+# template reads one, the year within its era, era, month name, ordinal day & weekday name
+_TEMPLATE_FIELDS = {
+    ("Y", False): "{0:>04}",  # -0044 arrives as text, positive years are padded by the spec
+    ("Y", True): "{1}",
+    ("m", False): "{2:02}",
+    ("m", True): "{2}",
+    ("d", False): "{3:02}",
+    ("d", True): "{3}",
+    ("w", False): "{4}",
+    ("N", False): "{5}",
+    ("E", False): "{6}",
+    ("B", False): "{7}",
+    ("o", False): "{8}",
+    ("A", False): "{9}",
+    ("%", False): "%",
+}
+_NAMED_DIRECTIVES = {"N", "E", "B", "o", "A"}
+
+
+def _names_pattern(names: Iterable[str]) -> str:
+    """Alternation of the names, longest first so Adar II is not read as Adar"""
+    return "|".join(re.escape(name) for name in sorted(set(names), key=len, reverse=True) if name)
+
+
+def _escape(literal: str) -> str:
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+def _compile_format(calendar: Type[Date], template: str, directives: Set[str], counts_back: bool):
+    """
+    Formatters of YYYY-MM-DD & weekday and of dates, one `str.format` call per date
+
+    The names are only looked up for templates which use them, and the month names which
+    depend on the year only for calendars which have them.
+    """
+
+    fill = template.format
+    named = bool(directives & _NAMED_DIRECTIVES)
+    uses_weekday = bool(directives & {"A", "w"})
+    eras, month_names, day_names = calendar.eras, calendar.month_names, calendar.day_names
+    month_name = None  # named the same every year, read from the table
+    if "_month_name" in vars(calendar) and "B" in directives:
+        month_name = calendar._month_name
+
+    def format_parts(y: int, m: int, d: int, w: int) -> str:
+        signed = y if y >= 0 else f"-{-y:04}"
+        if not named:
+            return fill(signed, y, m, d, w)
+        return fill(
+            signed,
+            y,
+            m,
+            d,
+            w,
+            -y if counts_back and y < 1 else y,
+            eras[y < 1],
+            month_names[m - 1] if month_name is None else month_name(y, m),
+            ORDINAL_DAYS[d],
+            day_names[w],
+        )
+
+    def format_date(date: Date) -> str:
+        if date._year is None:  # not yet decomposed
+            y, m, d = date.year, date.month, date.day
+        else:
+            y, m, d = date._year, date._month + 1, date._day
+        w = day_of_week_from_fixed(date.rata_die) if uses_weekday else 0
+        if not named:  # the common numeric formats, without a second call
+            return fill(y if y >= 0 else f"-{-y:04}", y, m, d, w)
+        return format_parts(y, m, d, w)
+
+    return format_parts, format_date
+
+
+class DateFormat:
+    """
+    A format spec compiled for one calendar, see the module documentation for the directives
+
+    Build them through `date_format`, which keeps the compiled specs.
+    """
+
+    def __init__(self, calendar: Type[Date], spec: str):
+        self.calendar = calendar
+        self.spec = spec
+
+        counts_back = bool(calendar.eras[1])  # years before 1 are named, as 1 B.C.
+        month_names = {name: i + 1 for i, name in enumerate(calendar.month_names)}
+        if "_month_name" in vars(calendar):  # months named differently in some years
+            leap_names = (calendar._month_name(year, m) for year in range(1, 20) for m in (12, 13))
+            month_names.update({name: 12 for name in leap_names if name not in month_names})
+
+        template, patterns, found = [], [], set()
+        position = 0
+        for match in _DIRECTIVE.finditer(spec):
+            literal = spec[position : match.start()]
+            template.append(_escape(literal))
+            patterns.append(r"\s+".join(re.escape(part) for part in literal.split(" ")))
+            position = match.end()
+
+            unpadded, directive = match.group(1) == "-", match.group(2)
+            if unpadded and directive not in "Ymd":
+                raise ValueError(f"%-{directive} in {spec!r}, only %Y, %m & %d can be unpadded")
+            if directive in found and directive != "%":
+                raise ValueError(f"%{directive} appears more than once in {spec!r}")
+            found.add(directive)
+
+            if directive == "Y":
+                patterns.append(r"(?P<Y>-?\d+)")
+            elif directive == "N":
+                patterns.append(r"(?P<N>\d+)" if counts_back else r"(?P<N>-?\d+)")
+            elif directive == "E":
+                optional = "?" if "" in calendar.eras else ""
+                patterns.append(f"(?P<E>{_names_pattern(calendar.eras)}){optional}")
+            elif directive == "m":
+                patterns.append(r"(?P<m>\d{1,2})")
+            elif directive == "B":
+                patterns.append(f"(?P<B>{_names_pattern(month_names)})")
+            elif directive == "d":
+                patterns.append(r"(?P<d>\d{1,2})")
+            elif directive == "o":
+                patterns.append(r"(?P<o>\d{1,2})(?:st|nd|rd|th)")
+            elif directive == "A":
+                patterns.append(f"(?:{_names_pattern(calendar.day_names)})")
+            elif directive == "w":
+                patterns.append("[0-6]")
+            elif directive == "%":
+                patterns.append("%")
+            else:
+                raise ValueError(f"Unknown directive %{directive} in {spec!r}")
+            template.append(_TEMPLATE_FIELDS[directive, unpadded])
+
+        literal = spec[position:]
+        template.append(_escape(literal))
+        patterns.append(r"\s+".join(re.escape(part) for part in literal.split(" ")))
+
+        self.uses_weekday = bool(found & {"A", "w"})
+        self._template = "".join(template)
+        self._format, self._format_date = _compile_format(
+            calendar, self._template, found, counts_back
+        )
+
+        self._pattern = re.compile(r"\s*" + "".join(patterns) + r"\s*$")
+        self._month_numbers = month_names
+        self._counts_back = counts_back
+        self.parsable = bool(found & {"Y", "N"} and found & {"m", "B"} and found & {"d", "o"})
+
+    def __repr__(self) -> str:
+        return f"DateFormat({self.calendar.__name__}, {self.spec!r})"
+
+    # === Formatting ===
+
+    def format_parts(
+        self, year: int, month: int, day: int, fixed_date: Optional[int] = None
+    ) -> str:
+        """Format YYYY-MM-DD, the fixed-date is only needed, and found if missing, for weekdays"""
+        weekday = 0
+        if self.uses_weekday:
+            if fixed_date is None:
+                fixed_date = self.calendar().from_date(year, month, day).fixed
+            weekday = day_of_week_from_fixed(fixed_date)
+        return self._format(year, month, day, weekday)
+
+    def format(self, date: Date) -> str:
+        return self._format_date(date)
+
+    def format_many(self, dates: Iterable[Date]) -> List[str]:
+        return list(map(self._format_date, dates))
+
+    def format_fixed_array(self, fixed_dates) -> List[str]:
+        """Format an array of fixed-dates, converted in bulk without any date objects"""
+        import numpy as np
+
+        from .batch import _as_fixed, batch_from_fixed, day_of_week_from_fixed_array
+
+        fixed = _as_fixed(np.ravel(fixed_dates))
+        years, months, days = batch_from_fixed(self.calendar, fixed)
+        if self.uses_weekday:
+            weekdays = day_of_week_from_fixed_array(fixed).tolist()
+        else:
+            weekdays = [0] * len(fixed)
+        return list(map(self._format, years.tolist(), months.tolist(), days.tolist(), weekdays))
+
+    # === Parsing ===
+
+    def _match(self, text: str) -> Optional[YearMonthDay]:
+        """YYYY-MM-DD of the text, not validated, None when it does not match the spec"""
+        if not self.parsable:
+            raise ValueError(f"{self.spec!r} needs a year, a month & a day to be parsed")
+
+        match = self._pattern.match(text)
+        if match is None:
+            return None
+        parts = match.groupdict()
+
+        if parts.get("Y") is not None:
+            year = int(parts["Y"])
+        else:
+            year = int(parts["N"])
+            if self._counts_back and parts.get("E") == self.calendar.eras[1]:
+                year = -year
+        if parts.get("m") is not None:
+            month = int(parts["m"])
+        else:
+            month = self._month_numbers[parts["B"]]
+        day = int(parts["d"] if parts.get("d") is not None else parts["o"])
+        return year, month, day
+
+    def parse_parts(self, text: str) -> YearMonthDay:
+        """YYYY-MM-DD of the text, without validating them"""
+        parts = self._match(text)
+        if parts is None:
+            raise DateFormatException(f"{text!r} does not match {self.spec!r}")
+        return parts
+
+    def parse(self, text: str) -> Date:
+        return self.calendar().from_date(*self.parse_parts(text))
+
+    def parse_many(self, texts: Iterable[str]) -> List[Date]:
+        return [self.parse(text) for text in texts]
+
+    def parse_array(self, texts: Iterable[str]):
+        """
+        Year, month & day arrays of the texts, and the mask of those which are valid dates
+
+        Rows which do not match the spec or are not dates, like `validate_dates_array` finds
+        them, are masked out instead of raising. Their parts are 0 when they do not match.
+        """
+        import numpy as np
+
+        from .batch import validate_dates_array
+
+        match = self._match
+        parsed = [match(text) for text in texts]
+        matched = np.array([parts is not None for parts in parsed], dtype=bool)
+        table = np.array([parts or (0, 0, 0) for parts in parsed], dtype=np.int64).reshape(-1, 3)
+        years, months, days = table.T.copy()
+        valid, _ = validate_dates_array(self.calendar, years, months, days)
+        return years, months, days, matched & valid
+
+
+@lru_cache(maxsize=256)
+def date_format(calendar: Type[Date], spec: str) -> DateFormat:
+    """The spec compiled for the calendar, compiled once and shared"""
+    return DateFormat(calendar, spec)
+
+
+def strftime(date: Date, spec: str) -> str:
+    return date_format(type(date), spec).format(date)
+
+
+def strptime(text: str, calendar: Type[Date], spec: str) -> Date:
+    return date_format(calendar, spec).parse(text)
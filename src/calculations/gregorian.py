@@ -1,6 +1,5 @@
-from copy import copy
 from math import floor
-from typing import Union
+from typing import Tuple, Union
 
 from .constants import *
 from .third_party import get_ordinal_indicator
@@ -8,6 +7,8 @@ from .base import Date, rd, day_of_week_from_fixed, DateFormatException
 
 
 class Gregorian(Date):
+    __slots__ = ()
+
     epoch: int = rd(Epoch.Gregorian)
     month_names = [
         "January",
@@ -33,30 +34,18 @@ class Gregorian(Date):
         "Saturday",
     ]
 
-    def __init__(self):
-        self.month_lengths = copy(JULIAN_MONTH_LENGTHS)
-        self._year = None
-        self._month = None
-        self._day = None
-        self.rata_die = None
-
     def from_date(self, y: int, m: int, d: int) -> "Gregorian":
         """Poor-man's Constructor when providing YYYY-MM-DD"""
-        self._year = int(y)
-        self._month = int(m) - 1
-        self._day = int(d)
-        self.rata_die = self._fixed_from_date()
-
-        if self.is_leapyear:
-            self.month_lengths[FEBRUARY - 1] += 1  # 28 -> 29
-
+        self._assert_blank()
+        self._set_date(int(y), int(m), int(d))
         self._verify()
+        self._set_fixed(self._fixed_from_date())
         return self
 
     def from_fixed(self, fixed_date: Union[int, float]) -> "Gregorian":
         """Poor-man's Constructor when providing Rata Die Fixed Date"""
-        self.rata_die = floor(fixed_date)
-        self._date_from_fixed()
+        self._assert_blank()
+        self._set_fixed(floor(fixed_date))  # YYYY-MM-DD is calculated when first used
         return self
 
     def __repr__(self) -> str:
@@ -77,7 +66,7 @@ class Gregorian(Date):
         if self._month < 0 or self._month > 11:
             raise DateFormatException(f"{self.month} falls outside of the 1-12 valid months")
 
-        if self.day < 0 or self.day > self.month_duration:
+        if self.day < 1 or self.day > self.month_duration:
             raise DateFormatException(
                 f"{self.day} falls outside of {self.month_name}'s {self.month_duration} days"
             )
@@ -88,7 +77,7 @@ class Gregorian(Date):
 
     @property
     def month_name(self) -> str:
-        return self.month_names[self._month]
+        return self.month_names[self.month - 1]
 
     @property
     def day_name(self) -> str:
@@ -106,15 +95,20 @@ class Gregorian(Date):
         """Day of Week"""
         return self.day_names[self.dow]
 
+    @property
+    def month_lengths(self) -> Tuple[int, ...]:
+        """Shared, read-only month lengths for the current year"""
+        return JULIAN_LEAP_MONTH_LENGTHS if self.is_leapyear else JULIAN_MONTH_LENGTHS
+
     @property
     def month_duration(self) -> int:
         """Obtain the number of days in the month"""
-        return self.month_lengths[self._month]
+        return self.month_lengths[self.month - 1]
 
     @property
     def is_leapyear(self) -> bool:
         """True if the current year is a leap year"""
-        return gregorian_leap_year(self._year)
+        return gregorian_leap_year(self.year)
 
     @property
     def pretty_display(self) -> str:
@@ -124,64 +118,90 @@ class Gregorian(Date):
     def fixed(self) -> Union[int, float]:
         return self.rata_die
 
-    def _fixed_from_date(self) -> Union[int, float]:
-        prior_y = self.year - 1
+    @classmethod
+    def days_in_month(cls, year: int, month: int) -> int:
+        lengths = JULIAN_LEAP_MONTH_LENGTHS if gregorian_leap_year(year) else JULIAN_MONTH_LENGTHS
+        return lengths[month - 1]
 
-        if self.month <= 2:
-            february_correction = 0
-        elif self.is_leapyear:
-            february_correction = -1
-        else:
-            february_correction = -2
+    @classmethod
+    def days_in_year(cls, year: int) -> int:
+        return 366 if gregorian_leap_year(year) else 365
+
+    @classmethod
+    def leap_years_before(cls, year: int) -> int:
+        return gregorian_leap_years_before(year)
 
-        sum_of_days_in_previous_months = (
-            floor((367 * self.month - 362) / 12) + february_correction
-        )
-        total_leap_days = floor((prior_y) / 4) - floor((prior_y) / 100) + floor((prior_y) / 400)
-        sum_of_days_in_previous_years = 365 * (self.year - 1) + total_leap_days
+    @classmethod
+    def months_in_year(cls, year: int) -> int:
+        return 12
 
-        return (
-            (self.epoch - 1)
-            + sum_of_days_in_previous_years
-            + sum_of_days_in_previous_months
-            + self.day  # day of current month
-        )
+    def _fixed_from_date(self) -> Union[int, float]:
+        return fixed_from_gregorian(self._year, self.month, self._day)
 
     def _year_from_fixed(self) -> int:
         """Gregorian Year from a Rata Die fixed-date"""
-
-        d0 = self.rata_die - self.epoch  # Prior Days
-        n400 = floor(d0 / 146097)  # Completed 400-year cycles
-        d1 = d0 % 146097  # Prior days not in n400
-        n100 = floor(d1 / 36524)  # 100-year cycles not in n400
-        d2 = d1 % 36524  # Prior days not in n400 or n100
-        n4 = floor(d2 / 1461)  # 4-year cycels not in n400 or n100
-        d3 = d2 % 1461  # Prior days not in n400, n100, or n4
-        n1 = floor(d3 / 365)  # years not in n400, n100, or n4
-
-        year = 400 * n400 + 100 * n100 + 4 * n4 + n1
-
-        if n100 != 4 and n1 != 4:  # If date falls in a leap year
-            year += 1
-
-        return year
+        return gregorian_year_from_fixed(self.rata_die)
 
     def _date_from_fixed(self) -> None:
         """Calculate the Gregorian YYYY-MM-DD from a fixed-date"""
 
-        self.year = self._year_from_fixed()
-        prior_days = self.rata_die - Gregorian().from_date(self.year, JANUARY, 1).fixed
+        year = gregorian_year_from_fixed(self.rata_die)
+        prior_days = self.rata_die - fixed_from_gregorian(year, JANUARY, 1)
 
-        if self.rata_die < Gregorian().from_date(self.year, MARCH, 1).fixed:
+        if self.rata_die < fixed_from_gregorian(year, MARCH, 1):
             correction = 0
-        elif self.is_leapyear:
+        elif gregorian_leap_year(year):
             correction = 1
         else:
             correction = 2
 
-        self.month = floor((12 * (prior_days + correction) + 373) / 367)
-        self.day = self.rata_die - Gregorian().from_date(self._year, self.month, 1).fixed + 1
+        month = (12 * (prior_days + correction) + 373) // 367
+        self._set_date(year, month, self.rata_die - fixed_from_gregorian(year, month, 1) + 1)
 
 
 def gregorian_leap_year(year: int) -> bool:
     return year % 4 == 0 and not year % 400 in (100, 200, 300)
+
+
+def gregorian_leap_years_before(year: int) -> int:
+    """Leap years from year 1 up to `year`, negative below year 1, so differences count ranges"""
+    return (year - 1) // 4 - (year - 1) // 100 + (year - 1) // 400
+
+
+def fixed_from_gregorian(year: int, month: int, day: int) -> int:
+    prior_y = year - 1
+
+    if month <= 2:
+        february_correction = 0
+    elif gregorian_leap_year(year):
+        february_correction = -1
+    else:
+        february_correction = -2
+
+    sum_of_days_in_previous_months = (367 * month - 362) // 12 + february_correction
+    total_leap_days = prior_y // 4 - prior_y // 100 + prior_y // 400
+    sum_of_days_in_previous_years = 365 * prior_y + total_leap_days
+
+    return (
+        (rd(Epoch.Gregorian) - 1)
+        + sum_of_days_in_previous_years
+        + sum_of_days_in_previous_months
+        + day  # day of current month
+    )
+
+
+def gregorian_year_from_fixed(fixed_date: int) -> int:
+    """Gregorian Year from a Rata Die fixed-date"""
+
+    d0 = fixed_date - rd(Epoch.Gregorian)  # Prior Days
+    n400, d1 = divmod(d0, 146097)  # Completed 400-year cycles, prior days not in n400
+    n100, d2 = divmod(d1, 36524)  # 100-year cycles not in n400, prior days not in n400 or n100
+    n4, d3 = divmod(d2, 1461)  # 4-year cycles not in n400 or n100, prior days not in those
+    n1 = d3 // 365  # years not in n400, n100, or n4
+
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+
+    if n100 != 4 and n1 != 4:  # If date falls in a leap year
+        year += 1
+
+    return year
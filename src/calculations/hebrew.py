@@ -1,13 +1,21 @@
-from copy import copy
+from bisect import bisect_right
+from dataclasses import dataclass
 from math import floor
-from typing import Union
+from typing import Dict, Tuple, Union
 
 from .constants import *
-from .base import Date, rd, day_of_week_from_fixed, DateFormatException, hr
+from .base import Date, rd, day_of_week_from_fixed, DateFormatException
+from .cache import BoundedCache
+
+# Year-level values are recomputed many times per conversion, keep the recent ones around
+HEBREW_CACHE = BoundedCache(capacity=8192)
 
 
 class Hebrew(Date):
+    __slots__ = ()
+
     epoch: int = rd(Epoch.Hebrew)
+    first_month: int = TISHRI
     month_names = [
         "Nisan",
         "Iyyar",
@@ -33,27 +41,19 @@ class Hebrew(Date):
         "yom shabbat",
     ]
 
-    def __init__(self):
-        self.month_lengths = copy(HEBREW_MONTH_LENGTHS)
-        self._year = None
-        self._month = None
-        self._day = None
-        self.rata_die = None
-
     def from_date(self, y: int, m: int, d: int) -> "Hebrew":
         """Poor-man's Constructor when providing YYYY-MM-DD"""
-        self._year = int(y)
-        self._month = int(m) - 1
-        self._day = int(d)
-        self.rata_die = self._fixed_from_date()
-
-        self._verify()
+        self._assert_blank()
+        self._set_date(int(y), int(m), int(d))
+        self._verify()  # the month offsets are only defined for valid months
+        self._set_fixed(self._fixed_from_date())
         return self
 
     def from_fixed(self, fixed_date: Union[int, float]) -> "Hebrew":
         """Poor-man's Constructor when providing Rata Die Fixed Date"""
-        self.rata_die = fixed_date
-        self._date_from_fixed()
+        self._assert_blank()
+        _check_hebrew_fixed(fixed_date)  # here rather than when YYYY-MM-DD is first used
+        self._set_fixed(fixed_date)  # YYYY-MM-DD is calculated when first used
         return self
 
     def __repr__(self) -> str:
@@ -71,18 +71,18 @@ class Hebrew(Date):
     def _verify(self) -> None:
         """Verify the legitimacy of the provided YYYY-MM-DD"""
 
-        if self._year == 0:
-            raise DateFormatException(f"No year 0 in the Hebrew Calendar")
+        if self._year < 1:
+            raise DateFormatException(f"Hebrew years start at 1 AM, {self._year} is before it")
 
         months_in_year = last_month_in_hebrew_year(self.year)
 
-        if self._month < 0 or self._month > months_in_year:
+        if self.month < 1 or self.month > months_in_year:
             raise DateFormatException(
                 f"{self.month} falls outside of the 1-{months_in_year} valid months for the year"
             )
 
         days_in_month = last_day_of_hebrew_month(self.year, self.month)
-        if self.day < 0 or self.day > days_in_month:
+        if self.day < 1 or self.day > days_in_month:
             raise DateFormatException(
                 f"{self.day} falls outside of {self.month_name}'s {days_in_month} days"
             )
@@ -90,13 +90,11 @@ class Hebrew(Date):
     @property
     def year_name(self) -> str:
 
-        return f"{abs(self._year)}"
+        return f"{abs(self.year)}"
 
     @property
     def month_name(self) -> str:
-        if self.is_leapyear:
-            self.month_names[11] = "Adar I"
-        return self.month_names[self._month]
+        return self._month_name(self.year, self.month)
 
     @property
     def day_name(self) -> str:
@@ -114,15 +112,20 @@ class Hebrew(Date):
         """Day of Week"""
         return self.day_names[self.dow]
 
+    @property
+    def month_lengths(self) -> Tuple[int, ...]:
+        """Shared, read-only month lengths for the current year"""
+        return hebrew_year_type(self.year).month_lengths
+
     @property
     def month_duration(self) -> int:
         """Obtain the number of days in the month"""
-        return self.month_lengths[self._month]
+        return self.month_lengths[self.month - 1]
 
     @property
     def is_leapyear(self) -> bool:
         """True if the current year is a leap year"""
-        return hebrew_leap_year(self._year)
+        return hebrew_leap_year(self.year)
 
     @property
     def pretty_display(self) -> str:
@@ -132,58 +135,96 @@ class Hebrew(Date):
     def fixed(self) -> Union[int, float]:
         return self.rata_die
 
+    @classmethod
+    def days_in_month(cls, year: int, month: int) -> int:
+        return hebrew_year_type(year).month_lengths[month - 1]
+
+    @classmethod
+    def days_in_year(cls, year: int) -> int:
+        return days_in_hebrew_year(year)
+
+    @classmethod
+    def leap_years_before(cls, year: int) -> int:
+        return hebrew_leap_years_before(year)
+
+    @classmethod
+    def months_in_year(cls, year: int) -> int:
+        return last_month_in_hebrew_year(year)
+
+    @classmethod
+    def _month_name(cls, year: int, month: int) -> str:
+        if month == ADAR and hebrew_leap_year(year):
+            return "Adar I"
+        return cls.month_names[month - 1]
+
+    @classmethod
+    def _next_month(cls, year: int, month: int) -> Tuple[int, int]:
+        """The year changes at Tishri, and Nisan follows the last Adar"""
+        if month == ELUL:
+            return year + 1, TISHRI
+        if month == last_month_in_hebrew_year(year):
+            return year, NISAN
+        return year, month + 1
+
+    @classmethod
+    def _month_before(cls, fixed_date: int) -> Tuple[int, int]:
+        """Spans reaching back to the epoch are counted from Elul of the year 0 before it"""
+        if fixed_date <= cls.epoch:
+            return 0, ELUL
+        return super()._month_before(fixed_date)
+
+    @classmethod
+    def _month_number(cls, year: int, month: int) -> int:
+        return hebrew_months_elapsed(year, month)
+
+    @classmethod
+    def _month_from_number(cls, number: int) -> Tuple[int, int]:
+        """Inverse of `hebrew_months_elapsed`, the year is the last one with its Tishri <= number"""
+        year = (19 * number + 252) // 235
+        month_of_year = number - hebrew_months_elapsed(year, TISHRI)  # 0 for Tishri
+        months_to_nisan = last_month_in_hebrew_year(year) - TISHRI + 1
+        if month_of_year < months_to_nisan:
+            return year, TISHRI + month_of_year
+        return year, NISAN + month_of_year - months_to_nisan
+
+    @classmethod
+    def _same_month(cls, year: int, month: int, other_year: int) -> int:
+        """The last month of the year maps to the last month, Adar to Adar II and back"""
+        if month == last_month_in_hebrew_year(year):
+            return last_month_in_hebrew_year(other_year)
+        return month
+
     def _fixed_from_date(self) -> Union[int, float]:
-        """"""
-
-        if self.month < TISHRI:
-            summed_days = sum(
-                [
-                    last_day_of_hebrew_month(self.year, m)
-                    for m in range(TISHRI, last_month_in_hebrew_year(self.year) + 1)
-                ]
-            ) + sum([last_day_of_hebrew_month(self.year, m) for m in range(NISAN, self.month)])
-        else:
-            summed_days = sum(
-                [last_day_of_hebrew_month(self.year, m) for m in range(TISHRI, self.month)]
-            )
+        """New year plus the offset of the month from the year's type"""
 
-        return hebrew_new_year(self.year) + self.day - 1 + summed_days
+        month_start = hebrew_year_type(self.year).month_starts[self._month]
+        return hebrew_new_year(self.year) + month_start + self.day - 1
 
     def _date_from_fixed(self) -> None:
         """Calculate the Hebrew YYYY-MM-DD from a fixed-date"""
-        approx = floor((98496 / 35975351) * (self.rata_die - self.epoch)) + 1
-
-        y = 1 - approx  # There is a discrepancy between the book and code: y = approx - 1
-        while True:
-            if hebrew_new_year(y) <= self.rata_die:
-                y += 1
-            else:
-                break
-        self.year = y - 1
-
-        if self.rata_die < Hebrew().from_date(self.year, NISAN, 1).fixed:
-            start = TISHRI
-        else:
-            start = NISAN
 
-        m = start
-        while True:
-            test_fixed_date = (
-                Hebrew().from_date(self.year, m, last_day_of_hebrew_month(self.year, m)).fixed
-            )
-            if self.rata_die <= test_fixed_date:
-                break
-            else:
-                m += 1
+        year = hebrew_year_from_fixed(self.rata_die)
+        year_type = hebrew_year_type(year)
+        day_of_year = self.rata_die - hebrew_new_year(year)
 
-        self.month = m
-        self.day = self.rata_die - Hebrew().from_date(self.year, self.month, 1).fixed + 1
+        i = bisect_right(year_type.ordered_starts, day_of_year) - 1
+        month = year_type.ordered_months[i]
+        self._set_date(year, month, day_of_year - year_type.ordered_starts[i] + 1)
 
 
 def hebrew_leap_year(year: int) -> bool:
     return (7 * year + 1) % 19 < 7
 
 
+def hebrew_leap_years_before(year: int) -> int:
+    """
+    Leap years from year 1 up to `year`, negative below year 1, so differences count ranges
+
+    The months elapsed before a year are 12 per year plus one per leap year.
+    """
+    return (7 * year - 6) // 19
+
+
 def hebrew_sabbatical_year(year: int) -> bool:
     """No longer has calendrical significance"""
     return year % 7 == 0
@@ -196,23 +237,37 @@ def last_month_in_hebrew_year(year: int) -> int:
         return ADAR
 
 
+def hebrew_months_elapsed(year: int, month: int) -> int:
+    """Months from the first molad of the calendar to the molad of the month"""
+    y = year + 1 if month < TISHRI else year
+    return month - TISHRI + (235 * y - 234) // 19
+
+
+def molad_in_halakim(year: int, month: int) -> int:
+    """
+    Moment of the mean new moon in halakim (parts) since the start of RD 0, exactly
+
+    There are 25920 parts in a day, the molad of a month is whole parts so integers hold it
+    without the rounding of fractional days.
+    """
+    months_elapsed = hebrew_months_elapsed(year, month)
+    return rd(Epoch.Hebrew) * HALAKIM_PER_DAY - 876 + months_elapsed * MEAN_SYNODIC_MONTH_HALAKIM
+
+
 def molad(year: int, month: int) -> float:
-    y = year
-    if month < TISHRI:
-        y += 1
-    months_elapsed = month - TISHRI + floor((235 * y - 234) / 19)
-    return rd(Epoch.Hebrew) - (876 / 25920) + months_elapsed * (29 + hr(12) + (793 / 25920))
+    return molad_in_halakim(year, month) / HALAKIM_PER_DAY
 
 
 def hebrew_cal_elapsed_days(year: int) -> int:
-    months_elapsed = floor((235 * year - 234) / 19)
+    months_elapsed = (235 * year - 234) // 19
     parts_elapsed = 12084 + 13753 * months_elapsed
-    days = 29 * months_elapsed + floor(parts_elapsed / 25920)
+    days = 29 * months_elapsed + parts_elapsed // HALAKIM_PER_DAY
     if ((3 * (days + 1)) % 7) < 3:
         days += 1
     return days
 
 
+@HEBREW_CACHE.memoize
 def hebrew_year_length_correction(year: int) -> int:
     ny0 = hebrew_cal_elapsed_days(year - 1)
     ny1 = hebrew_cal_elapsed_days(year)
@@ -227,10 +282,42 @@ def hebrew_year_length_correction(year: int) -> int:
     return result
 
 
+@HEBREW_CACHE.memoize
 def hebrew_new_year(year: int) -> int:
     return rd(Epoch.Hebrew) + hebrew_cal_elapsed_days(year) + hebrew_year_length_correction(year)
 
 
+def _check_hebrew_fixed(fixed_date: Union[int, float]) -> None:
+    """
+    Reject fixed-dates before 1 Tishri 1 AM
+
+    Code stepping back a day from a valid date, `from_fixed(start - 1)` for the span counts,
+    must not do so from the epoch itself. `Hebrew._month_before` is where the counts do it.
+    """
+    if fixed_date < rd(Epoch.Hebrew):
+        raise DateFormatException(f"{fixed_date} is before the Hebrew epoch, RD {Epoch.Hebrew}")
+
+
+def hebrew_year_from_fixed(fixed_date: Union[int, float]) -> int:
+    """
+    Hebrew year containing the fixed-date
+
+    The approximation never overshoots and, for any date in the historical range, is off by at
+    most one year. Only the one or two candidate new years around it are evaluated instead of
+    stepping through every year since the epoch.
+
+    Years are counted from 1 Tishri 1 AM, earlier fixed-dates raise a DateFormatException.
+    """
+    _check_hebrew_fixed(fixed_date)
+    approx = 98496 * (floor(fixed_date) - rd(Epoch.Hebrew)) // 35975351 + 1  # integers, exact
+
+    year = approx - 1  # year = MAX y >= approx - 1 such that new-year(y) <= date
+    while hebrew_new_year(year + 1) <= fixed_date:
+        year += 1
+    return year
+
+
+@HEBREW_CACHE.memoize
 def days_in_hebrew_year(year: int) -> int:
     return hebrew_new_year(year + 1) - hebrew_new_year(year)
 
@@ -248,3 +335,94 @@ def last_day_of_hebrew_month(year: int, month: int) -> int:
 
     else:
         return 30
+
+
+# === Year Types ===
+
+
+@dataclass(frozen=True)
+class HebrewYearType:
+    """
+    Keviah: a Hebrew year is fully determined by the weekday of its new year and its length
+
+    Only 14 combinations occur, each with fixed month lengths, so the day offsets from
+    1 Tishri to the start of every month are precomputed once per type.
+    """
+
+    new_year_dow: int
+    length: int
+    month_starts: Tuple[int, ...]  # Days from 1 Tishri, indexed by month - 1
+    month_lengths: Tuple[int, ...]  # Indexed by month - 1, Adar II is 0 in common years
+    ordered_months: Tuple[int, ...]  # Months in the order they occur, Tishri first
+    ordered_starts: Tuple[int, ...]  # month_starts in the same order, ascending
+
+    @property
+    def is_leapyear(self) -> bool:
+        return self.length > 355
+
+    @property
+    def last_month(self) -> int:
+        return ADAR_II if self.is_leapyear else ADAR
+
+    def month_length(self, month: int) -> int:
+        return self.month_lengths[month - 1]
+
+
+def _build_hebrew_year_type(new_year_dow: int, length: int) -> HebrewYearType:
+    leap = length > 355
+    long_marheshvan = length in (355, 385)
+    short_kislev = length in (353, 383)
+
+    ordered_months = tuple(range(TISHRI, (ADAR_II if leap else ADAR) + 1)) + tuple(
+        range(NISAN, TISHRI)
+    )
+    ordered_starts = []
+    month_lengths = [0] * ADAR_II
+    elapsed = 0
+    for month in ordered_months:
+        ordered_starts.append(elapsed)
+        if (
+            month in (IYYAR, TAMMUZ, ELUL, TEVET, ADAR_II)
+            or (month == ADAR and not leap)
+            or (month == MARHESHVAN and not long_marheshvan)
+            or (month == KISLEV and short_kislev)
+        ):
+            month_lengths[month - 1] = 29
+        else:
+            month_lengths[month - 1] = 30
+        elapsed += month_lengths[month - 1]
+
+    if elapsed != length:
+        raise ValueError(f"{length} is not a valid Hebrew year length")
+
+    starts = dict(zip(ordered_months, ordered_starts))
+    month_starts = tuple(starts.get(m, starts[NISAN]) for m in range(NISAN, ADAR_II + 1))
+
+    return HebrewYearType(
+        new_year_dow=new_year_dow,
+        length=length,
+        month_starts=month_starts,
+        month_lengths=tuple(month_lengths),
+        ordered_months=ordered_months,
+        ordered_starts=tuple(ordered_starts),
+    )
+
+
+HEBREW_YEAR_TYPES: Dict[Tuple[int, int], HebrewYearType] = {
+    (dow, length): _build_hebrew_year_type(dow, length)
+    for length, weekdays in (
+        (353, (SHENI, SHABBAT)),
+        (354, (SHELISHI, HAMISHI)),
+        (355, (SHENI, HAMISHI, SHABBAT)),
+        (383, (SHENI, HAMISHI, SHABBAT)),
+        (384, (SHELISHI,)),
+        (385, (SHENI, HAMISHI, SHABBAT)),
+    )
+    for dow in weekdays
+}
+
+
+def hebrew_year_type(year: int) -> HebrewYearType:
+    """Characterize a Hebrew year by its new year's weekday and length"""
+    new_year = hebrew_new_year(year)
+    return HEBREW_YEAR_TYPES[(day_of_week_from_fixed(new_year), days_in_hebrew_year(year))]
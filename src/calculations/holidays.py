@@ -0,0 +1,109 @@
+"""
+Hebrew holidays and fasts for ranges of years
+
+    hebrew_holiday(5783, "passover")                  # 738616, April 6, 2023
+    list(iter_hebrew_holidays(5780, 5790, ["purim"]))  # [(5780, "purim", 737494), ...]
+
+A holiday falls on the same number of days after Rosh Hashanah in every year of the same type
+(the weekday of the new year and the length of the year), postponements included. Those offsets
+are tabled once for the 14 year types, so each year costs one new year and one type lookup.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .constants import *
+from .hebrew import HEBREW_YEAR_TYPES, HebrewYearType, hebrew_new_year, hebrew_year_type
+
+
+@dataclass(frozen=True)
+class HebrewHoliday:
+    """
+    A day of the Hebrew year, moved when it falls on one of the `postponements` weekdays
+
+    `leap_month` is the month the day is kept in during leap years, Purim is in Adar II.
+    """
+
+    month: int
+    day: int
+    leap_month: Optional[int] = None
+    postponements: Tuple[Tuple[int, int], ...] = ()  # (weekday, days moved)
+
+    def offset(self, year_type: HebrewYearType) -> int:
+        """Days from Rosh Hashanah to the holiday in years of the type"""
+
+        month = self.month
+        if year_type.is_leapyear and self.leap_month is not None:
+            month = self.leap_month
+        days = year_type.month_starts[month - 1] + self.day - 1
+        weekday = (year_type.new_year_dow + days) % 7
+        return days + dict(self.postponements).get(weekday, 0)
+
+
+# In the order they fall in the year, which starts with Tishri
+HEBREW_HOLIDAYS: Dict[str, HebrewHoliday] = {
+    "rosh_hashanah": HebrewHoliday(TISHRI, 1),
+    "tzom_gedaliah": HebrewHoliday(TISHRI, 3, postponements=((SHABBAT, 1),)),
+    "yom_kippur": HebrewHoliday(TISHRI, 10),
+    "sukkot": HebrewHoliday(TISHRI, 15),
+    "shemini_atzeret": HebrewHoliday(TISHRI, 22),
+    "hanukkah": HebrewHoliday(KISLEV, 25),
+    "tzom_tevet": HebrewHoliday(TEVET, 10),
+    "taanit_esther": HebrewHoliday(ADAR, 13, ADAR_II, postponements=((SHABBAT, -2),)),
+    "purim": HebrewHoliday(ADAR, 14, ADAR_II),
+    "passover": HebrewHoliday(NISAN, 15),
+    "shavuot": HebrewHoliday(SIVAN, 6),
+    "tzom_tammuz": HebrewHoliday(TAMMUZ, 17, postponements=((SHABBAT, 1),)),
+    "tishah_beav": HebrewHoliday(AV, 9, postponements=((SHABBAT, 1),)),
+}
+
+# Days after the new year of every holiday, by (new year weekday, year length)
+HEBREW_HOLIDAY_OFFSETS: Dict[Tuple[int, int], Dict[str, int]] = {
+    key: {name: holiday.offset(year_type) for name, holiday in HEBREW_HOLIDAYS.items()}
+    for key, year_type in HEBREW_YEAR_TYPES.items()
+}
+
+
+def _holiday_offsets(year: int) -> Dict[str, int]:
+    year_type = hebrew_year_type(year)
+    return HEBREW_HOLIDAY_OFFSETS[(year_type.new_year_dow, year_type.length)]
+
+
+def hebrew_holiday(year: int, name: str) -> int:
+    """Fixed-date of the holiday in the Hebrew year, after any postponement"""
+    if name not in HEBREW_HOLIDAYS:
+        raise KeyError(f"Unknown Hebrew holiday {name!r}")
+    return hebrew_new_year(year) + _holiday_offsets(year)[name]
+
+
+def hebrew_holidays(year: int) -> Dict[str, int]:
+    """Fixed-dates of every holiday in the Hebrew year, in the order they fall"""
+    new_year = hebrew_new_year(year)
+    return {name: new_year + offset for name, offset in _holiday_offsets(year).items()}
+
+
+def iter_hebrew_holidays(
+    first_year: int, last_year: int, names: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[int, str, int]]:
+    """
+    (year, name, fixed-date) of the holidays from `first_year` through `last_year`
+
+    Every holiday by default, otherwise only `names`. Holidays come in chronological order.
+    """
+
+    names = list(HEBREW_HOLIDAYS if names is None else names)
+    for name in names:
+        if name not in HEBREW_HOLIDAYS:
+            raise KeyError(f"Unknown Hebrew holiday {name!r}")
+    names.sort(key=list(HEBREW_HOLIDAYS).index)
+
+    for year in range(first_year, last_year + 1):
+        new_year = hebrew_new_year(year)
+        offsets = _holiday_offsets(year)
+        for name in names:
+            yield year, name, new_year + offsets[name]
+
+
+def hebrew_sabbatical_years(first_year: int, last_year: int) -> range:
+    """The years from `first_year` through `last_year` which are `hebrew_sabbatical_year`"""
+    return range(first_year + (-first_year) % 7, last_year + 1, 7)
@@ -0,0 +1,187 @@
+"""
+Opt-in call counters and timers for the calendar kernels
+
+Instrumentation is off by default and then costs nothing: the functions are only wrapped while
+it is enabled and unwrapped when it is disabled. Wrapping goes through `base._set_wrapper`, so
+an engine chosen in the meantime (`cycles.use_cycle_engine`) is kept, and timed, either way.
+
+    with instrumented() as stats:
+        [Hebrew().from_fixed(fixed_date).month_name for fixed_date in range(738000, 739000)]
+    stats["hebrew.hebrew_new_year"]  # CallStats(calls=..., seconds=...)
+
+Times are inclusive, a function's time contains the time of the functions it calls. Functions
+imported by name into another module of the package (`gregorian` imports
+`day_of_week_from_fixed`) are wrapped there too, under the same counter.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from threading import RLock
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from . import base as _base
+from . import coptic as _coptic
+from . import ethiopian as _ethiopian
+from . import formats as _formats
+from . import gregorian as _gregorian
+from . import hebrew as _hebrew
+from . import holidays as _holidays
+from . import julian as _julian
+from .base import _implementation, _set_wrapper
+
+
+@dataclass(frozen=True)
+class CallStats:
+    calls: int
+    seconds: float
+
+
+INSTRUMENTED_FUNCTIONS = {
+    _base: ("rd", "day_of_week_from_fixed"),
+    _hebrew: (
+        "hebrew_leap_year",
+        "last_month_in_hebrew_year",
+        "hebrew_months_elapsed",
+        "molad",
+        "molad_in_halakim",
+        "hebrew_cal_elapsed_days",
+        "hebrew_year_length_correction",
+        "hebrew_new_year",
+        "hebrew_year_from_fixed",
+        "days_in_hebrew_year",
+        "last_day_of_hebrew_month",
+        "hebrew_year_type",
+    ),
+}
+
+# Modules binding instrumented functions with `from ... import`, their copies are wrapped too
+_IMPORTING_MODULES = (_coptic, _ethiopian, _formats, _gregorian, _hebrew, _holidays, _julian)
+
+INSTRUMENTED_METHODS = {
+    _base.Date: ("_assert_blank", "_set_date", "_set_fixed"),
+    **{
+        calendar: ("from_date", "from_fixed", "_verify", "_fixed_from_date", "_date_from_fixed")
+        for calendar in (
+            _coptic.Coptic,
+            _ethiopian.Ethiopic,
+            _gregorian.Gregorian,
+            _hebrew.Hebrew,
+            _julian.Julian,
+        )
+    },
+}
+
+_lock = RLock()
+_counters: Dict[str, List] = {}  # name -> [calls, seconds]
+_wrapped: List[Tuple[object, str]] = []  # (owner, attribute) to unwrap
+
+
+def _timer(name: str) -> Callable[[object], object]:
+    """Wrapper of an implementation, methods and classmethods alike, counting under `name`"""
+
+    def wrap(implementation):
+        if isinstance(implementation, classmethod):
+            return classmethod(_timed(name, implementation.__func__))
+        return _timed(name, implementation)
+
+    return wrap
+
+
+def _timed(name: str, func: Callable) -> Callable:
+    counter = _counters.setdefault(name, [0, 0.0])
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                counter[0] += 1
+                counter[1] += elapsed
+
+    return wrapper
+
+
+def _targets() -> Iterator[Tuple[object, str, str]]:
+    """(owner, attribute, counter name) of everything instrumented"""
+
+    for module, names in INSTRUMENTED_FUNCTIONS.items():
+        short_name = module.__name__.rsplit(".", 1)[-1]
+        for name in names:
+            yield module, name, f"{short_name}.{name}"
+            function = _implementation(module, name)
+            for importer in _IMPORTING_MODULES:
+                if importer is not module and vars(importer).get(name) is function:
+                    yield importer, name, f"{short_name}.{name}"
+
+    for cls, names in INSTRUMENTED_METHODS.items():
+        for name in names:
+            yield cls, name, f"{cls.__name__}.{name}"
+
+
+def instrumentation_enabled() -> bool:
+    return bool(_wrapped)
+
+
+def enable_instrumentation() -> None:
+    """Wrap the kernels with counting timers, counts continue from their current values"""
+
+    with _lock:
+        if _wrapped:
+            return
+        for owner, attribute, name in _targets():
+            _set_wrapper(owner, attribute, _timer(name))
+            _wrapped.append((owner, attribute))
+
+
+def disable_instrumentation() -> None:
+    """Unwrap the functions, the counts are kept until reset"""
+
+    with _lock:
+        while _wrapped:
+            _set_wrapper(*_wrapped.pop(), None)
+
+
+def reset_instrumentation() -> None:
+    with _lock:
+        for counter in _counters.values():
+            counter[:] = [0, 0.0]
+
+
+def instrumentation_snapshot() -> Dict[str, CallStats]:
+    """Counts of every function called since the last reset, most time first"""
+
+    with _lock:
+        stats = {name: CallStats(*counter) for name, counter in _counters.items() if counter[0]}
+    return dict(sorted(stats.items(), key=lambda item: -item[1].seconds))
+
+
+@contextmanager
+def instrumented() -> Iterator[Dict[str, CallStats]]:
+    """
+    Instrument a block of code, the yielded dictionary is filled with its counts on exit
+
+    Counts outside of the block are left alone, so blocks can be nested or used while
+    instrumentation is enabled globally.
+    """
+
+    stats: Dict[str, CallStats] = {}
+    was_enabled = instrumentation_enabled()
+    enable_instrumentation()
+    before = instrumentation_snapshot()
+    try:
+        yield stats
+    finally:
+        after = instrumentation_snapshot()
+        if not was_enabled:
+            disable_instrumentation()
+
+        empty = CallStats(0, 0.0)
+        for name, total in after.items():
+            calls = total.calls - before.get(name, empty).calls
+            if calls:
+                stats[name] = CallStats(calls, total.seconds - before.get(name, empty).seconds)
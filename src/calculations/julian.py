@@ -1,6 +1,5 @@
-from copy import copy
 from math import floor
-from typing import Union
+from typing import Tuple, Union
 
 from .constants import *
 from .third_party import get_ordinal_indicator
@@ -8,7 +7,10 @@ from .base import Date, rd, day_of_week_from_fixed, DateFormatException
 
 
 class Julian(Date):
+    __slots__ = ()
+
     epoch: int = rd(Epoch.Julian)
+    eras = ("A.D.", "B.C.")  # 1 B.C. is year -1, there is no year 0
     month_names = [
         "January",
         "February",
@@ -33,30 +35,18 @@ class Julian(Date):
         "Saturday",
     ]
 
-    def __init__(self):
-        self.month_lengths = copy(JULIAN_MONTH_LENGTHS)
-        self._year = None
-        self._month = None
-        self._day = None
-        self.rata_die = None
-
     def from_date(self, y: int, m: int, d: int) -> "Julian":
         """Poor-man's Constructor when providing YYYY-MM-DD"""
-        self._year = int(y)
-        self._month = int(m) - 1
-        self._day = int(d)
-        self.rata_die = self._fixed_from_date()
-
-        if self.is_leapyear:
-            self.month_lengths[FEBRUARY - 1] += 1  # 28 -> 29
-
+        self._assert_blank()
+        self._set_date(int(y), int(m), int(d))
         self._verify()
+        self._set_fixed(self._fixed_from_date())
         return self
 
     def from_fixed(self, fixed_date: Union[int, float]) -> "Julian":
         """Poor-man's Constructor when providing Rata Die Fixed Date"""
-        self.rata_die = fixed_date
-        self._date_from_fixed()
+        self._assert_blank()
+        self._set_fixed(fixed_date)  # YYYY-MM-DD is calculated when first used
         return self
 
     def __repr__(self) -> str:
@@ -80,22 +70,18 @@ class Julian(Date):
         if self._month < 0 or self._month > 11:
             raise DateFormatException(f"{self.month} falls outside of the 1-12 valid months")
 
-        if self.day < 0 or self.day > self.month_duration:
+        if self.day < 1 or self.day > self.month_duration:
             raise DateFormatException(
                 f"{self.day} falls outside of {self.month_name}'s {self.month_duration} days"
             )
 
     @property
     def year_name(self) -> str:
-        postfix = "A.D."
-        if self._year < 0:
-            postfix = "B.C."
-
-        return f"{abs(self._year)} {postfix}"
+        return f"{abs(self.year)} {self.eras[self.year < 0]}"
 
     @property
     def month_name(self) -> str:
-        return self.month_names[self._month]
+        return self.month_names[self.month - 1]
 
     @property
     def day_name(self) -> str:
@@ -113,15 +99,20 @@ class Julian(Date):
         """Day of Week"""
         return self.day_names[self.dow]
 
+    @property
+    def month_lengths(self) -> Tuple[int, ...]:
+        """Shared, read-only month lengths for the current year"""
+        return JULIAN_LEAP_MONTH_LENGTHS if self.is_leapyear else JULIAN_MONTH_LENGTHS
+
     @property
     def month_duration(self) -> int:
         """Obtain the number of days in the month"""
-        return self.month_lengths[self._month]
+        return self.month_lengths[self.month - 1]
 
     @property
     def is_leapyear(self) -> bool:
         """True if the current year is a leap year"""
-        return julian_leap_year(self._year)
+        return julian_leap_year(self.year)
 
     @property
     def pretty_display(self) -> str:
@@ -131,50 +122,87 @@ class Julian(Date):
     def fixed(self) -> Union[int, float]:
         return self.rata_die
 
+    @classmethod
+    def days_in_month(cls, year: int, month: int) -> int:
+        lengths = JULIAN_LEAP_MONTH_LENGTHS if julian_leap_year(year) else JULIAN_MONTH_LENGTHS
+        return lengths[month - 1]
+
+    @classmethod
+    def days_in_year(cls, year: int) -> int:
+        return 366 if julian_leap_year(year) else 365
+
+    @classmethod
+    def leap_years_before(cls, year: int) -> int:
+        return julian_leap_years_before(year)
+
+    @classmethod
+    def months_in_year(cls, year: int) -> int:
+        return 12
+
+    @classmethod
+    def _next_year(cls, year: int) -> int:
+        return 1 if year == -1 else year + 1  # No year 0 in the Julian Calendar
+
+    @classmethod
+    def _year_number(cls, year: int) -> int:
+        return year + 1 if year < 0 else year
+
+    @classmethod
+    def _year_from_number(cls, number: int) -> int:
+        return number - 1 if number <= 0 else number
+
     def _fixed_from_date(self) -> Union[int, float]:
-        y = self.year
-        if self.year < 0:
-            y += 1
-
-        if self.month <= 2:
-            february_correction = 0
-        elif self.is_leapyear:
-            february_correction = -1
-        else:
-            february_correction = -2
-
-        sum_of_days_in_previous_months = (
-            floor((367 * self.month - 362) / 12) + february_correction
-        )
-        total_leap_days = floor((y - 1) / 4)
-        sum_of_days_in_previous_years = 365 * (y - 1) + total_leap_days
-
-        return (
-            (self.epoch - 1)
-            + sum_of_days_in_previous_years
-            + sum_of_days_in_previous_months
-            + self.day  # day of current month
-        )
+        return fixed_from_julian(self._year, self.month, self._day)
 
     def _date_from_fixed(self) -> None:
         """Calculate the Julian YYYY-MM-DD from a fixed-date"""
 
-        approx = floor((4 * (self.rata_die - self.epoch) + 1464) / 1461)
-        self.year = approx
+        fixed_date = floor(self.rata_die)
+        approx = (4 * (fixed_date - self.epoch) + 1464) // 1461
+        year = approx
         if approx <= 0:
-            self.year = approx - 1
+            year = approx - 1
 
         correction = 2
-        if self.rata_die < Julian().from_date(self.year, MARCH, 1).fixed:
+        if fixed_date < fixed_from_julian(year, MARCH, 1):
             correction = 0
-        elif self.is_leapyear:
+        elif julian_leap_year(year):
             correction = 1
 
-        prior_days = self.rata_die - Julian().from_date(self.year, JANUARY, 1).fixed
+        prior_days = fixed_date - fixed_from_julian(year, JANUARY, 1)
 
-        self.month = floor((12 * (prior_days + correction) + 373) / 367)
-        self.day = floor(self.rata_die - Julian().from_date(self.year, self.month, 1).fixed + 1)
+        month = (12 * (prior_days + correction) + 373) // 367
+        self._set_date(year, month, fixed_date - fixed_from_julian(year, month, 1) + 1)
 
 
 def julian_leap_year(year: int) -> bool:
     return year % 4 == [3, 0][year > 0]  # if year is positive, look for 0 remainder
+
+
+def julian_leap_years_before(year: int) -> int:
+    """Leap years from year 1 up to `year`, negative below year 1, so differences count ranges"""
+    return (year + (year < 0) - 1) // 4  # 1 B.C. is leap, as is every 4th year before it
+
+
+def fixed_from_julian(year: int, month: int, day: int) -> int:
+    y = year
+    if year < 0:
+        y += 1
+
+    if month <= 2:
+        february_correction = 0
+    elif julian_leap_year(year):
+        february_correction = -1
+    else:
+        february_correction = -2
+
+    sum_of_days_in_previous_months = (367 * month - 362) // 12 + february_correction
+    total_leap_days = (y - 1) // 4
+    sum_of_days_in_previous_years = 365 * (y - 1) + total_leap_days
+
+    return (
+        (rd(Epoch.Julian) - 1)
+        + sum_of_days_in_previous_years
+        + sum_of_days_in_previous_months
+        + day  # day of current month
+    )
@@ -0,0 +1,277 @@
+"""
+Precomputed Rata Die to YYYY-MM-DD tables, memory-mapped for conversions inside a fixed span
+
+    ../calendrical-calculations $ python3 -m src.calculations.tables dates.tbl \
+        --start-year -10000 --end-year 10000
+
+    table = DateTable("dates.tbl")
+    table.from_fixed(Hebrew, 738040)  # Hebrew(5782, 07, 01), read from the table
+
+The file holds one packed record per day for each calendar. It is mapped read-only, so every
+process converting with the same file shares one copy of it through the page cache. Dates
+outside of the table are converted by the calendar classes as usual.
+
+Layout, all little-endian:
+    header     magic, version, number of calendars, first fixed-date, number of days
+    directory  (calendar name, offset of its records) for each calendar
+    records    (year int32, month uint8, day uint8) for every day, in fixed-date order
+
+Days a calendar has no date for, the Hebrew ones before its epoch, hold the record 0-00-00.
+"""
+
+import argparse
+import mmap
+import operator
+import os
+import struct
+from bisect import bisect_left
+from contextlib import suppress
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from .base import Date
+from .coptic import Coptic
+from .ethiopian import Ethiopic
+from .gregorian import Gregorian, fixed_from_gregorian
+from .hebrew import Hebrew
+from .julian import Julian
+
+TABLE_MAGIC = b"CALTABLE"
+TABLE_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHqq")
+_DIRECTORY_ENTRY = struct.Struct("<16sq")
+_RECORD = struct.Struct("<iBB")
+
+RECORDS_PER_CHUNK = 1 << 18  # days converted at once while writing, bounds the memory used
+
+TABLE_CALENDARS: Dict[str, Type[Date]] = {
+    calendar.__name__.lower(): calendar
+    for calendar in (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+}
+
+# Calendars whose dates start at their epoch, the days before it have no record
+FIRST_FIXED_DATES: Dict[Type[Date], int] = {Hebrew: Hebrew.epoch}
+
+MISSING = (0, 0, 0)  # record of a day the calendar has no date for, no month is 0
+
+YearMonthDay = Tuple[int, int, int]
+
+
+class DateTableException(Exception):
+    pass
+
+
+# === Writing ===
+
+
+def _records_with_numpy(calendar: Type[Date], start: int, end: int) -> Optional[bytes]:
+    try:
+        import numpy as np
+
+        from .batch import batch_from_fixed
+    except ImportError:
+        return None
+
+    first = min(max(start, FIRST_FIXED_DATES.get(calendar, start)), end)
+    year, month, day = batch_from_fixed(calendar, np.arange(first, end, dtype=np.int64))
+    records = np.zeros(end - start, dtype=[("year", "<i4"), ("month", "u1"), ("day", "u1")])
+    dated = records[first - start :]
+    dated["year"], dated["month"], dated["day"] = year, month, day
+    return records.tobytes()
+
+
+def _records(calendar: Type[Date], start: int, end: int) -> Iterator[bytes]:
+    """Packed records of every day in [start, end), in chunks, with NumPy when it is installed"""
+
+    for chunk_start in range(start, end, RECORDS_PER_CHUNK):
+        chunk_end = min(chunk_start + RECORDS_PER_CHUNK, end)
+        records = _records_with_numpy(calendar, chunk_start, chunk_end)
+        if records is None:
+            pack = _RECORD.pack
+            first = min(max(chunk_start, FIRST_FIXED_DATES.get(calendar, chunk_start)), chunk_end)
+            days = calendar.iter_days(first, chunk_end) if first < chunk_end else ()
+            records = pack(*MISSING) * (first - chunk_start)
+            records += b"".join(pack(d.year, d.month, d.day) for d in days)
+        yield records
+
+
+def write_date_table(
+    path: str, start: int, end: int, calendars: Iterable[Type[Date]] = TABLE_CALENDARS.values()
+) -> None:
+    """
+    Write the table of the fixed-dates `start` up to, but excluding, `end`
+
+    The table is written next to `path` and only moved onto it once complete, a failed write
+    leaves neither a partial table nor the previous one damaged.
+    """
+
+    if end <= start:
+        raise DateTableException(f"Empty span {start} to {end}")
+    calendars = list(calendars)
+    days = end - start
+
+    offset = _HEADER.size + _DIRECTORY_ENTRY.size * len(calendars)
+    directory = []
+    for calendar in calendars:
+        directory.append(_DIRECTORY_ENTRY.pack(calendar.__name__.lower().encode(), offset))
+        offset += days * _RECORD.size
+
+    temporary = f"{path}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(calendars), start, days))
+            f.writelines(directory)
+            for calendar in calendars:
+                f.writelines(_records(calendar, start, end))
+        os.replace(temporary, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(temporary)
+        raise
+
+
+# === Reading ===
+
+
+class _DateColumn(Sequence):
+    """The records of one calendar as a read-only sequence of (year, month, day)"""
+
+    def __init__(self, buffer: mmap.mmap, offset: int, days: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._days = days
+
+    def __len__(self) -> int:
+        return self._days
+
+    def __getitem__(self, i: int) -> YearMonthDay:
+        return _RECORD.unpack_from(self._buffer, self._offset + i * _RECORD.size)
+
+
+class DateTable:
+    """
+    Read-only view of a table written by `write_date_table`
+
+    Lookups index straight into the mapped file, nothing is copied or converted up front.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, self.start, self.days = _HEADER.unpack_from(self._buffer)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            self._buffer.close()
+            raise DateTableException(f"{path} is not a version {TABLE_VERSION} date table")
+        self.end = self.start + self.days
+
+        self._columns: Dict[Type[Date], _DateColumn] = {}
+        for i in range(count):
+            name, offset = _DIRECTORY_ENTRY.unpack_from(
+                self._buffer, _HEADER.size + i * _DIRECTORY_ENTRY.size
+            )
+            calendar = TABLE_CALENDARS[name.rstrip(b"\0").decode()]
+            self._columns[calendar] = _DateColumn(self._buffer, offset, self.days)
+
+    def __enter__(self) -> "DateTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    @property
+    def calendars(self) -> List[Type[Date]]:
+        return list(self._columns)
+
+    def __contains__(self, fixed_date: Union[int, float]) -> bool:
+        return self.start <= fixed_date < self.end
+
+    def lookup(self, calendar: Type[Date], fixed_date: int) -> Optional[YearMonthDay]:
+        """YYYY-MM-DD of an integer fixed-date, None when the table does not hold it"""
+        column = self._columns.get(calendar)
+        if column is None or not self.start <= fixed_date < self.end:
+            return None
+        parts = column[fixed_date - self.start]
+        return None if parts == MISSING else parts
+
+    def from_fixed(self, calendar: Type[Date], fixed_date: Union[int, float]) -> Date:
+        """Same as `calendar().from_fixed(fixed_date)`, reading integer fixed-dates from the table"""
+
+        try:
+            fixed = operator.index(fixed_date)  # any integer, NumPy's from `array` included
+        except TypeError:
+            return calendar().from_fixed(fixed_date)
+
+        parts = self.lookup(calendar, fixed)
+        if parts is not None:
+            return calendar._from_parts(*parts, fixed)
+        return calendar().from_fixed(fixed)
+
+    def fixed_from_date(self, calendar: Type[Date], year: int, month: int, day: int) -> int:
+        """
+        Fixed-date of YYYY-MM-DD by a binary search of the records
+
+        Dates outside of the table, or not found in it because they do not exist, go through
+        `from_date` which validates them.
+        """
+
+        column = self._columns.get(calendar)
+        if column is not None:
+            first_month = calendar.first_month
+
+            def chronological(parts: YearMonthDay) -> tuple:  # Hebrew years start in Tishri
+                y, m, d = parts
+                return y, m < first_month, m, d
+
+            target = (year, month, day)
+            i = bisect_left(column, chronological(target), key=chronological)
+            if target != MISSING and i < len(column) and column[i] == target:
+                return self.start + i
+        return calendar().from_date(year, month, day).fixed
+
+    def array(self, calendar: Type[Date]):
+        """
+        The calendar's records as a NumPy structured array over the mapped file, without copying
+
+        The array keeps the mapping alive, the table can only be closed once it is released.
+        Days without a date in the calendar are 0-00-00 rows.
+        """
+        import numpy as np
+
+        column = self._columns[calendar]
+        dtype = np.dtype([("year", "<i4"), ("month", "u1"), ("day", "u1")])
+        return np.frombuffer(self._buffer, dtype=dtype, count=self.days, offset=column._offset)
+
+
+# === Command Line ===
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m src.calculations.tables",
+        description="Precompute a memory-mappable Rata Die to YYYY-MM-DD table",
+    )
+    parser.add_argument("output", help="table file to write")
+    parser.add_argument("--start-year", type=int, default=-10000, help="first Gregorian year")
+    parser.add_argument("--end-year", type=int, default=10000, help="last Gregorian year")
+    parser.add_argument(
+        "--calendars",
+        default=",".join(TABLE_CALENDARS),
+        help="comma separated, all of them by default",
+    )
+    args = parser.parse_args(argv)
+
+    calendars = [TABLE_CALENDARS[name.strip()] for name in args.calendars.split(",")]
+    start = fixed_from_gregorian(args.start_year, 1, 1)
+    end = fixed_from_gregorian(args.end_year + 1, 1, 1)
+    write_date_table(args.output, start, end, calendars)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
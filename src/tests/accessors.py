@@ -0,0 +1,101 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew, DateFormatException
+from ..calculations.accessors import CALENDARS, calendar_class
+
+fixed_dates = np.arange(-1000, 800000, 97, dtype=np.int64)
+series = pd.Series(fixed_dates, index=fixed_dates * 2, name="rd")
+
+
+# === Agreement with the Classes ===
+
+for name, calendar in CALENDARS.items():
+    view = series.cal.to(name)
+    dates = [calendar().from_fixed(fixed_date) for fixed_date in fixed_dates.tolist()]
+
+    assert view.year.tolist() == [d.year for d in dates], f"❌ {name} years"
+    assert view.month.tolist() == [d.month for d in dates], f"❌ {name} months"
+    assert view.day.tolist() == [d.day for d in dates], f"❌ {name} days"
+    assert view.day_of_week.tolist() == [d.dow for d in dates], f"❌ {name} weekdays"
+    assert view.month_name.tolist() == [
+        calendar._month_name(d.year, d.month) for d in dates
+    ], f"❌ {name} month names"
+    assert view.day_name.tolist() == [calendar.day_names[d.dow] for d in dates], f"❌ {name}"
+    assert view.month_name.dtype == "category" and view.day_name.dtype == "category", "❌"
+    assert view.year.index.equals(series.index) and view.year.name == "rd", "❌ index lost"
+
+    frame = view.to_frame()
+    assert list(frame.columns) == ["year", "month", "day"], "❌"
+    assert frame.cal.fixed(name).tolist() == fixed_dates.tolist(), f"❌ {name} round trip"
+
+assert calendar_class("Hebrew") is Hebrew and calendar_class(Coptic) is Coptic, "❌"
+try:
+    series.cal.to("mayan")
+    assert False, "❌ unknown calendar accepted"
+except KeyError:
+    pass
+
+# Adar I only in leap years, and every category is a name of the calendar
+names = pd.Series(np.arange(738000, 739500)).cal.to(Hebrew).month_name
+assert set(names.cat.categories) == {*Hebrew.month_names, "Adar I"}, "❌"
+assert {"Adar", "Adar I", "Adar II"} <= set(names), "❌"
+assert list(pd.Series([0]).cal.day_name.cat.categories) == Gregorian.day_names, "❌"
+
+
+# === Input Types ===
+
+gregorian = Gregorian().from_date(2024, 3, 1)
+days = pd.date_range("2024-03-01", periods=4, freq="D")
+expected = list(range(gregorian.fixed, gregorian.fixed + 4))
+
+assert pd.Series(days).cal.fixed.tolist() == expected, "❌ datetime64"
+assert pd.Series(days + pd.Timedelta(hours=23)).cal.fixed.tolist() == expected, "❌ times"
+in_tokyo = pd.Series(days.tz_localize("Asia/Tokyo"))
+assert in_tokyo.cal.fixed.tolist() == expected, "❌ local day"
+assert pd.Series([d.date() for d in days]).cal.fixed.tolist() == expected, "❌ datetime.date"
+assert pd.Series(expected, dtype=float).cal.fixed.tolist() == expected, "❌ floats"
+assert pd.Series(days).cal.year.tolist() == [2024] * 4, "❌ Gregorian by default"
+assert pd.Series(expected).cal.datetime64.tolist() == list(days), "❌"
+julian = pd.Series(expected).cal.to(Julian)
+assert julian.format("%-d %B %Y").tolist()[0] == "17 February 2024", "❌"
+
+try:
+    pd.Series([True]).cal.fixed
+    assert False, "❌ booleans accepted"
+except TypeError:
+    pass
+
+
+# === Missing Values ===
+
+gaps = pd.Series([gregorian.fixed, None, pd.NA, gregorian.fixed + 1], dtype="Int64")
+view = gaps.cal.to(Ethiopic)
+assert view.year.dtype == "Int64", "❌ not nullable"
+assert view.year.isna().tolist() == [False, True, True, False], "❌"
+assert view.month_name.isna().tolist() == [False, True, True, False], "❌"
+assert view.format("%Y").isna().tolist() == [False, True, True, False], "❌"
+assert pd.Series([pd.NaT, days[0]]).cal.datetime64.isna().tolist() == [True, False], "❌"
+assert pd.Series([None, datetime.date(2024, 3, 1)]).cal.fixed.tolist()[1] == gregorian.fixed
+
+
+# === Frames ===
+
+frame = pd.DataFrame(
+    {"y": [5784, 5784, None, 5783], "m": [12, 13, 1, 13], "d": [3, 3, 1, 3]}, index=list("abcd")
+)
+fixed = frame.cal.fixed("hebrew", year="y", month="m", day="d", errors="coerce")
+assert fixed.index.tolist() == list("abcd"), "❌"
+assert fixed.isna().tolist() == [False, False, True, True], "❌ not coerced"
+assert fixed["a"] == Hebrew().from_date(5784, 12, 3).fixed, "❌"
+
+try:
+    frame.cal.fixed("hebrew", year="y", month="m", day="d")
+    assert False, "❌ 5783 has no Adar II"
+except DateFormatException as error:
+    assert "'d'" in str(error), "❌ row not named"
+
+converted = frame.iloc[:2].cal.to("gregorian", "hebrew", year="y", month="m", day="d")
+assert converted.values.tolist() == [[2024, 2, 12], [2024, 3, 13]], "❌"
@@ -0,0 +1,226 @@
+import datetime
+import pickle
+
+from ..calculations import *
+
+calendars = (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+
+
+# === Calendar Structure ===
+
+assert Gregorian.days_in_month(2024, FEBRUARY) == 29, "❌"
+assert Gregorian.days_in_month(1900, FEBRUARY) == 28, "❌"
+assert Julian.days_in_month(1900, FEBRUARY) == 29, "❌"
+assert Coptic.days_in_month(1739, EPAGOMENE) == 6, "❌"
+assert Ethiopic.days_in_month(2013, PAGUEMEN) == 5, "❌"
+assert Hebrew.days_in_month(5784, KISLEV) == 29, "❌"
+assert Hebrew.days_in_year(5784) == 383, "❌"
+assert Hebrew.months_in_year(5784) == 13, "❌"
+assert Hebrew._next_month(5784, ADAR_II) == (5784, NISAN), "❌"
+assert Hebrew._next_month(5784, ELUL) == (5785, TISHRI), "❌"
+assert Julian._next_month(-1, DECEMBER) == (1, JANUARY), "❌"
+
+
+# === Iteration ===
+
+start, end = -1000, 12000  # Crosses the Julian 1 B.C. -> 1 A.D. boundary
+
+for calendar in calendars:
+    days = list(calendar.iter_days(start, end))
+    assert [d.fixed for d in days] == list(range(start, end)), f"❌ {calendar.__name__}"
+    for d in days[::7]:
+        expected = calendar().from_fixed(d.fixed)
+        assert d == expected, f"❌ {d} vs {expected}"
+        assert (d.year, d.month, d.day) == (expected.year, expected.month, expected.day), "❌"
+
+    months = list(calendar.iter_months(start, end))
+    assert months == [d for d in days if d.day == 1], f"❌ {calendar.__name__} months"
+
+    years = list(calendar.iter_years(start, end))
+    first_days = [d for d in days if d.day == 1 and d.month == calendar.first_month]
+    assert years == first_days, f"❌ {calendar.__name__} years"
+
+    print(f"✅ {calendar.__name__}: {len(days)} days, {len(months)} months, {len(years)} years")
+
+g = Gregorian().from_date(2024, 1, 15)
+assert [d.day for d in Gregorian.iter_days(g, g + 3)] == [15, 16, 17], "❌"
+assert [d.month for d in Gregorian.iter_months(g, g + 60)] == [2, 3], "❌"
+assert list(Gregorian.iter_days(g, g)) == [], "❌"
+assert [y.year for y in Hebrew.iter_years(g, g + 800)] == [5785, 5786], "❌"
+
+
+# === Lazy Decomposition ===
+
+for calendar in calendars:
+    date = calendar().from_fixed(738040)
+    assert date._year is None, f"❌ {calendar.__name__} decomposed eagerly"
+
+    # Only the fixed-date is needed for these
+    assert date.dow == TUESDAY, "❌"
+    assert date < calendar().from_fixed(738041) and date == calendar().from_fixed(738040), "❌"
+    assert (date + 1).fixed == 738041 and (date - 1).fixed == 738039, "❌"
+    assert hash(date) == hash(calendar().from_fixed(738040)), "❌"
+    assert date._year is None, f"❌ {calendar.__name__} decomposed by fixed-date operations"
+
+    copy = pickle.loads(pickle.dumps(date))
+    assert copy == date and copy._year is None, "❌"
+
+    # The first field access decomposes, once
+    expected = calendar().from_date(*tuple(calendar().from_fixed(738040)))
+    assert date.month_name == expected.month_name, "❌"
+    assert (date.year, date.month, date.day) == tuple(expected), "❌"
+    assert date._year == expected.year, "❌ decomposition not kept"
+    assert pickle.loads(pickle.dumps(date)).day == expected.day, "❌"
+
+    try:
+        date._year = 1
+        assert False, "❌ decomposed dates are still immutable"
+    except AttributeError:
+        pass
+
+
+# === Days of the Week ===
+
+for fixed_date in range(738030, 738060):
+    for k in (SUNDAY, MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY):
+        on_or_before = kday_on_or_before(k, fixed_date)
+        assert day_of_week_from_fixed(on_or_before) == k, "❌"
+        assert 0 <= fixed_date - on_or_before < 7, "❌"
+        assert 0 <= kday_on_or_after(k, fixed_date) - fixed_date < 7, "❌"
+        assert 0 < fixed_date - kday_before(k, fixed_date) <= 7, "❌"
+        assert 0 < kday_after(k, fixed_date) - fixed_date <= 7, "❌"
+        assert abs(kday_nearest(k, fixed_date) - fixed_date) <= 3, "❌"
+        assert nth_kday(1, k, fixed_date) == kday_on_or_after(k, fixed_date), "❌"
+        assert nth_kday(-1, k, fixed_date) == on_or_before, "❌"
+        assert nth_kday(3, k, fixed_date) == kday_on_or_after(k, fixed_date) + 14, "❌"
+
+assert kday_on_or_before(MONDAY, 738040.75) == 738039, "❌ fractional fixed-date"
+try:
+    nth_kday(0, MONDAY, 738040)
+    assert False, "❌ 0th k-day accepted"
+except ValueError:
+    pass
+
+g = Gregorian().from_date(2024, 10, 17)  # Thursday
+assert g.kday_on_or_after(MONDAY) == Gregorian().from_date(2024, 10, 21), "❌"
+assert g.kday_on_or_before(THURSDAY) == g and g.kday_before(THURSDAY) == g - 7, "❌"
+assert g.nth_kday(-2, SUNDAY) == Gregorian().from_date(2024, 10, 6), "❌"
+assert Gregorian.nth_kday_of_month(4, THURSDAY, 2024, NOVEMBER).day == 28, "❌ Thanksgiving"
+assert Gregorian.nth_kday_of_month(-1, MONDAY, 2024, MAY).day == 27, "❌ Memorial Day"
+assert Gregorian.nth_kday_of_month(-1, FRIDAY, 2024, MAY).day == 31, "❌ last day counts"
+
+for calendar in calendars:
+    first = calendar.nth_kday_of_month(1, SATURDAY, 5784 if calendar is Hebrew else 2016, 2)
+    assert type(first) is calendar and first.dow == SATURDAY and first.day <= 7, "❌"
+    last = calendar.nth_kday_of_month(-1, SATURDAY, first.year, first.month)
+    assert (
+        last.dow == SATURDAY and last.day > calendar.days_in_month(first.year, first.month) - 7
+    ), "❌"
+
+
+# === Calendar Units ===
+
+g = Gregorian().from_date(2024, 1, 31)
+assert g.add_months(1) == Gregorian().from_date(2024, 2, 29), "❌ not clamped"
+assert g.add_months(13) == Gregorian().from_date(2025, 2, 28), "❌"
+assert g.add_months(-2) == Gregorian().from_date(2023, 11, 30), "❌"
+assert Gregorian().from_date(2024, 2, 29).add_years(1) == Gregorian().from_date(2025, 2, 28), "❌"
+assert Gregorian().from_date(2024, 2, 29).add_years(4).day == 29, "❌"
+assert Julian().from_date(-1, 6, 1).add_years(1) == Julian().from_date(1, 6, 1), "❌ year 0"
+assert Julian().from_date(1, 1, 15).add_months(-1) == Julian().from_date(-1, 12, 15), "❌"
+assert Coptic().from_date(1739, EPAGOMENE, 6).add_years(1).day == 5, "❌"
+assert Ethiopic().from_date(2016, PAGUEMEN, 1).add_months(1).month == MASKARAM, "❌"
+
+# Hebrew months run Tishri to the last Adar, then Nisan to Elul, 13 of them in leap years
+h = Hebrew().from_date(5784, ELUL, 29)
+assert h.add_months(1) == Hebrew().from_date(5785, TISHRI, 29), "❌"
+assert Hebrew().from_date(5784, ADAR_II, 1).add_months(1).month == NISAN, "❌"
+assert Hebrew().from_date(5784, ADAR, 1).add_months(1).month == ADAR_II, "❌"
+assert Hebrew().from_date(5783, ADAR, 1).add_months(1).month == NISAN, "❌"
+assert Hebrew().from_date(5784, TISHRI, 1).add_months(13).year == 5785, "❌ leap year"
+assert Hebrew().from_date(5783, ADAR, 14).add_years(1).month == ADAR_II, "❌ Purim"
+assert Hebrew().from_date(5784, ADAR_II, 14).add_years(1).month == ADAR, "❌"
+assert Hebrew().from_date(5784, ADAR, 30).add_years(1) == Hebrew().from_date(5785, ADAR, 29), "❌"
+
+for calendar in calendars:
+    start = calendar().from_fixed(700000)
+    for n in range(-30, 31):
+        later = start.add_months(n)
+        assert calendar._month_number(later.year, later.month) == (
+            calendar._month_number(start.year, start.month) + n
+        ), f"❌ {calendar.__name__} {n}"
+        assert later.day == min(start.day, calendar.days_in_month(later.year, later.month)), "❌"
+        assert start.add_years(n).year == start.year + n, f"❌ {calendar.__name__} {n}"
+
+# Whole units, the day of the month must be reached to count the last month or year
+birth = Gregorian().from_date(2000, 2, 29)
+assert Gregorian.difference(birth, Gregorian().from_date(2001, 2, 28), "years") == 1, "❌"
+assert Gregorian.difference(birth, Gregorian().from_date(2001, 2, 27), "years") == 0, "❌"
+assert Gregorian.difference(birth, Gregorian().from_date(2001, 2, 27), "months") == 11, "❌"
+assert Gregorian.difference(birth, Gregorian().from_date(2024, 10, 17), "years") == 24, "❌"
+assert Gregorian.difference(Gregorian().from_date(2024, 10, 17), birth, "years") == -24, "❌"
+assert Gregorian.difference(birth, birth + 20, "weeks") == 2, "❌"
+assert Gregorian.difference(birth + 20, birth, "weeks") == -2, "❌"
+assert Gregorian.difference(birth, birth + 20) == 20, "❌"
+assert Coptic.difference(birth, Gregorian().from_date(2024, 10, 17), "years") == 24, "❌"
+assert Hebrew.difference(Hebrew().from_date(5784, ADAR_II, 14), birth, "months") < 0, "❌"
+
+try:
+    Gregorian.difference(birth, birth, "fortnights")
+    assert False, "❌ unknown unit accepted"
+except ValueError:
+    pass
+
+
+# === Range Statistics ===
+
+epoch = Hebrew.epoch  # spans may start on the first Hebrew day, nothing before it is counted
+for calendar in calendars:
+    for start, end in (
+        (-1000, 12000),
+        (738000, 738400),
+        (-800000, -700000),
+        (5, 5),
+        (100, 90),
+        (epoch, epoch + 1000),
+        (epoch, epoch + 1),
+        (epoch + 1, epoch + 400),
+    ):
+        years = list(calendar.iter_years(start, end))
+        assert calendar.count_years(start, end) == len(years), f"❌ {calendar.__name__}"
+        assert calendar.count_leap_years(start, end) == sum(y.is_leapyear for y in years), "❌"
+        months = list(calendar.iter_months(start, end))
+        assert calendar.count_months(start, end) == len(months), f"❌ {calendar.__name__}"
+
+for k in (SUNDAY, WEDNESDAY, SATURDAY):
+    for start, end in ((738000, 738400), (-10, 10), (738040, 738041), (5, 5)):
+        expected = sum(day_of_week_from_fixed(d) == k for d in range(start, end))
+        assert count_kdays(k, start, end) == expected, f"❌ {k} {start} {end}"
+
+# Sabbaths and Hebrew months of the Gregorian year 2024
+start, end = Gregorian().from_date(2024, 1, 1), Gregorian().from_date(2025, 1, 1)
+assert count_kdays(SATURDAY, start, end) == 52, "❌"
+assert Hebrew.count_months(start, end) == 12, "❌ Shevat 5784 to Kislev 5785"
+assert Gregorian.count_leap_years(Gregorian().from_date(1900, 1, 1), end) == 31, "❌"
+
+assert (Hebrew.count_years(epoch, epoch + 1000), Hebrew.count_months(epoch, epoch + 1000)) == (
+    3,
+    34,
+)
+assert Hebrew.count_leap_years(epoch, epoch + 1000) == 1, "❌ year 3 AM"
+
+
+# === Interoperability ===
+
+for calendar in calendars:
+    for fixed_date in (1, 719163, 738040, 3652059):
+        value = datetime.date.fromordinal(fixed_date)
+        date = calendar.from_datetime(value)
+        assert type(date) is calendar and date.fixed == fixed_date, f"❌ {calendar.__name__}"
+        assert date.to_datetime() == value, f"❌ {calendar.__name__}"
+        assert calendar.from_unix_day(date.to_unix_day()) == date, f"❌ {calendar.__name__}"
+
+evening = datetime.datetime(2021, 9, 7, 23, 59)
+assert Hebrew.from_datetime(evening) == Hebrew().from_date(5782, 7, 1), "❌ time of day"
+assert Gregorian.from_unix_day(0) == Gregorian().from_date(1970, 1, 1), "❌"
+assert Julian().from_date(1969, 12, 19).to_unix_day() == 0, "❌"
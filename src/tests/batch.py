@@ -0,0 +1,208 @@
+import datetime
+
+import numpy as np
+
+from ..calculations import Gregorian, Julian, Coptic, Ethiopic, Hebrew, DateFormatException
+from ..calculations.gregorian import fixed_from_gregorian
+from ..calculations.base import count_kdays, kday_nearest, nth_kday
+from ..calculations.hebrew import (
+    days_in_hebrew_year,
+    hebrew_months_elapsed,
+    hebrew_new_year,
+    molad_in_halakim,
+)
+from ..calculations.holidays import hebrew_holidays
+from ..calculations.batch import *
+
+calendars = (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+
+
+# === Agreement with the scalar classes ===
+
+fixed_dates = np.concatenate(
+    [
+        np.arange(-1373427, 2000000, 1117),  # Hebrew epoch to the far future
+        np.arange(738000, 739500),  # Every day over a few recent years
+    ]
+)
+
+for calendar in calendars:
+    years, months, days = batch_from_fixed(calendar, fixed_dates)
+    for fixed_date, y, m, d in zip(fixed_dates[::7], years[::7], months[::7], days[::7]):
+        expected = calendar().from_fixed(int(fixed_date))
+        assert (y, m, d) == (
+            expected.year,
+            expected.month,
+            expected.day,
+        ), f"❌ {calendar.__name__} {fixed_date}: ({y}, {m}, {d}) vs {expected}"
+
+    round_trip = batch_fixed_from_date(calendar, years, months, days)
+    assert np.array_equal(round_trip, fixed_dates), f"❌ {calendar.__name__} round trip"
+
+    print(f"✅ {calendar.__name__} agrees on {len(fixed_dates)} fixed-dates")
+
+
+# === Helpers ===
+
+years = np.arange(5700, 5800)
+assert np.array_equal(hebrew_new_year_array(years), [hebrew_new_year(int(y)) for y in years]), "❌"
+assert np.array_equal(
+    days_in_hebrew_year_array(years), [days_in_hebrew_year(int(y)) for y in years]
+), "❌"
+assert np.array_equal(
+    gregorian_leap_year_array([1900, 2000, 2004, 2005]), [False, True, True, False]
+), "❌"
+assert np.array_equal(julian_leap_year_array([-1, 1, 4, 1900]), [True, False, True, True]), "❌"
+
+months = np.resize(np.arange(1, 14), len(years))
+assert np.array_equal(
+    hebrew_months_elapsed_array(years, months),
+    [hebrew_months_elapsed(int(y), int(m)) for y, m in zip(years, months)],
+), "❌"
+assert np.array_equal(
+    molad_in_halakim_array(years, months),
+    [molad_in_halakim(int(y), int(m)) for y, m in zip(years, months)],
+), "❌"
+
+holidays = hebrew_holidays_array(years)
+for i, year in enumerate(years):
+    assert {name: dates[i] for name, dates in holidays.items()} == hebrew_holidays(int(year)), "❌"
+assert np.array_equal(hebrew_holiday_array(years, "purim"), holidays["purim"]), "❌"
+assert np.array_equal(hebrew_sabbatical_year_array([-7, -1, 0, 5782, 5784]), [1, 0, 1, 1, 0]), "❌"
+
+# Days of the week
+sample = np.arange(-100, 100) * 3371 + 738040
+for k in range(7):
+    assert np.array_equal(
+        kday_nearest_array(k, sample), [kday_nearest(k, int(d)) for d in sample]
+    ), "❌"
+    for n in (-3, -1, 1, 2):
+        assert np.array_equal(
+            nth_kday_array(n, k, sample), [nth_kday(n, k, int(d)) for d in sample]
+        ), "❌"
+n = np.resize([1, -1, 2, -2], len(sample))
+assert np.array_equal(
+    nth_kday_array(n, SATURDAY, sample),
+    [nth_kday(int(i), SATURDAY, int(d)) for i, d in zip(n, sample)],
+), "❌"
+
+for calendar in calendars:
+    years, months, _ = batch_from_fixed(calendar, sample)
+    for n in (1, 2, -1):
+        dates = nth_kday_of_month_array(calendar, n, FRIDAY, years, months)
+        expected = [
+            calendar.nth_kday_of_month(n, FRIDAY, int(y), int(m)).fixed
+            for y, m in zip(years, months)
+        ]
+        assert np.array_equal(dates, expected), f"❌ {calendar.__name__} {n}"
+
+# Calendar units
+for calendar in calendars:
+    years, months, days = batch_from_fixed(calendar, sample)
+    steps = np.resize([-25, -13, -1, 1, 12, 40], len(sample))
+    assert np.array_equal(
+        days_in_month_array(calendar, years, months),
+        [calendar.days_in_month(int(y), int(m)) for y, m in zip(years, months)],
+    ), f"❌ {calendar.__name__}"
+
+    for add, method in ((add_months_array, "add_months"), (add_years_array, "add_years")):
+        moved = batch_fixed_from_date(calendar, *add(calendar, years, months, days, steps))
+        expected = [
+            getattr(calendar().from_fixed(int(d)), method)(int(n)).fixed
+            for d, n in zip(sample, steps)
+        ]
+        assert np.array_equal(moved, expected), f"❌ {calendar.__name__} {method}"
+
+    for unit in ("days", "weeks", "months", "years"):
+        ends = sample[::-1] + 17
+        expected = [
+            calendar.difference(calendar().from_fixed(int(a)), calendar().from_fixed(int(b)), unit)
+            for a, b in zip(sample, ends)
+        ]
+        assert np.array_equal(difference_array(calendar, sample, ends, unit), expected), "❌"
+
+# Range statistics, with spans starting on and before the Hebrew epoch
+ends = sample + np.resize([-3, 0, 1, 400, 30000], len(sample))
+epoch = Hebrew.epoch
+starts = np.concatenate([sample, [epoch, epoch, epoch - 5, epoch - 5, epoch + 1]])
+ends = np.concatenate([ends, [epoch + 1, epoch + 1000, epoch, epoch + 400, epoch + 400]])
+for calendar in calendars:
+    for counts, method in (
+        (count_years_array, calendar.count_years),
+        (count_leap_years_array, calendar.count_leap_years),
+        (count_months_array, calendar.count_months),
+    ):
+        expected = [method(int(a), int(b)) for a, b in zip(starts, ends)]
+        assert np.array_equal(counts(calendar, starts, ends), expected), f"❌ {method.__name__}"
+expected = [count_kdays(FRIDAY, int(a), int(b)) for a, b in zip(starts, ends)]
+assert np.array_equal(count_kdays_array(FRIDAY, starts, ends), expected), "❌"
+
+# Validation agrees with `from_date`, which raises on the same rows
+rng = np.random.default_rng(2024)
+triples = rng.integers([-3, -1, -1], [4, 15, 33], size=(3000, 3)).T
+triples[0] += np.resize([0, 0, 5783, 2023], triples.shape[1])  # Hebrew leap & common years
+for calendar in calendars:
+    valid, reasons = validate_dates_array(calendar, *triples)
+    for (y, m, d), ok, reason in zip(triples.T, valid, reasons):
+        try:
+            calendar().from_date(int(y), int(m), int(d))
+            assert ok and reason == VALID_DATE, f"❌ {calendar.__name__} ({y}, {m}, {d})"
+        except DateFormatException:
+            assert not ok and reason in INVALID_REASONS, f"❌ {calendar.__name__} ({y}, {m}, {d})"
+    assert set(reasons) == {VALID_DATE, INVALID_MONTH, INVALID_DAY} | (
+        {INVALID_YEAR} if calendar in (Julian, Hebrew) else set()
+    ), f"❌ {calendar.__name__} {set(reasons)}"
+
+_, reasons = validate_dates_array(
+    Gregorian, [2024, 2023, 2024, 2024], [2, 2, 13, 1], [29, 29, 1, 0]
+)
+assert list(reasons) == [VALID_DATE, INVALID_DAY, INVALID_MONTH, INVALID_DAY], "❌"
+
+# datetime.date, datetime64 & Unix days, the Gregorian years of NumPy are astronomical too
+moments = np.array(["2021-09-07T12:00", "1970-01-01", "-0044-03-15", "1969-12-31T23:59"])
+moments = moments.astype("datetime64[m]")
+fixed = fixed_from_datetime64_array(moments)
+assert fixed.tolist() == [738040, 719163, fixed_from_gregorian(-44, 3, 15), 719162], "❌"
+assert np.array_equal(datetime64_from_fixed_array(fixed), moments.astype("datetime64[D]")), "❌"
+assert unix_days_from_fixed_array(fixed)[[0, 1, 3]].tolist() == [18877, 0, -1], "❌"
+assert np.array_equal(fixed_from_unix_days_array(unix_days_from_fixed_array(fixed)), fixed), "❌"
+
+for calendar in calendars:
+    years, months, days = batch_from_datetime64(calendar, moments)
+    assert np.array_equal(batch_fixed_from_date(calendar, years, months, days), fixed), "❌"
+    assert np.array_equal(
+        datetime64_from_date_array(calendar, years, months, days), moments.astype("datetime64[D]")
+    ), "❌"
+
+python_dates = [datetime.date(2021, 9, 7), datetime.date(1, 1, 1), datetime.date(9999, 12, 31)]
+assert fixed_from_dates_array(python_dates).tolist() == [d.toordinal() for d in python_dates], "❌"
+assert dates_from_fixed_array([738040, 1, 3652059]).tolist() == python_dates, "❌"
+
+try:
+    fixed_from_datetime64_array(np.array(["NaT"], dtype="datetime64[D]"))
+    assert False, "❌ NaT converted"
+except ValueError:
+    pass
+
+# Fractional fixed-dates are floored like the scalar constructors
+assert batch_from_fixed(Julian, [-1721424.5])[0][0] == -4713, "❌"
+
+try:
+    batch_from_fixed(int, [1])
+    assert False, "❌ unsupported calendar accepted"
+except TypeError:
+    pass
+
+try:
+    batch_from_fixed(Hebrew, [Hebrew.epoch, Hebrew.epoch - 1])
+    assert False, "❌ Hebrew date before the epoch"
+except DateFormatException:
+    pass
+assert [int(v[0]) for v in batch_from_fixed(Hebrew, [Hebrew.epoch])] == [1, 7, 1], "❌"
+
+# Every range of arrays can start on the Hebrew epoch
+spans = ([Hebrew.epoch], [Hebrew.epoch + 1000])
+for unit, expected in (("days", 1000), ("weeks", 142), ("months", 33), ("years", 2)):
+    assert difference_array(Hebrew, *spans, unit)[0] == expected, f"❌ {unit}"
+assert int(count_kdays_array(SATURDAY, *spans)[0]) == 143, "❌"
+assert int(count_years_array(Hebrew, *spans)[0]) == 3, "❌"
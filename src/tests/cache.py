@@ -0,0 +1,62 @@
+from ..calculations.cache import *
+from ..calculations.hebrew import *
+
+# === Bounded Cache ===
+
+cache = BoundedCache(capacity=2)
+calls = []
+
+
+@cache.memoize
+def square(x: int) -> int:
+    calls.append(x)
+    return x * x
+
+
+assert square(2) == 4 and square(2) == 4, "❌"
+assert calls == [2], f"❌ recomputed {calls}"
+assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0, size=1, capacity=2), "❌"
+
+square(3)
+square(4)  # evicts 2, the least recently used
+assert cache.info().evictions == 1, f"❌ {cache.info()}"
+square(2)
+assert calls == [2, 3, 4, 2], f"❌ {calls}"
+
+cache.resize(1)
+assert cache.info().size == 1, f"❌ {cache.info()}"
+assert cache.stats()["capacity"] == 1, "❌"
+
+cache.clear()
+assert cache.info() == CacheInfo(hits=1, misses=4, evictions=3, size=0, capacity=1), "❌ stats"
+square(6)
+cache.reset_stats()
+assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, size=1, capacity=1), "❌ entries"
+
+cache.resize(0)  # disabled
+square(5)
+square(5)
+assert cache.info().misses == 2 and cache.info().size == 0, f"❌ {cache.info()}"
+
+try:
+    cache.resize(-1)
+    assert False, "❌ negative capacity accepted"
+except ValueError:
+    pass
+
+
+# === Hebrew Year Cache ===
+
+HEBREW_CACHE.clear()
+assert last_day_of_hebrew_month(5782, KISLEV) == 30, "❌"
+misses = HEBREW_CACHE.info().misses
+assert last_day_of_hebrew_month(5782, TEVET) == 29, "❌"
+assert HEBREW_CACHE.info().misses == misses, f"❌ {HEBREW_CACHE.info()}"
+assert HEBREW_CACHE.info().hits > 0, f"❌ {HEBREW_CACHE.info()}"
+
+capacity = HEBREW_CACHE.capacity
+HEBREW_CACHE.resize(3)
+assert Hebrew().from_fixed(738040).year == 5782, "❌"
+assert HEBREW_CACHE.info().size <= 3, f"❌ {HEBREW_CACHE.info()}"
+assert HEBREW_CACHE.info().evictions > 0, f"❌ {HEBREW_CACHE.info()}"
+HEBREW_CACHE.resize(capacity)
@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+
+from ..calculations.cli import *
+
+
+def run(content: str, *argv: str) -> str:
+    with tempfile.TemporaryDirectory() as folder:
+        source, sink = os.path.join(folder, "in"), os.path.join(folder, "out")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(content)
+        assert main([*argv, "--input", source, "--output", sink, "--quiet"]) == 0, "❌"
+        with open(sink, newline="", encoding="utf-8") as f:
+            return f.read()
+
+
+# === Values ===
+assert convert_value("2021-09-07", Gregorian, Hebrew) == "5782-07-01", "❌"
+assert convert_value("738040", None, Gregorian) == "2021-09-07", "❌"
+assert convert_value("-0044-03-15", Julian, None) == -15999, "❌"
+assert format_date(Julian().from_date(-44, 3, 15)) == "-0044-03-15", "❌"
+
+# Fractions of a day are floored, not truncated towards 0
+assert convert_value("-1.5", None, None) == -2, "❌"
+assert convert_value(-0.5, None, None) == -1, "❌"
+assert convert_value(738040.9, None, Gregorian) == "2021-09-07", "❌"
+
+for bad in ("2021-02-29", "2021/02/01", "yesterday"):
+    try:
+        convert_value(bad, Gregorian, Hebrew)
+        assert False, f"❌ {bad} accepted"
+    except DateFormatException:
+        pass
+
+
+# === CSV ===
+content = "name,born\nada,1815-12-10\nbad,1815-02-30\nempty,\n"
+
+assert run(content, "--from", "gregorian", "--to", "julian", "--columns", "born") == (
+    "name,born\r\nada,1815-11-28\r\nbad,\r\nempty,\r\n"
+), "❌"
+assert run(
+    content, "--from", "gregorian", "--to", "rd", "--columns", "born", "--on-error", "skip"
+) == ("name,born\r\nada,662893\r\nempty,\r\n"), "❌"
+
+
+# === NDJSON, chunked across worker processes ===
+rows = [{"id": i, "rd": 738040 + i} for i in range(25)]
+content = "".join(json.dumps(row) + "\n" for row in rows)
+argv = ("--from", "rd", "--to", "hebrew", "--columns", "rd", "--format", "ndjson")
+
+single = run(content, *argv)
+parallel = run(content, *argv, "--workers", "2", "--chunk-size", "4")
+assert single == parallel, "❌ worker output differs"
+
+converted = [json.loads(line) for line in parallel.splitlines()]
+assert [row["id"] for row in converted] == list(range(25)), "❌ rows out of order"
+assert converted[0]["rd"] == "5782-07-01", "❌"
+
+# Lines which are not JSON objects are dropped like rows with bad dates
+content = '{"rd": 738040}\nnot json\n[1, 2]\n{"rd": 738041}\n'
+converted = [json.loads(line) for line in run(content, *argv).splitlines()]
+assert [row["rd"] for row in converted] == ["5782-07-01", "5782-07-02"], "❌"
+
+
+# === Failures ===
+with tempfile.TemporaryDirectory() as folder:
+    source = os.path.join(folder, "in.csv")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("born\n1815-02-30\n")
+
+    common = ["--from", "gregorian", "--to", "hebrew", "--input", source, "--quiet"]
+    common += ["--output", os.path.join(folder, "out.csv")]
+    assert main([*common, "--columns", "born", "--on-error", "fail"]) == 1, "❌"
+
+    # A missing column is found before the output is opened, which is left as it was
+    with open(os.path.join(folder, "out.csv"), "w", encoding="utf-8") as f:
+        f.write("previous")
+    assert main([*common, "--columns", "died"]) == 2, "❌"
+    with open(os.path.join(folder, "out.csv"), encoding="utf-8") as f:
+        assert f.read() == "previous", "❌ output truncated"
+
+    source = os.path.join(folder, "in.ndjson")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write('{"rd": 738040}\n{"rd": \n')
+    common = ["--from", "rd", "--to", "hebrew", "--input", source, "--quiet", "--format", "ndjson"]
+    common += ["--columns", "rd", "--output", os.path.join(folder, "out.ndjson")]
+    assert main([*common, "--on-error", "fail"]) == 1, "❌ bad line not reported"
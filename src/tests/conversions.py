@@ -12,10 +12,15 @@ def print_section_header(msg: str) -> None:
 # === Check Julian to Gregorian ===
 
 assert Julian().from_fixed(-1373427) == Julian().from_date(-3761, 10, 7), "❌"
-assert Julian().from_fixed(-1373427) == Gregorian().from_fixed(-1373427), "❌"
-assert Julian().from_date(-3761, 10, 7) == Gregorian().from_fixed(-1373427), "❌"
-assert Julian().from_fixed(-1373427) == Gregorian().from_date(-3760, 9, 7), "❌"
-assert Julian().from_date(-3761, 10, 7) == Gregorian().from_date(-3760, 9, 7), "❌"
+assert Julian().from_fixed(-1373427).fixed == Gregorian().from_fixed(-1373427).fixed, "❌"
+assert Julian().from_date(-3761, 10, 7).fixed == Gregorian().from_fixed(-1373427).fixed, "❌"
+assert Julian().from_fixed(-1373427).fixed == Gregorian().from_date(-3760, 9, 7).fixed, "❌"
+assert Julian().from_date(-3761, 10, 7).fixed == Gregorian().from_date(-3760, 9, 7).fixed, "❌"
+
+# Equality includes the calendar, ordering only looks at the fixed-date
+assert Julian().from_fixed(-1373427) != Gregorian().from_fixed(-1373427), "❌"
+assert Julian().from_fixed(-1373427) <= Gregorian().from_fixed(-1373427), "❌"
+assert Julian().from_fixed(-1373427) < Gregorian().from_fixed(-1373426), "❌"
 
 print(Julian().from_fixed(-1373427).pretty_display)
 print(Gregorian().from_fixed(-1373427).pretty_display)
@@ -25,7 +30,9 @@ print(Gregorian().from_fixed(-1373427).pretty_display)
 
 h = Hebrew().from_date(4000, 12, 10)
 g = Gregorian().from_date(240, 2, 21)
-assert h == g, f"❌ H: ({h.fixed}) {h.pretty_display} | G: ({g.fixed}) {g.pretty_display}"
+assert (
+    h.fixed == g.fixed
+), f"❌ H: ({h.fixed}) {h.pretty_display} | G: ({g.fixed}) {g.pretty_display}"
 h2 = Hebrew().from_fixed(87344)
 assert (
     h.year == h2.year and h.month == h2.month and h.day == h2.day
@@ -0,0 +1,72 @@
+from ..calculations import *
+
+# === Hashing ===
+assert hash(Gregorian().from_date(2000, 1, 1)) == hash(Gregorian().from_fixed(730120)), "❌"
+assert len({Gregorian().from_date(2000, 1, 1), Gregorian().from_fixed(730120)}) == 1, "❌"
+assert len({Gregorian().from_fixed(730120), Julian().from_fixed(730120)}) == 2, "❌"
+assert {Hebrew().from_fixed(738040): "Rosh Hashanah"}[Hebrew().from_date(5782, 7, 1)], "❌"
+
+assert Gregorian().from_date(2000, 1, 1) != Gregorian().from_date(2000, 1, 2), "❌"
+assert not Gregorian().from_date(2000, 1, 1) == 730120, "❌"
+
+
+# === Dedupe then Convert ===
+
+dates = [Gregorian().from_fixed(738040 + i % 3) for i in range(12)]
+converted = convert_unique(dates, Hebrew)
+
+assert len(converted) == len(dates), "❌"
+assert [h.fixed for h in converted] == [g.fixed for g in dates], "❌"
+assert all(isinstance(h, Hebrew) for h in converted), "❌"
+assert len({id(h) for h in converted}) == 3, "❌ repeated dates were converted again"
+assert converted[0] == Hebrew().from_date(5782, 7, 1), "❌"
+
+
+# === Convert ===
+
+assert conversion_path(Julian().from_date(1700, 2, 29), Gregorian) == JULIAN_GREGORIAN, "❌"
+assert conversion_path(Gregorian().from_date(2000, 1, 1), Julian) == JULIAN_GREGORIAN, "❌"
+assert conversion_path(Coptic().from_date(1738, 1, 1), Ethiopic) == COPTIC_ETHIOPIC, "❌"
+assert conversion_path(Ethiopic().from_date(2014, 1, 1), Coptic) == COPTIC_ETHIOPIC, "❌"
+assert conversion_path(Hebrew().from_date(5782, 7, 1), Gregorian) == FIXED, "❌"
+assert conversion_path(Hebrew().from_fixed(738040), Hebrew) == IDENTITY, "❌"
+assert conversion_path(Julian().from_fixed(700000), Gregorian) == FIXED, "❌ not decomposed"
+
+g = Gregorian().from_date(2000, 1, 1)
+assert convert(g, Gregorian) is g, "❌"
+assert convert(g, Hebrew) == Hebrew().from_fixed(g.fixed), "❌"
+assert convert(Julian().from_date(1700, 2, 29), Gregorian) == Gregorian().from_date(1700, 3, 11)
+assert convert(Gregorian().from_date(1700, 3, 12), Julian) == Julian().from_date(1700, 3, 1)
+assert convert(Gregorian().from_date(0, 12, 31), Julian) == Julian().from_date(1, 1, 2)
+assert convert(Coptic().from_date(1738, 1, 1), Ethiopic) == Ethiopic().from_date(2014, 1, 1)
+
+# The shortcuts agree with the fixed-date path, across century and leap-day boundaries
+centuries = [year if year > 0 else year - 1 for year in range(-2100, 2200, 100)]  # no year 0
+century_leap_days = [Julian().from_date(year, 2, 1).fixed for year in centuries]
+for fixed_date in (
+    list(range(-800000, 1200000, 173))
+    + list(range(620000, 621000))
+    + [start + i for start in century_leap_days for i in range(-40, 60)]
+    + list(range(-200000000, 200000000, 999983))
+):
+    for source, target in ((Julian, Gregorian), (Gregorian, Julian), (Coptic, Ethiopic)):
+        date = source().from_fixed(fixed_date)
+        date.year  # decomposed, so the shortcut is taken
+        fast = convert(date, target)
+        slow = target().from_fixed(fixed_date)
+        assert (fast.year, fast.month, fast.day) == (
+            slow.year,
+            slow.month,
+            slow.day,
+        ), f"❌ {source.__name__} -> {target.__name__} at {fixed_date}: {fast} vs {slow}"
+        assert convert(fast, source) == source().from_fixed(fixed_date), f"❌ {fixed_date}"
+
+# Dates still waiting to be decomposed go through their fixed-date and stay undecomposed
+lazy = convert(Julian().from_fixed(700000), Gregorian)
+assert lazy._year is None and lazy == Gregorian().from_fixed(700000), "❌ decomposed"
+assert convert(Julian().from_date(1700, 2, 29), Gregorian)._year == 1700, "❌ shortcut skipped"
+
+assert convert_many([g, g + 1], Julian) == [
+    Julian().from_date(1999, 12, 19),
+    Julian().from_date(1999, 12, 20),
+]
@@ -14,6 +14,13 @@ assert coptic_leap_year(1899) is True, "❌"
 assert coptic_leap_year(1999) is True, "❌"
 assert coptic_leap_year(2003) is True, "❌"
 
+# Counts over ranges of years, on both sides of year 1
+for first, last in ((-1000, 1000), (1, 2), (1900, 2101), (-7, -1)):
+    expected = sum(coptic_leap_year(y) for y in range(first, last))
+    counted = coptic_leap_years_before(last) - coptic_leap_years_before(first)
+    assert counted == expected, f"❌ {first} to {last}: {counted}"
+
+
 # === Check Valid Leap Years ===
 
 leapyear_dates = [(1899, 4, 1), (2003, 3, 30), (123, 9, 12), (3, 4, 4), (-397, 1, 1)]
@@ -36,6 +43,7 @@ invalid_dates = [
     (100, 13, 6),
     (2020, 9, 31),
     (2015, 12, -1),
+    (2015, 12, 0),  # day 0 used to pass
     (2016, -3, 11),
     (2012, 0, 12),
     (2008, 0, 9),
@@ -105,3 +113,24 @@ except IndexError:
 # assert Coptic().from_fixed(30) - Coptic().from_fixed(10) == Coptic().from_fixed(20), "❌"
 # assert Coptic().from_fixed(30) - Coptic().from_fixed(10) == Coptic().from_fixed(20), "❌"
 # assert Coptic().from_fixed(103605) - Coptic().from_date(284, 8, 29) == Coptic().from_fixed(0), "❌"
+
+
+# === Check Fixed Date constructor ===
+
+check_values = [  # fixed-date, year, month, day)
+    (103605, 1, 1, 1),
+    (103970, 2, 1, 1),
+    (738044, 1738, 1, 1),  # September 11, 2021
+    (738043, 1737, 13, 5),
+]
+
+for d in check_values:
+    G = Coptic().from_fixed(d[0])
+    assert G.year == d[1], f"❌ {d} returned year:{G.year}"
+    assert G.month == d[2], f"❌ {d} returned month:{G.month}"
+    assert G.day == d[3], f"❌ {d} returned day:{G.day}"
+    assert fixed_from_coptic(d[1], d[2], d[3]) == d[0], f"❌ {d}"
+
+for fixed_date in range(737000, 739000):
+    G = Coptic().from_fixed(fixed_date)
+    assert Coptic().from_date(G.year, G.month, G.day).fixed == fixed_date, f"❌ {fixed_date}"
@@ -0,0 +1,53 @@
+from ..calculations import *
+from ..calculations.batch import batch_from_fixed
+from ..calculations.cycles import *
+
+# === Equivalence with the arithmetic engine ===
+
+for calendar, (days, years) in CALENDAR_CYCLES.items():
+    cycle = date_cycle(calendar)
+    assert len(cycle.table) == days, "❌"
+
+    # Whole cycles before and after the epoch, plus spot checks far away
+    fixed_dates = list(range(calendar.epoch - days - 3, calendar.epoch + days + 3))
+    fixed_dates += list(range(-5000000, 5000000, 9973))
+
+    for fixed_date in fixed_dates:
+        expected = calendar().from_fixed(fixed_date)
+        assert cycle.year_month_day(fixed_date) == (
+            expected.year,
+            expected.month,
+            expected.day,
+        ), f"❌ {calendar.__name__} {fixed_date}: {cycle.year_month_day(fixed_date)} != {expected}"
+
+    years, months, days = cycle.year_month_day_array(fixed_dates)
+    expected = batch_from_fixed(calendar, fixed_dates)
+    assert (years == expected[0]).all() and (months == expected[1]).all(), f"❌ {calendar}"
+    assert (days == expected[2]).all(), f"❌ {calendar}"
+
+
+# === Selecting the engine ===
+
+expected = [(d.year, d.month, d.day) for d in (Julian().from_fixed(f) for f in range(-800, 800))]
+
+assert calendar_engine(Julian) == ARITHMETIC_ENGINE, "❌"
+use_cycle_engine(Julian)
+assert calendar_engine(Julian) == CYCLE_ENGINE, "❌"
+assert calendar_engine(Gregorian) == ARITHMETIC_ENGINE, "❌ engines are per calendar"
+try:
+    converted = [
+        (d.year, d.month, d.day) for d in (Julian().from_fixed(f) for f in range(-800, 800))
+    ]
+    assert converted == expected, "❌"
+    assert tuple(Julian().from_fixed(1.5)) == (1, 1, 3), "❌"
+    assert Julian().from_date(-1, 12, 31) + 1 == Julian().from_date(1, 1, 1), "❌"
+finally:
+    use_arithmetic_engine(Julian)
+assert calendar_engine(Julian) == ARITHMETIC_ENGINE, "❌"
+
+for call in (lambda: use_cycle_engine(Hebrew), lambda: use_arithmetic_engine(Hebrew)):
+    try:
+        call()
+        assert False, "❌ the Hebrew calendar has no practical cycle"
+    except TypeError:
+        pass
@@ -0,0 +1,92 @@
+import numpy as np
+
+from ..calculations import *
+from ..calculations.batch import batch_fixed_from_date
+from ..calculations.formats import *
+
+calendars = (Gregorian, Julian, Coptic, Ethiopic, Hebrew)
+
+
+# === Formatting ===
+
+ides = Julian().from_date(-44, 3, 15)
+assert strftime(ides, "%A %B %o, %N %E") == "Wednesday March 15th, 44 B.C.", "❌"
+assert strftime(ides, "%Y-%m-%d") == "-0044-03-15", "❌"
+assert strftime(ides, "%-Y/%-m/%-d %w %%") == "-44/3/15 3 %", "❌"
+assert strftime(Hebrew().from_date(5784, ADAR, 3), "%-d %B") == "3 Adar I", "❌"
+assert strftime(Hebrew().from_date(5783, ADAR, 3), "%-d %B") == "3 Adar", "❌"
+assert strftime(Coptic().from_date(1740, 1, 1), "{%N} '%E'") == "{1740} 'A.M.'", "❌ literals"
+assert strftime(Gregorian().from_date(5, 1, 2), "%Y-%m-%d {0}}") == "0005-01-02 {0}}", "❌"
+assert date_format(Gregorian, "%Y") is date_format(Gregorian, "%Y"), "❌ not cached"
+
+# The existing names are formats of their own
+display_specs = {
+    Gregorian: "%A %B %o, %-Y",
+    Julian: "%A %B %o, %N %E",
+    Coptic: "%A %B %-d, %-Y %E",
+    Ethiopic: "%A %B %-d, %-Y %E",
+    Hebrew: "(%A) %B %-d, %-Y",
+}
+for calendar, spec in display_specs.items():
+    for date in calendar.iter_days(700000, 701000):
+        assert strftime(date, spec) == date.pretty_display, f"❌ {date.pretty_display}"
+
+for spec in ("%Q", "%-B", "%d %d"):
+    try:
+        date_format(Gregorian, spec)
+        assert False, f"❌ {spec} accepted"
+    except ValueError:
+        pass
+
+
+# === Parsing ===
+
+assert strptime("15 Nisan 5782", Hebrew, "%-d %B %-Y") == Hebrew().from_date(5782, NISAN, 15)
+assert strptime("3 Adar I 5784", Hebrew, "%-d %B %Y").month == ADAR, "❌"
+assert strptime("3 Adar II 5784", Hebrew, "%-d %B %Y").month == ADAR_II, "❌"
+assert strptime("Wednesday March 15th, 44 B.C.", Julian, "%A %B %o, %N %E") == ides, "❌"
+assert strptime("  -0044-03-15 ", Julian, "%Y-%m-%d") == ides, "❌ surrounding spaces"
+
+for text, calendar, spec in (
+    ("2024-02-30", Gregorian, "%Y-%m-%d"),  # no such day
+    ("2024/02/03", Gregorian, "%Y-%m-%d"),  # does not match
+    ("3 Adar II 5783", Hebrew, "%-d %B %Y"),  # common year
+):
+    try:
+        strptime(text, calendar, spec)
+        assert False, f"❌ {text} accepted"
+    except DateFormatException:
+        pass
+
+try:
+    strptime("March", Gregorian, "%B")
+    assert False, "❌ parsed without a year & day"
+except ValueError:
+    pass
+
+# Every date formats and parses back, through each spec
+for calendar in calendars:
+    for spec in ("%Y-%m-%d", "%A %-d %B %N %E", "%o of %B, %-Y"):
+        compiled = date_format(calendar, spec)
+        dates = list(calendar.iter_days(-2000, 2000)) + list(calendar.iter_days(738000, 740000))
+        texts = compiled.format_many(dates)
+        assert compiled.parse_many(texts) == dates, f"❌ {calendar.__name__} {spec}"
+
+
+# === Bulk ===
+
+fixed_dates = np.arange(-500000, 1500000, 997)
+for calendar in calendars:
+    compiled = date_format(calendar, "%A %Y-%m-%d")
+    texts = compiled.format_fixed_array(fixed_dates)
+    assert texts == [compiled.format(calendar().from_fixed(int(d))) for d in fixed_dates], "❌"
+
+    years, months, days, valid = compiled.parse_array(texts + ["Someday 2024-01-01", "junk"])
+    assert valid.tolist() == [True] * len(texts) + [False, False], f"❌ {calendar.__name__}"
+    assert np.array_equal(batch_fixed_from_date(calendar, years, months, days)[:-2], fixed_dates)
+
+compiled = date_format(Gregorian, "%Y-%m-%d")
+*_, valid = compiled.parse_array(["2024-02-29", "2023-02-29", "2024-13-01", "2024-1-1"])
+assert valid.tolist() == [True, False, False, True], "❌"
+assert compiled.format_parts(2024, 2, 29) == "2024-02-29", "❌"
+assert date_format(Gregorian, "%A").format_parts(2024, 2, 29) == "Thursday", "❌"
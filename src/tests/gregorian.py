@@ -13,6 +13,13 @@ assert gregorian_leap_year(2000) is True, "❌"
 assert gregorian_leap_year(2004) is True, "❌"
 
 
+# Counts over ranges of years, on both sides of year 1
+for first, last in ((-1000, 1000), (1, 2), (1900, 2101), (-7, -1)):
+    expected = sum(gregorian_leap_year(y) for y in range(first, last))
+    counted = gregorian_leap_years_before(last) - gregorian_leap_years_before(first)
+    assert counted == expected, f"❌ {first} to {last}: {counted}"
+
+
 # === Check Valid Leap Years ===
 
 leapyear_dates = [(2000, 4, 1), (536, 3, 30), (2504, 9, 12), (4, 4, 4), (-400, 1, 1)]
@@ -35,6 +42,7 @@ invalid_dates = [
     (1999, 2, 29),
     (2020, 9, 31),
     (2015, 12, -1),
+    (2015, 12, 0),  # day 0 used to pass
     (2016, -3, 11),
     (2012, 0, 12),
     (2008, 0, 9),
@@ -103,3 +111,23 @@ for d in check_values:
 assert Gregorian().from_fixed(30) - Gregorian().from_fixed(10) == Gregorian().from_fixed(20), "❌"
 assert Gregorian().from_fixed(30) - Gregorian().from_fixed(10) == Gregorian().from_fixed(20), "❌"
 assert Gregorian().from_fixed(103605) - Gregorian().from_date(284, 8, 29) == Gregorian().from_fixed(0), "❌"
+
+assert fixed_from_gregorian(1970, 1, 1) == 719163, "❌"
+assert gregorian_year_from_fixed(719163) == 1970, "❌"
+assert gregorian_year_from_fixed(719162) == 1969, "❌"
+
+
+# === Immutability ===
+G = Gregorian().from_date(2024, 2, 29)
+assert not hasattr(G, "__dict__"), "❌ dates should be slotted"
+assert G.month_lengths is JULIAN_LEAP_MONTH_LENGTHS, "❌"
+assert Gregorian().from_date(2023, 2, 1).month_lengths is JULIAN_MONTH_LENGTHS, "❌"
+assert Gregorian().from_fixed(G.fixed).month_duration == 29, "❌"
+
+for attempt in (lambda: setattr(G, "year", 2000), lambda: G.from_date(2000, 1, 1)):
+    try:
+        attempt()
+        assert False, "❌ date was modified"
+    except AttributeError:
+        pass
+assert (G.year, G.month, G.day) == (2024, 2, 29), "❌"
@@ -1,4 +1,6 @@
 from ..calculations.hebrew import *
+from ..calculations.base import count_kdays
+from ..calculations.holidays import iter_hebrew_holidays
 
 # === Leap Years ===
 assert hebrew_leap_year(1899) is False, "❌"
@@ -14,6 +16,13 @@ assert hebrew_leap_year(2001) is True, "❌"
 assert hebrew_leap_year(2003) is True, "❌"
 
 
+# Counts over ranges of years, on both sides of year 1
+for first, last in ((-1000, 1000), (1, 2), (1900, 2101), (-7, -1)):
+    expected = sum(hebrew_leap_year(y) for y in range(first, last))
+    counted = hebrew_leap_years_before(last) - hebrew_leap_years_before(first)
+    assert counted == expected, f"❌ {first} to {last}: {counted}"
+
+
 # === Check Valid Leap Years ===
 
 # leapyear_dates = [(2000, 4, 1), (536, 3, 30), (2504, 9, 12), (4, 4, 4), (-397, 1, 1)]
@@ -36,9 +45,12 @@ invalid_dates = [
     (1999, 2, 30),
     (2020, 9, 31),
     (2015, 12, -1),
+    (2015, 12, 0),  # day 0 used to pass
     (2016, -3, 11),
     (2012, 0, 12),
     (2008, 0, 9),
+    (5783, 13, 1),  # Adar II in a common year
+    (5784, 14, 1),
 ]
 
 for d in invalid_dates:
@@ -54,6 +66,63 @@ assert hebrew_cal_elapsed_days(4682) == 1709704, f"❌ got {hebrew_cal_elapsed_d
 assert hebrew_cal_elapsed_days(4683) == 1710087, f"❌ got {hebrew_cal_elapsed_days(4683)}"
 assert hebrew_cal_elapsed_days(4684) == 1710443, f"❌ got {hebrew_cal_elapsed_days(4684)}"
 
+for year in (2, 3761, 5782, 5783, 6000, 10000):
+    new_year = hebrew_new_year(year)
+    assert hebrew_year_from_fixed(new_year) == year, f"❌ got {hebrew_year_from_fixed(new_year)}"
+    assert hebrew_year_from_fixed(new_year - 1) == year - 1, f"❌ {year} new year's eve"
+    assert hebrew_year_from_fixed(new_year + 200) == year, f"❌ {year} mid-year"
+
+# Molad of Tishri 1 AM is BaHaRaD: Sunday night (the eve of the epoch), 5 hours & 204 halakim
+day, part = divmod(molad_in_halakim(1, TISHRI), HALAKIM_PER_DAY)
+assert (day, part) == (Hebrew.epoch - 1, 23 * HALAKIM_PER_HOUR + 204), f"❌ got {day}, {part}"
+assert day_of_week_from_fixed(day) == SUNDAY, "❌"
+assert hebrew_months_elapsed(1, TISHRI) == 0, "❌"
+assert hebrew_months_elapsed(2, TISHRI) == 12, "❌"
+assert hebrew_months_elapsed(4, TISHRI) - hebrew_months_elapsed(3, TISHRI) == 13, "❌"
+
+# Exact in integers where the days as a float lose the halakim
+for year in (1, 5782, 10**6, 10**9):
+    for month in (TISHRI, NISAN):
+        halakim = molad_in_halakim(year, month)
+        assert halakim / HALAKIM_PER_DAY == molad(year, month), f"❌ {year}-{month}"
+        if year < 10**6:
+            old = (
+                Hebrew.epoch
+                - 876 / 25920
+                + hebrew_months_elapsed(year, month) * (29 + 12 / 24 + 793 / 25920)
+            )
+            assert abs(molad(year, month) - old) < 1e-6, f"❌ {year}-{month}"
+
+h = Hebrew().from_fixed(738040)  # September 7, 2021
+assert (h.year, h.month, h.day) == (5782, TISHRI, 1), f"❌ got {h}"
+
+
+# === Year Types ===
+assert len(HEBREW_YEAR_TYPES) == 14, "❌"
+assert {hebrew_year_type(y) for y in range(5000, 6000)} == set(HEBREW_YEAR_TYPES.values()), "❌"
+
+for year in (5781, 5782, 5783, 5784):
+    year_type = hebrew_year_type(year)
+    assert year_type.length == days_in_hebrew_year(year), f"❌ {year}"
+    assert year_type.is_leapyear is hebrew_leap_year(year), f"❌ {year}"
+    assert year_type.last_month == last_month_in_hebrew_year(year), f"❌ {year}"
+    for month in range(NISAN, year_type.last_month + 1):
+        expected = last_day_of_hebrew_month(year, month)
+        assert year_type.month_length(month) == expected, f"❌ {year}-{month}"
+
+assert hebrew_year_type(5782).new_year_dow == TUESDAY, "❌"  # September 7, 2021
+assert hebrew_year_type(5782).month_starts[TISHRI - 1] == 0, "❌"
+assert hebrew_year_type(5782).month_starts[NISAN - 1] == 207, "❌"  # 2022-04-02
+
+for fixed_date in range(738000, 738800, 7):
+    h = Hebrew().from_fixed(fixed_date)
+    assert Hebrew().from_date(h.year, h.month, h.day).fixed == fixed_date, f"❌ {fixed_date}"
+
+assert Hebrew().from_date(5784, ADAR, 1).month_name == "Adar I", "❌"
+assert Hebrew().from_date(5783, ADAR, 1).month_name == "Adar", "❌"
+assert Hebrew().from_date(5784, MARHESHVAN, 1).month_duration == 29, "❌"
+assert Hebrew().from_date(5784, KISLEV, 1).month_duration == 29, "❌"
+
 
 # === Conditionals ===
 assert Hebrew().from_date(1981, 3, 7) >= Hebrew().from_date(1980, 3, 7), "❌"
@@ -110,6 +179,41 @@ except IndexError:
 
 assert Hebrew().from_fixed(30) - Hebrew().from_fixed(10) == Hebrew().from_fixed(20), "❌"
 assert Hebrew().from_fixed(30) - Hebrew().from_fixed(10) == Hebrew().from_fixed(20), "❌"
-assert Hebrew().from_fixed(103605) - Hebrew().from_date(284, 8, 29) == Hebrew().from_fixed(
-    0
-), "❌"
+assert Hebrew().from_fixed(103605) - Hebrew().from_date(4044, 6, 29) == Hebrew().from_fixed(0), "❌"
+
+# Years are counted from the epoch, 1 Tishri 1 AM, and no further back
+assert Hebrew().from_fixed(Hebrew.epoch) == Hebrew().from_date(1, TISHRI, 1), "❌"
+assert hebrew_year_from_fixed(Hebrew.epoch) == 1, "❌"
+try:
+    hebrew_year_from_fixed(Hebrew.epoch - 1)
+    assert False, "❌ year 0 from a date before the epoch"
+except DateFormatException:
+    pass
+
+# Both constructors reject dates before the epoch, when they are called
+for year in (0, -5):
+    try:
+        Hebrew().from_date(year, TISHRI, 1)
+        assert False, f"❌ year {year} accepted"
+    except DateFormatException:
+        pass
+try:
+    Hebrew().from_fixed(Hebrew.epoch - 1)
+    assert False, "❌ date before the epoch accepted"
+except DateFormatException:
+    pass
+
+# The epoch can start every range, none of them steps back to the day before it
+epoch, end = Hebrew.epoch, Hebrew.epoch + 1000
+days = list(Hebrew.iter_days(epoch, end))
+months = list(Hebrew.iter_months(epoch, end))
+years = list(Hebrew.iter_years(epoch, end))
+assert days[0] == Hebrew().from_date(1, TISHRI, 1) and len(days) == 1000, "❌"
+assert months[0] == days[0] and Hebrew.count_months(epoch, end) == len(months) == 34, "❌"
+assert years[0] == days[0] and Hebrew.count_years(epoch, end) == len(years) == 3, "❌"
+assert Hebrew.count_leap_years(epoch, end) == sum(y.is_leapyear for y in years), "❌"
+assert (Hebrew.count_years(epoch, epoch + 1), Hebrew.count_months(epoch, epoch + 1)) == (1, 1)
+assert count_kdays(SATURDAY, epoch, end) == sum(d.dow == SATURDAY for d in days), "❌"
+for unit, expected in (("days", 1000), ("weeks", 142), ("months", 33), ("years", 2)):
+    assert Hebrew.difference(days[0], days[-1] + 1, unit) == expected, f"❌ {unit}"
+assert next(iter_hebrew_holidays(1, 2)) == (1, "rosh_hashanah", epoch), "❌"
@@ -0,0 +1,70 @@
+from ..calculations import Gregorian, Hebrew
+from ..calculations.hebrew import hebrew_sabbatical_year
+from ..calculations.holidays import *
+
+
+def gregorian(fixed_date: int) -> tuple:
+    g = Gregorian().from_fixed(fixed_date)
+    return g.year, g.month, g.day
+
+
+# === Known Dates ===
+
+# 5784, a year which starts on a Saturday
+assert gregorian(hebrew_holiday(5784, "rosh_hashanah")) == (2023, 9, 16), "❌"
+assert gregorian(hebrew_holiday(5784, "tzom_gedaliah")) == (2023, 9, 18), "❌ not postponed"
+assert gregorian(hebrew_holiday(5784, "yom_kippur")) == (2023, 9, 25), "❌"
+assert gregorian(hebrew_holiday(5784, "hanukkah")) == (2023, 12, 8), "❌"
+assert gregorian(hebrew_holiday(5784, "taanit_esther")) == (2024, 3, 21), "❌ not advanced"
+assert gregorian(hebrew_holiday(5784, "purim")) == (2024, 3, 24), "❌ not in Adar II"
+assert gregorian(hebrew_holiday(5784, "passover")) == (2024, 4, 23), "❌"
+assert gregorian(hebrew_holiday(5784, "shavuot")) == (2024, 6, 12), "❌"
+
+assert gregorian(hebrew_holiday(5783, "passover")) == (2023, 4, 6), "❌"
+assert gregorian(hebrew_holiday(5780, "purim")) == (2020, 3, 10), "❌"
+assert gregorian(hebrew_holiday(5782, "tishah_beav")) == (2022, 8, 7), "❌ not postponed"
+
+try:
+    hebrew_holiday(5784, "christmas")
+    assert False, "❌ unknown holiday accepted"
+except KeyError:
+    pass
+
+
+# === Agreement with the Calendar ===
+
+postponed = 0
+for year in range(5600, 6000):
+    holidays = hebrew_holidays(year)
+    assert list(holidays.values()) == sorted(holidays.values()), f"❌ {year} out of order"
+
+    for name, fixed_date in holidays.items():
+        holiday = HEBREW_HOLIDAYS[name]
+        month = holiday.month
+        if Hebrew.months_in_year(year) == ADAR_II and holiday.leap_month:
+            month = holiday.leap_month
+        scheduled = Hebrew().from_date(year, month, holiday.day)
+
+        if fixed_date != scheduled.fixed:
+            postponed += 1
+            moves = dict(holiday.postponements)
+            assert fixed_date == scheduled.fixed + moves[scheduled.dow], f"❌ {year} {name}"
+        assert Hebrew().from_fixed(fixed_date).dow != SHABBAT or not name.startswith(
+            ("tzom", "taanit", "tishah")
+        ), f"❌ {year} {name} fast on Shabbat"
+assert postponed > 0, "❌"
+
+# The iterator yields the same dates, year by year
+expected = [(y, n, f) for y in range(5700, 5720) for n, f in hebrew_holidays(y).items()]
+assert list(iter_hebrew_holidays(5700, 5719)) == expected, "❌"
+assert list(iter_hebrew_holidays(5700, 5719, ["purim", "hanukkah"])) == [
+    (y, n, f) for y, n, f in expected if n in ("hanukkah", "purim")
+], "❌ not chronological"
+
+
+# === Sabbatical Years ===
+
+for first, last in ((5775, 5790), (-20, 0), (1, 6), (5782, 5782)):
+    assert list(hebrew_sabbatical_years(first, last)) == [
+        y for y in range(first, last + 1) if hebrew_sabbatical_year(y)
+    ], f"❌ {first} to {last}"
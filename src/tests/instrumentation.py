@@ -0,0 +1,95 @@
+from ..calculations import *
+from ..calculations import base, gregorian, hebrew, holidays
+from ..calculations.base import _implementation
+from ..calculations.cycles import *
+from ..calculations.instrumentation import *
+
+# === Disabled by default ===
+
+original = Hebrew._date_from_fixed
+assert not instrumentation_enabled(), "❌"
+assert Hebrew().from_fixed(738040) == Hebrew().from_date(5782, TISHRI, 1), "❌"
+assert instrumentation_snapshot() == {}, "❌ counted while disabled"
+
+
+# === Single batch ===
+
+HEBREW_CACHE.clear()
+with instrumented() as stats:
+    assert instrumentation_enabled(), "❌"
+    for fixed_date in range(738040, 738050):
+        Hebrew().from_fixed(fixed_date).year
+    Gregorian().from_date(2021, 9, 7)
+
+assert not instrumentation_enabled(), "❌ still enabled after the block"
+assert Hebrew._date_from_fixed is original, "❌ original not restored"
+
+assert stats["Hebrew.from_fixed"].calls == 10, f"❌ {stats}"
+assert stats["Hebrew._date_from_fixed"].calls == 10, f"❌ {stats}"
+assert stats["hebrew.hebrew_year_from_fixed"].calls == 10, f"❌ {stats}"
+assert stats["hebrew.hebrew_cal_elapsed_days"].calls >= 3, f"❌ {stats}"
+assert stats["Gregorian._verify"].calls == 1, f"❌ {stats}"
+assert stats["Date._set_date"].calls == 11, f"❌ {stats}"
+assert "Julian.from_fixed" not in stats, f"❌ {stats}"
+assert all(s.seconds >= 0 for s in stats.values()), f"❌ {stats}"
+assert (
+    stats["Hebrew._date_from_fixed"].seconds >= stats["hebrew.hebrew_year_from_fixed"].seconds
+), "❌"
+
+# Functions imported by name into other modules are counted there too, and unwrapped after
+with instrumented() as stats:
+    Gregorian().from_fixed(738040).dow
+assert stats["base.day_of_week_from_fixed"].calls == 1, f"❌ {stats}"
+with instrumented() as stats:
+    strftime(Gregorian().from_fixed(738040), "%A")
+assert stats["base.day_of_week_from_fixed"].calls == 1, f"❌ {stats}"
+with instrumented() as stats:
+    hebrew_holiday(5782, "purim")
+assert stats["hebrew.hebrew_new_year"].calls >= 1, f"❌ {stats}"
+assert gregorian.day_of_week_from_fixed is _implementation(base, "day_of_week_from_fixed"), "❌"
+assert holidays.hebrew_new_year is _implementation(hebrew, "hebrew_new_year"), "❌"
+
+
+# === Global switch, snapshot & reset ===
+
+enable_instrumentation()
+Julian().from_fixed(1)
+with instrumented() as inner:
+    Julian().from_fixed(2)
+assert instrumentation_enabled(), "❌ nested block disabled the global switch"
+assert inner["Julian.from_fixed"].calls == 1, f"❌ {inner}"
+
+snapshot = instrumentation_snapshot()
+assert snapshot["Julian.from_fixed"].calls == 2, f"❌ {snapshot}"
+assert snapshot["Hebrew.from_fixed"].calls == 10, f"❌ {snapshot}"
+
+reset_instrumentation()
+assert instrumentation_snapshot() == {}, "❌"
+disable_instrumentation()
+
+Julian().from_fixed(3)
+assert instrumentation_snapshot() == {}, "❌ counted after disabling"
+
+
+# === Together with the cycle engines ===
+
+arithmetic = _implementation(Gregorian, "_date_from_fixed")
+date_cycle(Gregorian)  # built beforehand, building it decomposes dates too
+
+# An engine chosen while instrumented is timed, and kept once instrumentation is disabled
+with instrumented() as stats:
+    use_cycle_engine(Gregorian)
+    assert Gregorian().from_fixed(738040).month == 9, "❌"
+assert stats["Gregorian._date_from_fixed"].calls == 1, f"❌ engine not timed {stats}"
+assert calendar_engine(Gregorian) == CYCLE_ENGINE, "❌"
+assert Gregorian._date_from_fixed is _implementation(Gregorian, "_date_from_fixed"), "❌"
+assert Gregorian._date_from_fixed is not arithmetic, "❌ engine reverted by disabling"
+
+# Switching back while instrumented keeps the timing, and ends on the arithmetic engine
+with instrumented() as stats:
+    Gregorian().from_fixed(738040).year
+    use_arithmetic_engine(Gregorian)
+    Gregorian().from_fixed(738041).year
+assert stats["Gregorian._date_from_fixed"].calls == 2, f"❌ wrapper dropped {stats}"
+assert Gregorian._date_from_fixed is arithmetic, "❌ not restored"
+assert Gregorian().from_fixed(738040) == Gregorian().from_date(2021, 9, 7), "❌"
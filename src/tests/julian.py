@@ -13,6 +13,13 @@ assert julian_leap_year(1980) is True, "❌"
 assert julian_leap_year(2000) is True, "❌"
 assert julian_leap_year(2004) is True, "❌"
 
+# Counts over ranges of years, on both sides of year 1
+for first, last in ((-1000, 1000), (1, 2), (1900, 2101), (-7, -1)):
+    expected = sum(julian_leap_year(y) for y in range(first, last) if y != 0)
+    counted = julian_leap_years_before(last) - julian_leap_years_before(first)
+    assert counted == expected, f"❌ {first} to {last}: {counted}"
+
+
 # === Check Valid Leap Years ===
 
 leapyear_dates = [(2000, 4, 1), (536, 3, 30), (2504, 9, 12), (4, 4, 4), (-397, 1, 1)]
@@ -35,6 +42,7 @@ invalid_dates = [
     (1999, 2, 29),
     (2020, 9, 31),
     (2015, 12, -1),
+    (2015, 12, 0),  # day 0 used to pass
     (2016, -3, 11),
     (2012, 0, 12),
     (2008, 0, 9),
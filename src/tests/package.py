@@ -0,0 +1,185 @@
+import os
+import subprocess
+import sys
+
+from .. import calculations
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def loaded_after(code: str) -> set:
+    """Calculation submodules imported by a fresh interpreter running `code`"""
+    report = "import sys; print(' '.join(m for m in sys.modules if m.startswith('src.calc')))"
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}; {report}"], cwd=root, capture_output=True, text=True
+    )
+    assert output.returncode == 0, f"❌ {output.stderr}"
+    return {module.rsplit(".", 1)[-1] for module in output.stdout.split()}
+
+
+# === Lazy Loading ===
+
+assert loaded_after("import src.calculations") == {"calculations"}, "❌"
+assert loaded_after("from src.calculations import Gregorian") == {
+    "calculations",
+    "base",
+    "constants",
+    "gregorian",
+    "third_party",
+}, "❌"
+assert "hebrew" in loaded_after("from src.calculations import hebrew_new_year"), "❌"
+assert "julian" in loaded_after("from src.calculations import *"), "❌"
+
+
+# === Public API ===
+
+for name in calculations.__all__:
+    assert getattr(calculations, name) is not None, f"❌ {name}"
+
+assert calculations.Epoch.Unix == 719163 and calculations.NISAN == 1, "❌"
+assert calculations.hebrew.Hebrew is calculations.Hebrew, "❌ submodules reachable"
+assert "Coptic" in dir(calculations), "❌"
+
+# No submodule is named like one of the exports, importing it would replace the name
+assert not set(calculations._SUBMODULES) & set(calculations.__all__), "❌"
+code = "import src.calculations.cli, src.calculations as c; assert callable(c.convert)"
+assert "conversion" in loaded_after(code), "❌"
+code = "import src.calculations.conversion as m; assert m.__name__.endswith('.conversion')"
+assert "conversion" in loaded_after(code), "❌"
+
+# Everything `from src.calculations import *` provided before the lazy loading still is, and
+# its submodules are attributes. The typing, abc, copy, dataclasses & math names which the
+# submodules imported for themselves are no longer re-exported.
+BASELINE_NAMES = {
+    "ADAR",
+    "ADAR_II",
+    "APRIL",
+    "ARB",
+    "ATHOR",
+    "AUGUST",
+    "AV",
+    "COPTIC_MONTH_LENGTHS",
+    "Coptic",
+    "DECEMBER",
+    "Date",
+    "DateFormatException",
+    "ELUL",
+    "EPAGOMENE",
+    "EPEP",
+    "ETHIOPIC_MONTH_LENGTHS",
+    "Epoch",
+    "Ethiopic",
+    "FEBRUARY",
+    "FRIDAY",
+    "GENBOT",
+    "Gregorian",
+    "HAMISHI",
+    "HAMLE",
+    "HAMUS",
+    "HEBREW_MONTH_LENGTHS",
+    "HEDAR",
+    "Hebrew",
+    "IHUD",
+    "IYYAR",
+    "JANUARY",
+    "JULIAN_MONTH_LENGTHS",
+    "JULY",
+    "JUNE",
+    "Julian",
+    "KIDAMME",
+    "KISLEV",
+    "KOIAK",
+    "MAGABIT",
+    "MAKSANYO",
+    "MARCH",
+    "MARHESHVAN",
+    "MASKARAM",
+    "MAY",
+    "MESHIR",
+    "MESORE",
+    "MIYAZYA",
+    "MONDAY",
+    "NAHASE",
+    "NISAN",
+    "NOVEMBER",
+    "OCTOBER",
+    "PAGUEMEN",
+    "PAONE",
+    "PAOPE",
+    "PAREMOTEP",
+    "PARMOUTE",
+    "PASHONS",
+    "PEFTOOU",
+    "PESNAU",
+    "PSABBATON",
+    "PSHOMENT",
+    "PSOOU",
+    "PTIOU",
+    "REVII",
+    "RISHON",
+    "ROB",
+    "SANE",
+    "SANYO",
+    "SATURDAY",
+    "SEPTEMBER",
+    "SHABBAT",
+    "SHELISHI",
+    "SHENI",
+    "SHEVAT",
+    "SHISHI",
+    "SIVAN",
+    "SUNDAY",
+    "TAKHSAS",
+    "TAMMUZ",
+    "TEQEMT",
+    "TER",
+    "TEVET",
+    "THOOT",
+    "THURSDAY",
+    "TISHRI",
+    "TKYRIAKE",
+    "TOBE",
+    "TUESDAY",
+    "WEDNESDAY",
+    "YAKATIT",
+    "coptic_leap_year",
+    "day_of_week_from_fixed",
+    "days_in_hebrew_year",
+    "ethiopic_leap_year",
+    "get_ordinal_indicator",
+    "gregorian_leap_year",
+    "hebrew_cal_elapsed_days",
+    "hebrew_leap_year",
+    "hebrew_new_year",
+    "hebrew_sabbatical_year",
+    "hebrew_year_length_correction",
+    "hr",
+    "julian_leap_year",
+    "last_day_of_hebrew_month",
+    "last_month_in_hebrew_year",
+    "molad",
+    "rd",
+}
+BASELINE_SUBMODULES = {
+    "base",
+    "constants",
+    "coptic",
+    "ethiopian",
+    "gregorian",
+    "hebrew",
+    "julian",
+    "third_party",
+}
+missing = BASELINE_NAMES - set(calculations.__all__)
+assert not missing, f"❌ {missing}"
+missing = (BASELINE_NAMES | BASELINE_SUBMODULES) - set(dir(calculations))
+assert not missing, f"❌ {missing}"
+star = {}
+exec("from src.calculations import *", star)
+assert BASELINE_NAMES <= set(star), f"❌ {BASELINE_NAMES - set(star)}"
+
+try:
+    calculations.not_a_name
+    assert False, "❌"
+except AttributeError:
+    pass
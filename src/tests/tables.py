@@ -0,0 +1,136 @@
+import os
+import tempfile
+
+import numpy as np
+
+from ..calculations import *
+from ..calculations import tables
+from ..calculations.tables import *
+
+start = fixed_from_gregorian(1899, 12, 1)
+end = fixed_from_gregorian(1901, 3, 1)  # across the Gregorian 1900 & Julian 1900 leap days
+
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "dates.tbl")
+    scalar_path = os.path.join(folder, "scalar.tbl")
+
+    write_date_table(path, start, end)
+
+    # The pure Python writer produces the same file as the NumPy one, whatever the chunks
+    with_numpy, chunk = tables._records_with_numpy, tables.RECORDS_PER_CHUNK
+    tables._records_with_numpy, tables.RECORDS_PER_CHUNK = lambda *args: None, 100
+    try:
+        write_date_table(scalar_path, start, end)
+    finally:
+        tables._records_with_numpy, tables.RECORDS_PER_CHUNK = with_numpy, chunk
+    with open(path, "rb") as a, open(scalar_path, "rb") as b:
+        assert a.read() == b.read(), "❌ writers disagree"
+
+    with DateTable(path) as table:
+        assert (table.start, table.end) == (start, end), "❌"
+        assert table.calendars == [Gregorian, Julian, Coptic, Ethiopic, Hebrew], "❌"
+        assert end - 1 in table and end not in table, "❌"
+
+        # === Fixed-date to YYYY-MM-DD ===
+        for calendar in table.calendars:
+            for fixed_date in range(start - 2, end + 2):
+                expected = calendar().from_fixed(fixed_date)
+                date = table.from_fixed(calendar, fixed_date)
+                assert type(date) is calendar and date == expected, f"❌ {date} != {expected}"
+                assert (date.year, date.month, date.day) == (
+                    expected.year,
+                    expected.month,
+                    expected.day,
+                ), f"❌ {date} != {expected}"
+
+        assert table.lookup(Hebrew, end) is None, "❌"
+        assert table.from_fixed(Gregorian, start + 0.5) == Gregorian().from_fixed(start), "❌"
+
+        # === YYYY-MM-DD to fixed-date ===
+        assert table.fixed_from_date(Gregorian, 1900, 3, 1) == 693655, "❌"
+        assert table.fixed_from_date(Julian, 1900, 2, 29) == 693667, "❌"
+        assert table.fixed_from_date(Gregorian, 2021, 9, 7) == 738040, "❌ outside table"
+        for fixed_date in range(start, end, 7):  # Tishri to Elul order of Hebrew months
+            date = Hebrew().from_fixed(fixed_date)
+            assert table.fixed_from_date(Hebrew, *date) == fixed_date, f"❌ {date}"
+
+        try:
+            table.fixed_from_date(Gregorian, 1900, 2, 29)
+            assert False, "❌ 1900 is not a Gregorian leap year"
+        except DateFormatException:
+            pass
+
+        # === NumPy view ===
+        records = table.array(Ethiopic)
+        expected = Ethiopic().from_fixed(start + 10)
+        assert tuple(records[10]) == (expected.year, expected.month, expected.day), "❌"
+        del records
+
+        # NumPy integers are read from the table too, as Python integers
+        date = table.from_fixed(Ethiopic, np.int64(start + 10))
+        assert date._year is not None and date == expected, "❌ not read from the table"
+        assert type(date.fixed) is int, "❌"
+
+    with open(path, "r+b") as f:
+        f.write(b"NOTATABL")
+    try:
+        DateTable(path)
+        assert False, "❌ bad magic accepted"
+    except DateTableException:
+        pass
+
+# Across the Hebrew epoch, the days before it have no Hebrew record
+start, end = Hebrew.epoch - 40, Hebrew.epoch + 40
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "epoch.tbl")
+    scalar_path = os.path.join(folder, "scalar.tbl")
+
+    write_date_table(path, start, end)
+    with_numpy, chunk = tables._records_with_numpy, tables.RECORDS_PER_CHUNK
+    tables._records_with_numpy, tables.RECORDS_PER_CHUNK = lambda *args: None, 30
+    try:
+        write_date_table(scalar_path, start, end)
+    finally:
+        tables._records_with_numpy, tables.RECORDS_PER_CHUNK = with_numpy, chunk
+    with open(path, "rb") as a, open(scalar_path, "rb") as b:
+        assert a.read() == b.read(), "❌ writers disagree"
+
+    with DateTable(path) as table:
+        for fixed_date in range(start, end):
+            for calendar in table.calendars:
+                if calendar is Hebrew and fixed_date < Hebrew.epoch:
+                    assert table.lookup(calendar, fixed_date) is None, f"❌ {fixed_date}"
+                    try:
+                        table.from_fixed(calendar, fixed_date)
+                        assert False, f"❌ {fixed_date} is before the Hebrew epoch"
+                    except DateFormatException:
+                        pass
+                else:
+                    expected = calendar().from_fixed(fixed_date)
+                    assert table.from_fixed(calendar, fixed_date) == expected, "❌"
+                    assert table.lookup(calendar, fixed_date) == tuple(expected), "❌"
+        assert table.fixed_from_date(Hebrew, 1, TISHRI, 1) == Hebrew.epoch, "❌"
+        records = table.array(Hebrew)
+        assert tuple(records[0]) == (0, 0, 0) and tuple(records[40]) == (1, TISHRI, 1), "❌"
+        del records
+
+    # A failed write leaves the previous table in place and no partial file
+    with open(path, "rb") as f:
+        previous = f.read()
+
+    def failing_records(calendar, start, end):
+        yield b"partial"
+        raise OSError("disk full")
+
+    records = tables._records
+    tables._records = failing_records
+    try:
+        write_date_table(path, start, end)
+        assert False, "❌"
+    except OSError:
+        pass
+    finally:
+        tables._records = records
+    with open(path, "rb") as f:
+        assert f.read() == previous, "❌ previous table damaged"
+    assert sorted(os.listdir(folder)) == ["epoch.tbl", "scalar.tbl"], "❌ partial file left"